@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+Benchmark the parsing of `globus transfer --batch` input.
+
+Compares the per-line cost of the batch input parser against the previous
+approach of running a click command for each line of input.
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import shlex
+import time
+import typing as t
+
+import click
+
+from globus_cli.parsing import TaskPath, mutex_option_group
+from globus_cli.services.transfer import add_batch_to_transfer_data
+
+
+class _FakeTransferData:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def add_item(self, *args: t.Any, **kwargs: t.Any) -> None:
+        self.count += 1
+
+
+def _make_batch(num_lines: int) -> str:
+    lines = []
+    for i in range(num_lines):
+        if i % 10 == 0:
+            lines.append(f"# comment {i}")
+        elif i % 10 == 1:
+            lines.append(f"'dir {i}/file {i}.txt' 'out {i}/file.txt'")
+        elif i % 10 == 2:
+            lines.append(f"dir{i} out{i} --recursive")
+        else:
+            lines.append(f"dir{i}/file{i}.txt out{i}/file.txt")
+    return "\n".join(lines) + "\n"
+
+
+def _click_per_line(batch: t.TextIO, transfer_data: _FakeTransferData) -> None:
+    # the previous implementation, which runs a click command for each line
+    @click.command()
+    @click.option("--external-checksum")
+    @click.option("--recursive", "-r", is_flag=True)
+    @click.argument("source_path", type=TaskPath(base_dir="/src/"))
+    @click.argument("dest_path", type=TaskPath(base_dir="/dst/"))
+    @mutex_option_group("--recursive", "--external-checksum")
+    def process_batch_line(dest_path, source_path, recursive, external_checksum):
+        transfer_data.add_item(
+            str(source_path),
+            str(dest_path),
+            external_checksum=external_checksum,
+            recursive=recursive,
+        )
+
+    for line in batch.readlines():
+        argv = shlex.split(line, comments=True)
+        if argv:
+            try:
+                process_batch_line.main(args=argv)
+            except SystemExit as e:
+                if e.code != 0:
+                    raise
+
+
+def _batch_parser(batch: t.TextIO, transfer_data: _FakeTransferData) -> None:
+    add_batch_to_transfer_data(
+        "/src/", "/dst/", None, t.cast(t.Any, transfer_data), batch
+    )
+
+
+def _time(
+    func: t.Callable[[t.TextIO, _FakeTransferData], None], batch: str, repeat: int
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        transfer_data = _FakeTransferData()
+        start = time.perf_counter()
+        func(io.StringIO(batch), transfer_data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    batch = _make_batch(args.lines)
+    baseline = _time(_click_per_line, batch, args.repeat)
+    current = _time(_batch_parser, batch, args.repeat)
+
+    for name, elapsed in (("click per line", baseline), ("batch parser", current)):
+        print(
+            f"{name:>15}: {elapsed:.3f}s total, "
+            f"{elapsed / args.lines * 1_000_000:.2f}us per line"
+        )
+    print(f"{'speedup':>15}: {baseline / current:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
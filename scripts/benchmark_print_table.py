@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+Benchmark table output.
+
+Prints a table of many rows, whose fields include a date conversion like those
+used by listing commands, and reports the time per row and the number of times
+each field function was called per cell.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import time
+import typing as t
+
+from globus_cli.commands._common import isoformat_to_local
+from globus_cli.termio import FormatField
+from globus_cli.termio.output_formatter import print_table
+
+
+class _CountingField:
+    def __init__(self, func: t.Callable[[dict[str, t.Any]], t.Any]) -> None:
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, item: dict[str, t.Any]) -> t.Any:
+        self.calls += 1
+        return self.func(item)
+
+
+def _make_rows(num_rows: int) -> list[dict[str, t.Any]]:
+    return [
+        {
+            "id": f"{i:08d}-0000-0000-0000-000000000000",
+            "label": f"row {i}" if i % 7 else None,
+            "request_time": f"2022-{i % 12 + 1:02d}-{i % 28 + 1:02d}T12:34:56+00:00",
+        }
+        for i in range(num_rows)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = _make_rows(args.rows)
+    keyfuncs = [
+        _CountingField(lambda x: x["id"]),
+        _CountingField(lambda x: x["label"]),
+        _CountingField(lambda x: isoformat_to_local(x["request_time"])),
+    ]
+    fields = [
+        FormatField(name, keyfunc)
+        for name, keyfunc in zip(("ID", "Label", "Request Time"), keyfuncs)
+    ]
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        out = io.StringIO()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(out):
+            print_table(rows, fields)
+        best = min(best, time.perf_counter() - start)
+
+    calls = sum(k.calls for k in keyfuncs)
+    cells = args.rows * len(fields) * args.repeat
+    print(f"{'rows':>15}: {args.rows}")
+    print(
+        f"{'print_table':>15}: {best:.3f}s total, "
+        f"{best / args.rows * 1_000_000:.2f}us per row"
+    )
+    print(f"{'calls per cell':>15}: {calls / cells:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+"""
+Benchmark the startup latency of the CLI.
+
+Runs latency-sensitive cold paths (importing the CLI, top-level and command helptext,
+and a tab completion) in fresh interpreters, many times each, and reports their
+wall clock times. Each path is also run once with `-X importtime`, to break its
+import time down by module: each globus_cli submodule (e.g. globus_cli.parsing)
+separately, and other packages by their top-level package.
+
+With --save, the results are stored as a baseline. With --check, the results are
+compared against a stored baseline, and the script fails if any path has
+regressed beyond --budget, or the import time of any module beyond
+--module-budget.
+
+A baseline is kept in scripts/startup_baseline.json. Timings depend on the
+machine, so when checking on a different machine, first save a baseline there
+from the commit being compared against.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import typing as t
+
+_RUN_CLI = "import sys; sys.argv[0] = 'globus'; from globus_cli import main; main()"
+
+# the paths to measure, as (arguments to python, extra environment variables)
+SCENARIOS: dict[str, tuple[list[str], dict[str, str]]] = {
+    "import": (["-c", "from globus_cli import main"], {}),
+    "help": (["-c", _RUN_CLI, "--help"], {}),
+    "ls-help": (["-c", _RUN_CLI, "ls", "--help"], {}),
+    "completion": (
+        ["-c", _RUN_CLI],
+        {
+            "_GLOBUS_COMPLETE": "bash_complete",
+            "COMP_WORDS": "globus endpoint s",
+            "COMP_CWORD": "2",
+        },
+    ),
+}
+
+# the default baseline, kept next to this script
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "startup_baseline.json"
+)
+
+# regressions smaller than this are never reported, since they are within the noise
+# of measuring a fresh process
+MIN_REGRESSION_MS = 10.0
+
+
+def _environ(extra: dict[str, str]) -> dict[str, str]:
+    env = dict(os.environ)
+    # always measure the CLI's own startup, never a warm `globus daemon`
+    env.pop("GLOBUS_CLI_DAEMON_SOCKET", None)
+    env.update(extra)
+    return env
+
+
+def time_runs(args: list[str], env: dict[str, str], runs: int) -> list[float]:
+    """
+    Run python with some arguments several times, and get the wall clock time of
+    each run, in milliseconds.
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def module_group(name: str) -> str:
+    """
+    Get the name under which a module's import time is counted: its globus_cli
+    submodule for globus_cli's own modules, or else its top-level package.
+    """
+    parts = name.split(".")
+    if parts[0] == "globus_cli":
+        return ".".join(parts[:2])
+    return parts[0]
+
+
+def parse_importtime(output: str) -> dict[str, float]:
+    """
+    Parse the output of `python -X importtime`, and get the time spent importing
+    each module group (excluding the modules it imports), in milliseconds.
+    """
+    modules: dict[str, float] = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _cumulative_us, name = line[len("import time:") :].split("|")
+        # skip the header line
+        if not self_us.strip().isdigit():
+            continue
+        group = module_group(name.strip())
+        modules[group] = modules.get(group, 0.0) + int(self_us) / 1000
+    return modules
+
+
+def import_times(args: list[str], env: dict[str, str]) -> dict[str, float]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=True,
+        text=True,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def measure(runs: int) -> dict[str, dict[str, t.Any]]:
+    results = {}
+    for name, (args, extra_env) in SCENARIOS.items():
+        env = _environ(extra_env)
+        # warm the filesystem cache and compile bytecode before timing
+        time_runs(args, env, 1)
+        times = time_runs(args, env, runs)
+        results[name] = {
+            "median_ms": statistics.median(times),
+            "min_ms": min(times),
+            "modules_ms": import_times(args, env),
+        }
+    return results
+
+
+def _exceeds(current: float, baseline: float, budget: float) -> bool:
+    return current > baseline * (1 + budget) and current - baseline > MIN_REGRESSION_MS
+
+
+def check(
+    results: dict[str, dict[str, t.Any]],
+    baseline: dict[str, dict[str, t.Any]],
+    budget: float,
+    module_budget: float,
+) -> list[str]:
+    """
+    Compare results against a baseline, and get a description of each regression.
+
+    :param budget: The allowed regression of each path, as a fraction of the
+        baseline
+    :param module_budget: The allowed regression of the import time of each module
+        group, as a fraction of the baseline
+    """
+    failures = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        # the fastest run is compared, since other load on the machine only ever
+        # makes a run slower
+        if _exceeds(result["min_ms"], base["min_ms"], budget):
+            failures.append(
+                f"{name}: {base['min_ms']:.1f}ms -> {result['min_ms']:.1f}ms"
+            )
+        for module, ms in sorted(result["modules_ms"].items()):
+            base_ms = base["modules_ms"].get(module, 0.0)
+            if _exceeds(ms, base_ms, module_budget):
+                failures.append(
+                    f"{name}: import {module}: {base_ms:.1f}ms -> {ms:.1f}ms"
+                )
+    return failures
+
+
+def print_results(
+    results: dict[str, dict[str, t.Any]],
+    baseline: dict[str, dict[str, t.Any]],
+    top: int,
+) -> None:
+    for name, result in results.items():
+        base = baseline.get(name)
+        compared = f" (baseline min {base['min_ms']:.1f}ms)" if base else ""
+        print(
+            f"{name:>12}: median {result['median_ms']:.1f}ms, "
+            f"min {result['min_ms']:.1f}ms{compared}"
+        )
+        modules = sorted(result["modules_ms"].items(), key=lambda x: x[1], reverse=True)
+        for module, ms in modules[:top]:
+            base_ms = base["modules_ms"].get(module) if base else None
+            compared = f" (baseline {base_ms:.1f}ms)" if base_ms is not None else ""
+            print(f"{'':>14}{module:<32} {ms:7.1f}ms{compared}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument(
+        "--baseline",
+        default=DEFAULT_BASELINE,
+        help="The file in which baseline results are stored",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="Store the results as the baseline"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if the results have regressed from the baseline",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=0.2,
+        help="The allowed regression of each path, as a fraction of the baseline",
+    )
+    parser.add_argument(
+        "--module-budget",
+        type=float,
+        default=0.3,
+        help=(
+            "The allowed regression of the import time of each module, as a "
+            "fraction of the baseline"
+        ),
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=8,
+        help="The number of modules to show in the breakdown of each path",
+    )
+    args = parser.parse_args()
+
+    baseline: dict[str, dict[str, t.Any]] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = measure(args.runs)
+    print_results(results, baseline, args.top)
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"saved baseline to {args.baseline}")
+
+    if args.check:
+        if not baseline:
+            sys.exit(f"no baseline found at {args.baseline}, run with --save first")
+        failures = check(results, baseline, args.budget, args.module_budget)
+        if failures:
+            print(
+                f"\nstartup regressed by more than {args.budget:.0%} "
+                f"(or {args.module_budget:.0%} for a module):"
+            )
+            for failure in failures:
+                print(f"  {failure}")
+            sys.exit(1)
+        print(
+            f"\nno regressions beyond {args.budget:.0%} "
+            f"(or {args.module_budget:.0%} for a module)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+"""
+Generate the command index, which lets the CLI list commands (in helptext, tab
+completion, and `globus list-commands`) without importing them.
+
+Run this after adding, removing, or changing the helptext of any command. This is
+required: the CLI only checks the index against the version of the CLI and the
+names of each group's subcommands, so a stale index would show outdated helptext.
+`tests/unit/test_command_index.py` fails until the index is regenerated.
+"""
+import json
+
+from globus_cli import main
+from globus_cli.parsing.command_index import INDEX_FILENAME, build_command_index
+
+
+def main_() -> None:
+    index = build_command_index(main)
+    with open(INDEX_FILENAME, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+        f.write("\n")
+    print(f"wrote {len(index['commands'])} commands to {INDEX_FILENAME}")
+
+
+if __name__ == "__main__":
+    main_()
@@ -40,6 +40,8 @@ setup(
     version=parse_version(),
     packages=find_packages("src"),
     package_dir={"": "src"},
+    # generated by scripts/generate_command_index.py
+    package_data={"globus_cli.parsing": ["command_index.json"]},
     python_requires=">=3.7",
     install_requires=[
         "globus-sdk==3.13.0",
@@ -4,9 +4,11 @@ from globus_cli.parsing import main_group
 @main_group(
     lazy_subcommands={
         "api": ("api", "api_command"),
+        "batch-run": ("batch_run", "batch_run_command"),
         "bookmark": ("bookmark", "bookmark_command"),
         "cli-profile-list": ("cli_profile_list", "cli_profile_list"),
         "collection": ("collection", "collection_command"),
+        "daemon": ("daemon", "daemon_command"),
         "delete": ("delete", "delete_command"),
         "endpoint": ("endpoint", "endpoint_command"),
         "flows": ("flows", "flows_command"),
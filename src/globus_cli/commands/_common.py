@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime
 import sys
+import time
 import typing as t
 
 import click
@@ -9,8 +10,58 @@ import click
 from globus_cli.termio import FORMAT_SILENT, formatted_print
 
 if t.TYPE_CHECKING:
+    import globus_sdk
+
     from ..services.transfer import CustomTransferClient
 
+# the number of task IDs to filter on in each task_list call made when waiting on
+# many tasks
+TASK_WAIT_FILTER_CHUNK_SIZE = 100
+
+# constants for the backoff of polls when waiting on tasks
+# polls start INITIAL_TASK_POLLING_INTERVAL seconds apart, and the interval is
+# multiplied by one of the factors after each poll, up to the polling interval
+INITIAL_TASK_POLLING_INTERVAL = 1
+STALLED_BACKOFF_FACTOR = 2.0
+PROGRESS_BACKOFF_FACTOR = 1.5
+
+
+class _TaskPollingBackoff:
+    """
+    The schedule of polls made while waiting on tasks.
+
+    Polls start INITIAL_TASK_POLLING_INTERVAL seconds apart, and back off
+    exponentially up to the polling interval requested by the user. Tasks which are
+    making progress (their bytes_transferred is increasing) may complete soon, so
+    the interval grows more slowly while progress is being made.
+    """
+
+    def __init__(self, polling_interval: int) -> None:
+        self._max_interval = polling_interval
+        self._interval = float(min(INITIAL_TASK_POLLING_INTERVAL, polling_interval))
+        self._last_bytes_transferred: int | None = None
+
+    def next_interval(self, bytes_transferred: int) -> float:
+        """
+        Given the current progress of the task(s), get the time to wait before the
+        next poll.
+        """
+        interval = self._interval
+        progressed = (
+            self._last_bytes_transferred is not None
+            and bytes_transferred > self._last_bytes_transferred
+        )
+        self._last_bytes_transferred = bytes_transferred
+        factor = PROGRESS_BACKOFF_FACTOR if progressed else STALLED_BACKOFF_FACTOR
+        self._interval = min(self._interval * factor, self._max_interval)
+        return interval
+
+
+def _task_is_complete(task: globus_sdk.GlobusHTTPResponse | dict[str, t.Any]) -> bool:
+    # this matches the behavior of `TransferClient.task_wait`: a task which is no
+    # longer ACTIVE (SUCCEEDED, FAILED, or INACTIVE) is done waiting
+    return bool(task["status"] != "ACTIVE")
+
 
 def transfer_task_wait_with_io(
     transfer_client: CustomTransferClient,
@@ -28,6 +79,9 @@ def transfer_task_wait_with_io(
     This does the core "task wait" loop, including all of the IO.
     It *does exit* on behalf of the caller. (We can enhance with a
     `noabort=True` param or somesuch in the future if necessary.)
+
+    Each poll is a single `get_task` call, and the task document from the last
+    poll is used for the final status and output.
     """
 
     def timed_out(waited_time):
@@ -36,39 +90,6 @@ def transfer_task_wait_with_io(
         else:
             return waited_time >= timeout
 
-    def check_completed():
-        completed = transfer_client.task_wait(
-            task_id, timeout=polling_interval, polling_interval=polling_interval
-        )
-        if completed:
-            if heartbeat:
-                click.echo("", err=True)
-            # meowing tasks wake up!
-            if meow:
-                click.echo(
-                    r"""
-                  _..
-  /}_{\           /.-'
- ( a a )-.___...-'/
- ==._.==         ;
-      \ i _..._ /,
-      {_;/   {_//""",
-                    err=True,
-                )
-
-            # TODO: possibly update TransferClient.task_wait so that we don't
-            # need to do an extra fetch to get the task status after completion
-            res = transfer_client.get_task(task_id)
-            formatted_print(res, text_format=FORMAT_SILENT)
-
-            status = res["status"]
-            if status == "SUCCEEDED":
-                click.get_current_context().exit(0)
-            else:
-                click.get_current_context().exit(1)
-
-        return completed
-
     # Tasks start out sleepy
     if meow:
         click.echo(
@@ -80,30 +101,182 @@ def transfer_task_wait_with_io(
             err=True,
         )
 
-    waited_time = 0
-    while not timed_out(waited_time) and not check_completed():
+    backoff = _TaskPollingBackoff(polling_interval)
+    waited_time = 0.0
+    while True:
+        res = transfer_client.get_task(task_id)
+        if _task_is_complete(res) or timed_out(waited_time):
+            break
+
         if heartbeat:
             click.echo(".", err=True, nl=False)
             sys.stderr.flush()
 
-        waited_time += polling_interval
+        interval = backoff.next_interval(res.get("bytes_transferred") or 0)
+        if timeout is not None:
+            # don't sleep past the timeout
+            interval = min(interval, timeout - waited_time)
+        time.sleep(interval)
+        waited_time += interval
 
-    # add a trailing newline to heartbeats if we fail
+    # add a trailing newline to heartbeats
     if heartbeat:
         click.echo("", err=True)
 
-    exit_code = 1
-    if timed_out(waited_time):
+    if _task_is_complete(res):
+        # meowing tasks wake up!
+        if meow:
+            click.echo(
+                r"""
+                  _..
+  /}_{\           /.-'
+ ( a a )-.___...-'/
+ ==._.==         ;
+      \ i _..._ /,
+      {_;/   {_//""",
+                err=True,
+            )
+        exit_code = 0 if res["status"] == "SUCCEEDED" else 1
+    else:
         click.echo(f"Task has yet to complete after {timeout} seconds", err=True)
         exit_code = timeout_exit_code
 
     # output json if requested, but nothing for text mode
-    res = transfer_client.get_task(task_id)
     formatted_print(res, text_format=FORMAT_SILENT)
 
     click.get_current_context().exit(exit_code)
 
 
+def _poll_task_docs(
+    transfer_client: CustomTransferClient, task_ids: list[str]
+) -> dict[str, dict[str, t.Any]]:
+    """
+    Get the current documents for many tasks, using paginated task_list calls
+    filtered by task ID.
+    """
+    docs: dict[str, dict[str, t.Any]] = {}
+    for start in range(0, len(task_ids), TASK_WAIT_FILTER_CHUNK_SIZE):
+        chunk = task_ids[start : start + TASK_WAIT_FILTER_CHUNK_SIZE]
+        for task in transfer_client.paginated.task_list(
+            query_params={"filter": "task_id:" + ",".join(chunk)}
+        ).items():
+            docs[task["task_id"]] = task
+    return docs
+
+
+def transfer_multi_task_wait_with_io(
+    transfer_client: CustomTransferClient,
+    heartbeat,
+    polling_interval,
+    timeout,
+    task_ids,
+    timeout_exit_code,
+) -> None:
+    """
+    Wait on many tasks at once. This is the "task wait" loop for more than one
+    task, using one task_list sweep per polling interval to check all of the tasks
+    which have yet to complete.
+
+    Each task is reported as soon as it completes: in text mode, on stderr, and in
+    NDJSON mode as a task document on stdout. JSON output is a list of all of the
+    task documents, printed after waiting.
+
+    It *does exit* on behalf of the caller, with status 0 if all tasks succeeded,
+    1 if any failed, and `timeout_exit_code` if any did not complete in time.
+    """
+    task_ids = list(dict.fromkeys(task_ids))  # de-duplicate, preserving order
+    pending = list(task_ids)
+    docs: dict[str, dict[str, t.Any]] = {}
+    # track whether heartbeat dots need to be ended with a newline
+    dots_printed = False
+
+    def timed_out(waited_time):
+        if timeout is None:
+            return False
+        else:
+            return waited_time >= timeout
+
+    def iter_completed_tasks():
+        nonlocal dots_printed
+
+        backoff = _TaskPollingBackoff(polling_interval)
+        waited_time = 0.0
+        while True:
+            docs.update(_poll_task_docs(transfer_client, pending))
+            missing = [x for x in pending if x not in docs]
+            if missing:
+                raise click.ClickException(
+                    "Could not find tasks with these IDs: " + ", ".join(missing)
+                )
+
+            for task_id in list(pending):
+                if _task_is_complete(docs[task_id]):
+                    pending.remove(task_id)
+                    if dots_printed:
+                        click.echo("", err=True)
+                        dots_printed = False
+                    yield docs[task_id]
+
+            if not pending or timed_out(waited_time):
+                return
+
+            if heartbeat:
+                click.echo(".", err=True, nl=False)
+                sys.stderr.flush()
+                dots_printed = True
+
+            # completed tasks count as progress, so they are included in the total
+            interval = backoff.next_interval(
+                sum(docs[x].get("bytes_transferred") or 0 for x in task_ids)
+            )
+            if timeout is not None:
+                # don't sleep past the timeout
+                interval = min(interval, timeout - waited_time)
+            time.sleep(interval)
+            waited_time += interval
+
+    def iter_all_tasks():
+        yield from iter_completed_tasks()
+        # tasks which did not complete are output last, with their last known state
+        yield from (docs[x] for x in pending)
+
+    def _custom_text(_res):
+        for completed, task in enumerate(iter_completed_tasks(), start=1):
+            click.echo(
+                f"Task {task['task_id']} {task['status']} "
+                f"({completed} of {len(task_ids)} tasks complete)",
+                err=True,
+            )
+
+    def json_converter(_res):
+        # consume all tasks before producing output, preserving input order
+        for _ in iter_all_tasks():
+            pass
+        return {"DATA": [docs[x] for x in task_ids]}
+
+    formatted_print(
+        None,
+        text_format=_custom_text,
+        json_converter=json_converter,
+        ndjson_items=lambda _res: iter_all_tasks(),
+    )
+
+    # add a trailing newline to heartbeats if we time out
+    if dots_printed:
+        click.echo("", err=True)
+
+    if any(docs[x]["status"] != "SUCCEEDED" for x in task_ids if x not in pending):
+        click.get_current_context().exit(1)
+    if pending:
+        click.echo(
+            f"{len(pending)} of {len(task_ids)} tasks have yet to complete after "
+            f"{timeout} seconds",
+            err=True,
+        )
+        click.get_current_context().exit(timeout_exit_code)
+    click.get_current_context().exit(0)
+
+
 def isoformat_to_local(
     utc_str: str | None, localtz: datetime.tzinfo | None = None
 ) -> str | None:
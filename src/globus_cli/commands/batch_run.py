@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import io
+import re
+import shlex
+import threading
+import typing as t
+
+import click
+
+from globus_cli.parsing import command
+
+# commands which cannot be run from a batch
+_DISALLOWED_COMMANDS = ("batch-run", "daemon")
+# options which configure logging (for the whole process), so that commands which use
+# them must run on their own
+_LOGGING_OPTIONS = re.compile(r"-v+|--verbose|--debug")
+
+
+class _ThreadLocalStream(io.TextIOBase):
+    """
+    A text stream which writes to a different stream in each thread (or to a
+    default stream, in threads which have not set one), so that commands running
+    concurrently each capture their own output.
+    """
+
+    def __init__(self, default: t.TextIO) -> None:
+        self._default = default
+        self._local = threading.local()
+
+    @property
+    def current(self) -> t.TextIO:
+        return getattr(self._local, "stream", self._default)
+
+    @current.setter
+    def current(self, stream: t.TextIO | None) -> None:
+        self._local.stream = stream or self._default
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return self.current.encoding
+
+    def write(self, s: str) -> int:
+        return self.current.write(s)
+
+    def read(self, size: int | None = -1) -> str:
+        return self.current.read(-1 if size is None else size)
+
+    def readline(self, size: int | None = -1) -> str:  # type: ignore[override]
+        return self.current.readline(-1 if size is None else size)
+
+    def flush(self) -> None:
+        self.current.flush()
+
+    def isatty(self) -> bool:
+        return self.current.isatty()
+
+    def writable(self) -> bool:
+        return True
+
+    def readable(self) -> bool:
+        return True
+
+
+def _parse_lines(
+    file: t.TextIO, options_with_values: t.Container[str]
+) -> t.Iterator[tuple[int, str, list[str] | None, str | None]]:
+    """
+    Parse a batch file into (line number, line, argv, error) tuples, skipping blank
+    lines and comments. Exactly one of argv and error is None.
+
+    :param file: The batch file
+    :param options_with_values: The options of 'globus' itself which take a value,
+        so that they can be skipped when finding the command on each line
+    """
+    from globus_cli.utils import command_name
+
+    for lineno, line in enumerate(file, start=1):
+        line = line.strip()
+        try:
+            argv = shlex.split(line, comments=True)
+        except ValueError as err:
+            yield lineno, line, None, f"could not parse line: {err}"
+            continue
+        if not argv:
+            continue
+        if argv[0] == "globus":
+            argv = argv[1:]
+        name = command_name(argv, options_with_values)
+        if name in _DISALLOWED_COMMANDS:
+            yield lineno, line, None, f"'globus {name}' cannot be run in a batch"
+        else:
+            yield lineno, line, argv, None
+
+
+def _changes_logging(argv: list[str] | None) -> bool:
+    if argv is None:
+        return False
+    options = argv[: argv.index("--")] if "--" in argv else argv
+    return any(_LOGGING_OPTIONS.fullmatch(arg) for arg in options)
+
+
+def _run_line(
+    main: click.Command,
+    streams: tuple[_ThreadLocalStream, _ThreadLocalStream, _ThreadLocalStream],
+    lineno: int,
+    line: str,
+    argv: list[str] | None,
+    error: str | None,
+) -> dict[str, t.Any]:
+    import traceback
+
+    from globus_cli.utils import system_exit_code
+
+    if argv is None:
+        return {
+            "line": lineno,
+            "command": line,
+            "exit_code": 2,
+            "stdout": "",
+            "stderr": f"{error}\n",
+        }
+
+    stdin, stdout, stderr = streams
+    captured_out, captured_err = io.StringIO(), io.StringIO()
+    # commands get no input, so that they can't consume the batch file or prompt
+    stdin.current = io.StringIO()
+    stdout.current, stderr.current = captured_out, captured_err
+    exit_code = 0
+    try:
+        main.main(args=argv, prog_name="globus")
+    except SystemExit as err:
+        exit_code = system_exit_code(err.code)
+    except Exception:
+        traceback.print_exc(file=captured_err)
+        exit_code = 1
+    finally:
+        stdin.current = stdout.current = stderr.current = None
+    return {
+        "line": lineno,
+        "command": line,
+        "exit_code": exit_code,
+        "stdout": captured_out.getvalue(),
+        "stderr": captured_err.getvalue(),
+    }
+
+
+@command(
+    "batch-run",
+    short_help="Run many globus commands in one process",
+    disable_options=["format", "map_http_status"],
+    adoc_output=(
+        "One JSON object is printed for each command, on its own line, as soon as "
+        "the command exits. Each object has the fields 'line' (the line number of "
+        "the command in the batch file), 'command', 'exit_code', 'stdout', and "
+        "'stderr'."
+    ),
+    adoc_exit_status="""0 if every command succeeded.
+
+1 if any command failed, or any line could not be run.
+""",
+    adoc_examples="""Make a directory and bookmark it:
+
+[source,bash]
+----
+$ cat commands.txt
+mkdir 'ddb59aef-6d04-11e5-ba46-22000b92c6ec:~/results/'
+bookmark create 'ddb59aef-6d04-11e5-ba46-22000b92c6ec:~/results/' results
+$ globus batch-run commands.txt
+----
+
+Show several tasks at once, reading the commands from stdin:
+
+[source,bash]
+----
+$ for id in $TASK_IDS; do echo "task show $id -F json"; done | \\
+    globus batch-run --jobs 4 -
+----
+""",
+)
+@click.argument("batch_file", type=click.File("r"))
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help=(
+        "The number of commands to run at once. Commands may run in any order "
+        "when this is more than 1, so they must not depend on each other. "
+        "Commands which use -v or --debug always run on their own"
+    ),
+)
+def batch_run_command(*, batch_file: t.TextIO, jobs: int) -> None:
+    """
+    Run the globus commands in a file, one per line, in a single process.
+
+    Each line is a command line, as it would be typed in a shell, with or without
+    the leading 'globus'. Blank lines and comments (starting with '#') are
+    skipped. Use '-' to read commands from stdin.
+
+    Commands run in this process, rather than each starting its own, so they share
+    the work of starting up, loading credentials, and connecting to Globus
+    services. Each command's output is captured, and its results are printed as
+    a line of JSON when it exits.
+    """
+    import json
+    import sys
+
+    from globus_cli.utils import options_with_values, preserve_logging
+
+    main = click.get_current_context().find_root().command
+    lines = _parse_lines(batch_file, options_with_values(main))
+
+    streams = (
+        _ThreadLocalStream(sys.stdin),
+        _ThreadLocalStream(sys.stdout),
+        _ThreadLocalStream(sys.stderr),
+    )
+    saved_streams = (sys.stdin, sys.stdout, sys.stderr)
+    failed = False
+    try:
+        sys.stdin, sys.stdout, sys.stderr = streams
+        with preserve_logging():
+            if jobs == 1:
+                results: t.Iterable[dict[str, t.Any]] = (
+                    _run_alone(main, streams, *x) for x in lines
+                )
+            else:
+                results = _run_concurrently(main, streams, lines, jobs)
+            for result in results:
+                failed = failed or result["exit_code"] != 0
+                click.echo(json.dumps(result))
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = saved_streams
+
+    if failed:
+        click.get_current_context().exit(1)
+
+
+def _run_alone(
+    main: click.Command,
+    streams: tuple[_ThreadLocalStream, _ThreadLocalStream, _ThreadLocalStream],
+    *line: t.Any,
+) -> dict[str, t.Any]:
+    """
+    Run a line while no other line is running, and then undo any changes it made
+    to the configuration of logging and warnings.
+    """
+    import warnings
+
+    from globus_cli.utils import preserve_logging
+
+    with preserve_logging(), warnings.catch_warnings():
+        return _run_line(main, streams, *line)
+
+
+def _run_concurrently(
+    main: click.Command,
+    streams: tuple[_ThreadLocalStream, _ThreadLocalStream, _ThreadLocalStream],
+    lines: t.Iterator[tuple[int, str, list[str] | None, str | None]],
+    jobs: int,
+) -> t.Iterator[dict[str, t.Any]]:
+    """
+    Run lines on a pool of workers, yielding their results as they complete.
+
+    At most `jobs` lines are read ahead of the results, so that a long batch file
+    (or one read from a pipe) is not read all at once.
+
+    Lines which configure logging would change it for every line running at the
+    same time, so they are run alone, after the lines before them have finished.
+    """
+    from concurrent.futures import (
+        FIRST_COMPLETED,
+        Future,
+        ThreadPoolExecutor,
+        as_completed,
+        wait,
+    )
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        pending: set[Future[dict[str, t.Any]]] = set()
+        for line in lines:
+            if _changes_logging(line[2]):
+                yield from (future.result() for future in as_completed(pending))
+                pending = set()
+                yield _run_alone(main, streams, *line)
+                continue
+            pending.add(executor.submit(_run_line, main, streams, *line))
+            if len(pending) >= jobs:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in as_completed(pending):
+            yield future.result()
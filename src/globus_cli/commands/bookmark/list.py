@@ -1,8 +1,9 @@
 import globus_sdk
 
+from globus_cli.endpointish import endpoint_cache
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command
-from globus_cli.termio import formatted_print
+from globus_cli.termio import formatted_print, outformat_is_text
 
 
 @command(
@@ -42,10 +43,17 @@ def bookmark_list(*, login_manager: LoginManager):
 
     bookmark_iterator = transfer_client.bookmark_list()
 
+    # only text output shows endpoint names, so only look up the endpoints then
+    # each endpoint is looked up once, even if it has several bookmarks
+    if outformat_is_text():
+        endpoint_cache().prefetch(
+            transfer_client, (x["endpoint_id"] for x in bookmark_iterator)
+        )
+
     def get_ep_name(item):
         ep_id = item["endpoint_id"]
         try:
-            ep_doc = transfer_client.get_endpoint(ep_id)
+            ep_doc = endpoint_cache().get(transfer_client, ep_id)
             return display_name_or_cname(ep_doc)
         except globus_sdk.TransferAPIError as err:
             if err.code == "EndpointDeleted":
@@ -103,4 +103,5 @@ def collection_list(
     if include_private_policies:
         params["include"] = "private_policies"
     res = gcs_client.get_collection_list(**params)
+    default_identity_id_resolver.page_callback(res)
     formatted_print(res, text_format=FORMAT_TEXT_TABLE, fields=STANDARD_FIELDS)
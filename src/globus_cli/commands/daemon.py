@@ -0,0 +1,59 @@
+import socket
+
+import click
+
+from globus_cli.daemon import DAEMON_SOCKET_ENV_VAR, default_socket_path
+from globus_cli.parsing import command
+
+
+@command(
+    "daemon",
+    short_help="Run a daemon which other globus commands can use",
+    disable_options=["format", "map_http_status"],
+    adoc_output=(
+        "The daemon runs until it is interrupted or terminated. It prints the "
+        "path of its socket when it starts, and the output of each command goes to "
+        "the command which forwarded it."
+    ),
+    adoc_examples=f"""Start a daemon in the background, and use it for later commands:
+
+[source,bash]
+----
+$ globus daemon --socket ~/.globus/cli/daemon.sock &
+$ export {DAEMON_SOCKET_ENV_VAR}=~/.globus/cli/daemon.sock
+$ globus ls 'ddb59aef-6d04-11e5-ba46-22000b92c6ec:/share/godata/'
+----
+""",
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help=(
+        f"The path of the Unix socket on which to listen. "
+        f"Defaults to the value of {DAEMON_SOCKET_ENV_VAR}, if it is set, or to "
+        "daemon.sock in the CLI's data directory"
+    ),
+)
+def daemon_command(*, socket_path):
+    """
+    Run a long-running process which runs globus commands on behalf of other
+    globus commands, so that they do not each pay the costs of starting up
+    (e.g. loading the CLI, reading credentials, and connecting to Globus services).
+
+    Commands use the daemon when the GLOBUS_CLI_DAEMON_SOCKET environment variable
+    is set to the path of its socket. They are run one at a time, with the
+    environment, working directory, input, and output of the command which
+    forwarded them, and with the same exit status. If no daemon is listening, or it
+    is for another version of the CLI, commands run normally.
+
+    Only the user who started the daemon can connect to it.
+    """
+    from globus_cli.daemon.server import serve
+
+    if not hasattr(socket, "AF_UNIX"):
+        raise click.UsageError("'globus daemon' is not supported on this platform")
+
+    socket_path = socket_path or default_socket_path()
+    click.echo(f"globus daemon listening on {socket_path}", err=True)
+    serve(socket_path, click.get_current_context().find_root().command)
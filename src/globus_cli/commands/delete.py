@@ -1,13 +1,13 @@
 import click
 import globus_sdk
 
-from globus_cli import utils
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import (
     ENDPOINT_PLUS_OPTPATH,
-    TaskPath,
+    BatchInputParser,
     command,
     delete_and_rm_options,
+    resolve_task_path,
     task_submission_options,
 )
 from globus_cli.termio import (
@@ -146,19 +146,12 @@ def delete_command(
     )
 
     if batch:
-        # although this sophisticated structure (like that in transfer)
-        # isn't strictly necessary, it gives us the ability to add options in
-        # the future to these lines with trivial modifications
-        @click.command()
-        @click.argument("path", type=TaskPath(base_dir=path))
-        def process_batch_line(path):
-            """
-            Parse a line of batch input and add it to the delete submission
-            item.
-            """
-            delete_data.add_item(str(path))
-
-        utils.shlex_process_stream(process_batch_line, batch)
+        # although this parser (like that in transfer) isn't strictly necessary,
+        # it gives us the ability to add options in the future to these lines with
+        # trivial modifications
+        parser = BatchInputParser(("path",))
+        for item in parser.iter_parsed(batch):
+            delete_data.add_item(resolve_task_path(item["path"], base_dir=path))
     else:
         if not star_silent and enable_globs and path.endswith("*"):
             # not intuitive, but `click.confirm(abort=True)` prints to stdout
@@ -1,7 +1,6 @@
-import globus_sdk
-
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command, endpoint_id_arg
+from globus_cli.services.auth import CachedIdentityMap
 from globus_cli.termio import formatted_print
 
 
@@ -24,7 +23,7 @@ def list_command(*, login_manager: LoginManager, endpoint_id):
 
     rules = transfer_client.endpoint_acl_list(endpoint_id)
 
-    resolved_ids = globus_sdk.IdentityMap(
+    resolved_ids = CachedIdentityMap(
         auth_client,
         (x["principal"] for x in rules if x["principal_type"] == "identity"),
     )
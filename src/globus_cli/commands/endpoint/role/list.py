@@ -1,7 +1,6 @@
-import globus_sdk
-
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command, endpoint_id_arg
+from globus_cli.services.auth import CachedIdentityMap
 from globus_cli.termio import formatted_print
 
 
@@ -38,7 +37,7 @@ def role_list(*, login_manager: LoginManager, endpoint_id):
     transfer_client = login_manager.get_transfer_client()
     roles = transfer_client.endpoint_role_list(endpoint_id)
 
-    resolved_ids = globus_sdk.IdentityMap(
+    resolved_ids = CachedIdentityMap(
         login_manager.get_auth_client(),
         (x["principal"] for x in roles if x["principal_type"] == "identity"),
     )
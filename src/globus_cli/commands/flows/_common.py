@@ -1,10 +1,12 @@
 from globus_cli.commands._common import isoformat_to_local
 from globus_cli.principal_resolver import PrincipalResolver
 
+flow_owner_resolver = PrincipalResolver("flow_owner")
+
 FLOW_SUMMARY_FORMAT_FIELDS = [
     ("Flow ID", "id"),
     ("Title", "title"),
-    ("Owner", PrincipalResolver("flow_owner").field),
+    ("Owner", flow_owner_resolver.field),
     ("Created At", lambda data: isoformat_to_local(data["created_at"])),
     ("Updated At", lambda data: isoformat_to_local(data["updated_at"])),
 ]
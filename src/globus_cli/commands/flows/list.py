@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import click
 
-from globus_cli.commands.flows._common import FLOW_SUMMARY_FORMAT_FIELDS
+from globus_cli.commands.flows._common import (
+    FLOW_SUMMARY_FORMAT_FIELDS,
+    flow_owner_resolver,
+)
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command
 from globus_cli.termio import formatted_print
@@ -47,9 +50,10 @@ def list_command(
             filter_role=filter_role,
             filter_fulltext=filter_fulltext,
             orderby="updated_at DESC",
-        ).items(),
+        ),
         json_conversion_key="flows",
         limit=limit,
+        page_callbacks=[flow_owner_resolver.page_callback],
     )
 
     formatted_print(
@@ -1,7 +1,11 @@
+from __future__ import annotations
+
+import typing as t
+
 import click
 
 from globus_cli.login_manager import LoginManager
-from globus_cli.parsing import IdentityType, command
+from globus_cli.parsing import IdentityType, ParsedIdentity, command
 from globus_cli.termio import FORMAT_TEXT_TABLE, formatted_print, is_verbose
 from globus_cli.utils import CLIStubResponse
 
@@ -30,14 +34,29 @@ Resolve multiple usernames and or IDs with tabular output
 $ globus get-identities --verbose go@globusid.org clitester1a@globusid.org \
 84942ca8-17c4-4080-9036-2f58e0093869
 ----
+
+Resolve a large list of usernames and or IDs, one per line, read from a file
+
+[source,bash]
+----
+$ globus get-identities --batch identities.txt
+----
 """,
 )
-@click.argument(
-    "values", type=IdentityType(allow_b32_usernames=True), required=True, nargs=-1
+@click.argument("values", type=IdentityType(allow_b32_usernames=True), nargs=-1)
+@click.option(
+    "--batch",
+    type=click.File("r"),
+    help=(
+        "Read usernames and or IDs from a file, one per line, in addition to any "
+        "given as arguments. Use the special `-` value to read from stdin."
+    ),
 )
 @click.option("--provision", hidden=True, is_flag=True)
 @LoginManager.requires_login(LoginManager.AUTH_RS)
-def get_identities_command(*, login_manager: LoginManager, values, provision):
+def get_identities_command(
+    *, login_manager: LoginManager, values, batch: t.TextIO | None, provision
+):
     """
     Lookup Globus Auth Identities given one or more uuids
     and/or usernames.
@@ -49,7 +68,19 @@ def get_identities_command(*, login_manager: LoginManager, values, provision):
 
     If more fields are desired, --verbose will give tabular output, but does not
     guarantee order and ignores inputs with no corresponding Globus Auth identity.
+
+    Any number of identities can be given with --batch. They are looked up in
+    several concurrent calls to Globus Auth.
     """
+    values = list(values)
+    if batch is not None:
+        values.extend(_read_batch(batch))
+    if not values:
+        raise click.UsageError(
+            "Missing argument 'IDENTITY...'. Provide at least one identity, "
+            "or use --batch."
+        )
+
     auth_client = login_manager.get_auth_client()
 
     # since API doesn't accept mixed ids and usernames,
@@ -57,17 +88,9 @@ def get_identities_command(*, login_manager: LoginManager, values, provision):
     ids = [v.value for v in values if v.idtype == "identity"]
     usernames = [v.value for v in values if v.idtype == "username"]
 
-    # make two calls to get_identities with ids and usernames
-    # then combine the calls into one response
-    results = []
-    if len(ids):
-        results += auth_client.get_identities(ids=ids, provision=provision)[
-            "identities"
-        ]
-    if len(usernames):
-        results += auth_client.get_identities(usernames=usernames, provision=provision)[
-            "identities"
-        ]
+    results = auth_client.get_identities_in_chunks(
+        ids=ids, usernames=usernames, provision=provision
+    )
     res = CLIStubResponse({"identities": results})
 
     def _custom_text_format(identities):
@@ -75,16 +98,15 @@ def get_identities_command(*, login_manager: LoginManager, values, provision):
         Non-verbose text output is customized
         """
 
+        # map each ID to its username and each username to its ID, to deal with
+        # variable inputs and uncertain response order
+        resolved = {}
+        for identity in identities:
+            resolved.setdefault(identity["id"], identity["username"])
+            resolved.setdefault(identity["username"], identity["id"])
+
         def resolve_identity(value):
-            """
-            helper to deal with variable inputs and uncertain response order
-            """
-            for identity in identities:
-                if identity["id"] == value:
-                    return identity["username"]
-                if identity["username"] == value:
-                    return identity["id"]
-            return "NO_SUCH_IDENTITY"
+            return resolved.get(value, "NO_SUCH_IDENTITY")
 
         # standard output is one resolved identity per line in the same order
         # as the inputs. A resolved identity is either a username if given a
@@ -107,3 +129,17 @@ def get_identities_command(*, login_manager: LoginManager, values, provision):
         # duplicates
         text_format=(FORMAT_TEXT_TABLE if is_verbose() else _custom_text_format),
     )
+
+
+def _read_batch(batch: t.TextIO) -> t.Iterator[ParsedIdentity]:
+    identity_type = IdentityType(allow_b32_usernames=True)
+    for lineno, line in enumerate(batch, start=1):
+        value = line.strip()
+        if not value or value.startswith("#"):
+            continue
+        try:
+            yield identity_type.convert(value, None, None)
+        except click.BadParameter as err:
+            raise click.UsageError(
+                f"Invalid batch input on line {lineno}: {err.message}"
+            ) from err
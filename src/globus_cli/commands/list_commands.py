@@ -3,6 +3,11 @@ import copy
 import click
 
 from globus_cli.parsing import command
+from globus_cli.parsing.command_index import (
+    build_command_index,
+    indexed_command,
+    load_command_index,
+)
 
 _command_length = 16
 
@@ -27,61 +32,71 @@ def list_commands():
     'globus endpoint update'.
     """
 
-    def _print_cmd(command):
+    def _print_cmd(name, short_help):
         # print commands with short_help
         indent = 4
         min_space = 2
 
-        short_help = command.get_short_help_str()
-
         # if the output would be pinched too close together, or if the command
         # name would overflow, use two separate lines
-        if len(command.name) > _command_length - min_space:
-            click.echo(" " * indent + command.name)
+        if len(name) > _command_length - min_space:
+            click.echo(" " * indent + name)
             click.echo(" " * (indent + _command_length) + short_help)
         # otherwise, it's all cool to cram into one line, just ljust command
         # names so that they form a nice column
         else:
-            click.echo(
-                " " * indent + f"{command.name.ljust(_command_length)}{short_help}"
-            )
+            click.echo(" " * indent + f"{name.ljust(_command_length)}{short_help}")
 
-    def _print_cmd_group(command, parent_names):
+    def _print_cmd_group(name, parent_names):
         parents = " ".join(parent_names)
         if parents:
             parents = parents + " "
-        click.echo(f"\n=== {parents}{command.name} ===\n")
+        click.echo(f"\n=== {parents}{name} ===\n")
 
-    def _recursive_list_commands(command, parent_names=None):
+    def _recursive_list_commands(path, name, parent_names=None):
         if parent_names is None:
             parent_names = []
 
         # names of parent commands, including this one, for passthrough to
         # recursive calls
-        new_parent_names = copy.copy(parent_names) + [command.name]
+        new_parent_names = copy.copy(parent_names) + [name]
 
+        entry = commands[path]
         # group-style commands are printed as headers
-        if isinstance(command, click.MultiCommand):
-            _print_cmd_group(command, parent_names)
-
-            # get the set of subcommands and recursively print all of them
-            group_cmds = [
-                v
-                for v in command.commands.values()
-                if isinstance(v, click.MultiCommand)
+        if "subcommands" in entry:
+            _print_cmd_group(name, parent_names)
+
+            # get the set of visible subcommands and recursively print all of them
+            subcommands = [
+                (f"{path} {x}".strip(), x)
+                for x in entry["subcommands"]
+                if not commands[f"{path} {x}".strip()]["hidden"]
             ]
-            func_cmds = [v for v in command.commands.values() if v not in group_cmds]
+            group_cmds = [x for x in subcommands if "subcommands" in commands[x[0]]]
+            func_cmds = [x for x in subcommands if x not in group_cmds]
             # we want to print them all, but func commands first
-            for cmd in func_cmds + group_cmds:
-                _recursive_list_commands(cmd, parent_names=new_parent_names)
+            for subpath, subname in func_cmds + group_cmds:
+                _recursive_list_commands(
+                    subpath, subname, parent_names=new_parent_names
+                )
 
         # individual commands are printed solo
         else:
-            _print_cmd(command)
+            _print_cmd(name, indexed_command(name, entry).get_short_help_str())
 
     # get the root context (the click context for the entire CLI tree)
     root_ctx = click.get_current_context().find_root()
-
-    _recursive_list_commands(root_ctx.command)
+    root = root_ctx.command
+
+    # the names and helptext of commands come from the command index, if it is up
+    # to date, so that listing them does not need to import every command
+    index = load_command_index()
+    if index is None or index["commands"][""].get("subcommands") != (
+        root.list_commands(root_ctx) if isinstance(root, click.MultiCommand) else None
+    ):
+        index = build_command_index(root)
+    commands = index["commands"]
+
+    _recursive_list_commands("", root.name)
     # get an extra newline at the end
     click.echo("")
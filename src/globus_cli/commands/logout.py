@@ -1,15 +1,19 @@
 import click
 import globus_sdk
 
+from globus_cli.endpointish import endpoint_cache, endpoint_type_cache
 from globus_cli.login_manager import (
     LoginManager,
     delete_templated_client,
+    identity_cache,
     internal_native_client,
+    invalidate_token_validation_cache,
     is_client_login,
     token_storage_adapter,
 )
 from globus_cli.login_manager.auth_flows import _STORE_CONFIG_USERINFO
 from globus_cli.parsing import command
+from globus_cli.parsing.path_completion import path_completion_cache
 
 
 def warnecho(msg):
@@ -143,6 +147,11 @@ def logout_command(*, login_manager: LoginManager, ignore_errors):
         adapter.remove_tokens_for_resource_server(rs)
 
     adapter.remove_config(_STORE_CONFIG_USERINFO)
+    invalidate_token_validation_cache()
+    identity_cache().clear()
+    endpoint_cache().clear()
+    endpoint_type_cache().clear()
+    path_completion_cache().clear()
 
     if is_client_login():
         click.echo(_CLIENT_LOGOUT_EPILOG)
@@ -115,12 +115,44 @@ $ globus ls $ep_id:/share/godata/ --filter '~*.txt'  # done with --filter, bette
         "this should behave like a non-recursive `ls`"
     ),
 )
+@click.option(
+    "--recursive-concurrency",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1, max=16),
+    metavar="INTEGER",
+    help=(
+        "The number of directories to list at once in `--recursive` listings. "
+        "Output order is the same regardless of this value"
+    ),
+)
+@click.option(
+    "--checkpoint-file",
+    type=click.Path(dir_okay=False, writable=True),
+    help=(
+        "For `--recursive` listings, periodically save the progress of the "
+        "listing to this file so that it can be continued with `--resume`"
+    ),
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help=(
+        "Continue a `--recursive` listing from the progress saved in "
+        "`--checkpoint-file`. Progress is saved periodically and when a listing "
+        "fails or is stopped, so entries output shortly before the previous run "
+        "stopped may be output again"
+    ),
+)
 @LoginManager.requires_login(LoginManager.TRANSFER_RS)
 def ls_command(
     *,
     login_manager: LoginManager,
     endpoint_plus_path,
     recursive_depth_limit,
+    recursive_concurrency,
+    checkpoint_file,
+    resume,
     recursive,
     long_output,
     show_hidden,
@@ -157,13 +189,20 @@ def ls_command(
     from globus_sdk.services.transfer.response import IterableTransferResponse
 
     from globus_cli.services.transfer import (
+        RecursiveLsCheckpoint,
         RecursiveLsResponse,
         autoactivate,
+        iter_response_data,
         iterable_response_to_dict,
     )
 
     endpoint_id, path = endpoint_plus_path
 
+    if checkpoint_file and not recursive:
+        raise click.UsageError("--checkpoint-file can only be used with --recursive")
+    if resume and not checkpoint_file:
+        raise click.UsageError("--resume requires --checkpoint-file")
+
     # do autoactivation before the `ls` call so that recursive invocations
     # won't do this repeatedly, and won't have to instantiate new clients
     transfer_client = login_manager.get_transfer_client()
@@ -184,6 +223,19 @@ def ls_command(
 
     # get the `ls` result
     if recursive:
+        # load or prepare the checkpoint first, so that a bad checkpoint file
+        # is reported before any listing is done
+        checkpoint = None
+        if checkpoint_file:
+            checkpoint = RecursiveLsCheckpoint(
+                checkpoint_file, endpoint_id, ls_params, recursive_depth_limit
+            )
+            if resume:
+                try:
+                    checkpoint.load()
+                except ValueError as err:
+                    raise click.UsageError(str(err))
+
         # NOTE:
         # --recursive and --filter have an interplay that some users may find
         # surprising
@@ -193,7 +245,11 @@ def ls_command(
         res: (
             IterableTransferResponse | RecursiveLsResponse
         ) = transfer_client.recursive_operation_ls(
-            endpoint_id, ls_params, depth=recursive_depth_limit
+            endpoint_id,
+            ls_params,
+            depth=recursive_depth_limit,
+            max_workers=recursive_concurrency,
+            checkpoint=checkpoint,
         )
     else:
         res = transfer_client.operation_ls(endpoint_id, **ls_params)
@@ -219,4 +275,5 @@ def ls_command(
             else "\n".join(cleaned_item_name(x) for x in res)
         ),
         json_converter=iterable_response_to_dict,
+        ndjson_items=iter_response_data,
     )
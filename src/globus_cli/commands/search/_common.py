@@ -5,6 +5,7 @@ import typing as t
 import click
 import globus_sdk
 
+from globus_cli.services.auth import CachedIdentityMap
 from globus_cli.types import FIELD_LIST_T
 
 
@@ -24,7 +25,7 @@ def resolved_principals_field(
     type_key: str = "principal_type",
     value_key: str = "principal",
 ) -> tuple[str, t.Callable[[dict], str]]:
-    resolved_ids = globus_sdk.IdentityMap(
+    resolved_ids = CachedIdentityMap(
         auth_client,
         (x[value_key].split(":")[-1] for x in items if x[type_key] == "identity")
         if items
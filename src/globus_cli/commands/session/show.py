@@ -1,7 +1,5 @@
 import time
 
-import globus_sdk
-
 from globus_cli.login_manager import (
     LoginManager,
     get_client_login,
@@ -10,6 +8,7 @@ from globus_cli.login_manager import (
     token_storage_adapter,
 )
 from globus_cli.parsing import command
+from globus_cli.services.auth import CachedIdentityMap
 from globus_cli.termio import formatted_print, print_command_hint
 
 
@@ -74,7 +73,7 @@ def session_show(*, login_manager):
         authentications = session_info.get("authentications") or {}
 
     # resolve ids to human readable usernames
-    resolved_ids = globus_sdk.IdentityMap(auth_client, list(authentications))
+    resolved_ids = CachedIdentityMap(auth_client, list(authentications))
 
     # put the nested dicts in a format table output can work with
     # while also converting vals into human readable formats
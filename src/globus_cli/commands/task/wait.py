@@ -1,8 +1,9 @@
+import click
+
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command, synchronous_task_wait_options
 
-from .._common import transfer_task_wait_with_io
-from ._common import task_id_arg
+from .._common import transfer_multi_task_wait_with_io, transfer_task_wait_with_io
 
 
 @command(
@@ -14,6 +15,10 @@ is written to standard error.
 
 When JSON output is requested, the standard error output remains, but the task
 status after waiting will be sent to stdout.
+
+When waiting on more than one task, each task is reported on standard error as it
+completes. JSON output is a list of the tasks under the key `DATA`, and NDJSON
+output prints each task as it completes (and then any which did not complete).
 """,
     adoc_examples="""
 Wait 30 seconds for a task to complete, printing heartbeats to stderr and
@@ -24,15 +29,22 @@ producing a JSON description of the task at the end:
 $ globus task wait --timeout 30 -H --format json TASK_ID
 ----
 
-Wait for a task without limit, silently, polling every 5 minutes:
+Wait for a task without limit, silently, polling at most every 5 minutes:
 
 [source,bash]
 ----
 $ globus task wait --polling-interval 300 TASK_ID
 ----
+
+Wait for several tasks, reading their IDs from a file:
+
+[source,bash]
+----
+$ globus task wait --timeout 3600 - < task_ids.txt
+----
 """,
 )
-@task_id_arg
+@click.argument("TASK_IDS", metavar="TASK_ID...", nargs=-1, required=True)
 @synchronous_task_wait_options
 @LoginManager.requires_login(LoginManager.TRANSFER_RS)
 def task_wait(
@@ -42,25 +54,53 @@ def task_wait(
     heartbeat,
     polling_interval,
     timeout,
-    task_id,
+    task_ids,
     timeout_exit_code
 ):
     """
     Wait for a task to complete.
 
-    This command waits until the timeout is reached, checking every 'M' seconds
-    (where 'M' is the polling interval).
+    This command waits until the timeout is reached, checking the task
+    periodically. Checks back off from once a second to once every
+    --polling-interval seconds.
 
     If the task succeeds by then, it exits with status 0. Otherwise, it exits with
     status 1.
+
+    Several task IDs may be given, and if a TASK_ID is '-', task IDs are read from
+    stdin, one per line. When waiting on several tasks, all of them are checked
+    each polling interval. The command exits with status 0 if all of the tasks
+    succeed and 1 if any fail.
     """
+    if "-" in task_ids:
+        stdin_ids = [
+            line.strip()
+            for line in click.get_text_stream("stdin")
+            if line.strip() and not line.startswith("#")
+        ]
+        task_ids = tuple(
+            x for arg in task_ids for x in (stdin_ids if arg == "-" else [arg])
+        )
+        if not task_ids:
+            raise click.UsageError("No task IDs were given on stdin")
+
     transfer_client = login_manager.get_transfer_client()
-    transfer_task_wait_with_io(
-        transfer_client,
-        meow,
-        heartbeat,
-        polling_interval,
-        timeout,
-        task_id,
-        timeout_exit_code,
-    )
+    if len(set(task_ids)) == 1:
+        transfer_task_wait_with_io(
+            transfer_client,
+            meow,
+            heartbeat,
+            polling_interval,
+            timeout,
+            task_ids[0],
+            timeout_exit_code,
+        )
+    else:
+        transfer_multi_task_wait_with_io(
+            transfer_client,
+            heartbeat,
+            polling_interval,
+            timeout,
+            task_ids,
+            timeout_exit_code,
+        )
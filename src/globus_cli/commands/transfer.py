@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import shlex
+import typing as t
+
 import click
 import globus_sdk
 
@@ -20,6 +23,122 @@ from globus_cli.parsing import (
 )
 from globus_cli.termio import FORMAT_TEXT_RECORD, formatted_print
 
+if t.TYPE_CHECKING:
+    from globus_cli.services.transfer import CustomTransferClient
+
+
+def _submit_batch_shards(
+    transfer_client: CustomTransferClient,
+    shards: t.Iterator[globus_sdk.TransferData],
+    *,
+    source_endpoint: str,
+    dest_endpoint: str,
+    exclude: bool,
+    dry_run: bool,
+    skip_activation_check: bool,
+) -> None:
+    """
+    Submit (or, with --dry-run, print) the shards of a batch transfer which has
+    been split with --max-items-per-task, and print a manifest of the tasks.
+    """
+    from globus_cli.services.transfer import (
+        autoactivate,
+        iter_response_data,
+        iterable_response_to_dict,
+    )
+
+    def _exclude_only_if_recursive(
+        shards: t.Iterator[globus_sdk.TransferData],
+    ) -> t.Iterator[globus_sdk.TransferData]:
+        # filter rules can only be sent with recursive transfers, so they are
+        # removed from shards without recursive items
+        # as with an unsplit batch, it is an error if no items are recursive, so
+        # shards are held back until a recursive item is found, and none are
+        # submitted if the batch has no recursive items
+        held: list[globus_sdk.TransferData] = []
+        found_recursive = False
+        for shard in shards:
+            if any(item["recursive"] for item in shard["DATA"]):
+                found_recursive = True
+            else:
+                del shard["filter_rules"]
+
+            if found_recursive:
+                yield from held
+                held.clear()
+                yield shard
+            else:
+                held.append(shard)
+
+        if not found_recursive:
+            raise click.UsageError(
+                "--exclude can only be used with --recursive transfers"
+            )
+
+    def _summarize_shards(
+        shards: t.Iterator[globus_sdk.TransferData],
+    ) -> t.Iterator[dict[str, t.Any]]:
+        # only a summary of each shard is kept for table output, which reads ahead
+        # to size its columns
+        for shard in shards:
+            yield {
+                "items": len(shard["DATA"]),
+                "first_source_path": shard["DATA"][0]["source_path"],
+                "last_source_path": shard["DATA"][-1]["source_path"],
+            }
+
+    if exclude:
+        shards = _exclude_only_if_recursive(shards)
+
+    if dry_run:
+        # the shards are not collected for printing: table output only keeps a
+        # summary of each shard, and NDJSON output prints each one as it is
+        # produced (JSON output is a single document, so it includes all of them)
+        formatted_print(
+            shards,
+            response_key=_summarize_shards,
+            json_converter=iterable_response_to_dict,
+            ndjson_items=iter_response_data,
+            fields=(
+                ("Items", "items"),
+                ("First Source Path", "first_source_path"),
+                ("Last Source Path", "last_source_path"),
+            ),
+        )
+        return
+
+    if not skip_activation_check:
+        autoactivate(transfer_client, source_endpoint, if_expires_in=60)
+        autoactivate(transfer_client, dest_endpoint, if_expires_in=60)
+
+    # print the tasks which were submitted even if a later submission fails, so
+    # that they can be tracked (or canceled)
+    manifest = []
+    error: Exception | None = None
+    try:
+        for shard, res in transfer_client.submit_transfer_shards(shards):
+            manifest.append(
+                {
+                    "task_id": res["task_id"],
+                    "submission_id": shard["submission_id"],
+                    "items": len(shard["DATA"]),
+                }
+            )
+    except Exception as err:
+        error = err
+
+    formatted_print(
+        {"DATA": manifest},
+        response_key="DATA",
+        fields=(
+            ("Task ID", "task_id"),
+            ("Submission ID", "submission_id"),
+            ("Items", "items"),
+        ),
+    )
+    if error is not None:
+        raise error
+
 
 @command(
     "transfer",
@@ -162,6 +281,31 @@ fi
         "multiple patterns."
     ),
 )
+@click.option(
+    "--max-items-per-task",
+    type=click.IntRange(min=1),
+    help=(
+        "Split --batch input into several tasks, each with at most this many "
+        "items. Tasks are submitted as the input is read, and a list of all of "
+        "the submitted tasks is printed."
+    ),
+)
+@click.option(
+    "--plan",
+    is_flag=True,
+    help=(
+        "Compare SOURCE_PATH and DEST_PATH, and only transfer the files which are "
+        "missing or have changed, as determined by --sync-level"
+    ),
+)
+@click.option(
+    "--plan-output",
+    type=click.File("w"),
+    help=(
+        "With --plan, write the files to transfer to this file in --batch format "
+        "rather than submitting them. Use `-` for stdout."
+    ),
+)
 @click.option("--perf-cc", type=int, hidden=True)
 @click.option("--perf-p", type=int, hidden=True)
 @click.option("--perf-pp", type=int, hidden=True)
@@ -195,6 +339,9 @@ def transfer_command(
     perf_p,
     perf_pp,
     perf_udt,
+    max_items_per_task,
+    plan,
+    plan_output,
 ):
     """
     Copy a file or directory from one endpoint to another as an asynchronous
@@ -237,6 +384,35 @@ def transfer_command(
     If you use `--batch` and a commandline SOURCE_PATH and/or DEST_PATH, these
     paths will be used as dir prefixes to any paths read from the batch source.
 
+    \b
+    === Splitting Batches into Multiple Tasks
+
+    Very large batches can be split into several tasks with
+    `--max-items-per-task`. The batch input is read as the tasks are submitted,
+    so it never needs to be held in memory all at once. Each task has its own
+    submission ID, and the task and submission IDs of all of the tasks are
+    printed once they have been submitted. If a line of the batch is invalid or
+    a submission fails, no further tasks are submitted, but the tasks which were
+    already submitted are still printed.
+
+    When used with `--exclude`, the exclude rules are only sent with tasks that
+    include recursive items, and at least one item in the batch must be
+    recursive.
+
+    \b
+    === Planning Incremental Transfers
+
+    With `--plan`, SOURCE_PATH and DEST_PATH are directories which are listed and
+    compared before submitting, and only the files which are missing from
+    DEST_PATH or have changed are transferred. A file has changed if its size
+    differs, or if the source copy is newer (as with `--sync-level mtime`).
+    `--sync-level exists` or `--sync-level size` limit the comparison.
+    `--exclude` patterns are applied while comparing.
+
+    This is much faster than a recursive transfer for very large trees where
+    only a few files have changed. Use `--dry-run` to see the planned files, or
+    `--plan-output` to write them as `--batch` input.
+
     \b
     === Sync Levels
 
@@ -262,7 +438,12 @@ def transfer_command(
 
     {AUTOMATIC_ACTIVATION}
     """
-    from globus_cli.services.transfer import add_batch_to_transfer_data, autoactivate
+    from globus_cli.services.transfer import (
+        SyncPlan,
+        add_batch_to_transfer_data,
+        autoactivate,
+        iter_batch_transfer_shards,
+    )
 
     source_endpoint, cmd_source_path = source
     dest_endpoint, cmd_dest_path = destination
@@ -282,6 +463,33 @@ def transfer_command(
             "which need it"
         )
 
+    if max_items_per_task is not None and not batch:
+        raise click.UsageError("--max-items-per-task can only be used with --batch")
+
+    if max_items_per_task is not None and submission_id:
+        raise click.UsageError(
+            "You cannot use --submission-id in addition to --max-items-per-task. "
+            "Each task is given its own submission ID"
+        )
+
+    if plan_output and not plan:
+        raise click.UsageError("--plan-output can only be used with --plan")
+
+    if plan:
+        for opt, value in (
+            ("--batch", batch),
+            ("--recursive", recursive),
+            ("--external-checksum", external_checksum),
+            ("--delete", delete),
+        ):
+            if value:
+                raise click.UsageError(f"You cannot use {opt} in addition to --plan")
+        if sync_level == "checksum":
+            raise click.UsageError(
+                "--plan cannot compare checksums. "
+                "Use --sync-level checksum without --plan"
+            )
+
     if (cmd_source_path is None or cmd_dest_path is None) and (not batch):
         raise click.UsageError(
             "transfer requires either SOURCE_PATH and DEST_PATH or --batch"
@@ -301,35 +509,93 @@ def transfer_command(
     def _make_exclude_rule(name_pattern):
         return {"DATA_TYPE": "filter_rule", "method": "exclude", "name": name_pattern}
 
-    if exclude:
+    # planned transfers apply --exclude while comparing, not with filter rules
+    if exclude and not plan:
         filter_rules: list[str] | None = [_make_exclude_rule(s) for s in exclude]
     else:
         filter_rules = None
 
     transfer_client = login_manager.get_transfer_client()
-    transfer_data = globus_sdk.TransferData(
-        transfer_client,
-        source_endpoint,
-        dest_endpoint,
-        label=label,
-        sync_level=sync_level,
-        verify_checksum=verify_checksum,
-        preserve_timestamp=preserve_timestamp,
-        encrypt_data=encrypt_data,
-        submission_id=submission_id,
-        deadline=deadline,
-        skip_source_errors=skip_source_errors,
-        fail_on_quota_errors=fail_on_quota_errors,
-        additional_fields={
-            "delete_destination_extra": delete,
-            "skip_activation_check": skip_activation_check,
-            "filter_rules": filter_rules,
-            **notify,
-            **perf_opts,
-        },
-    )
 
-    if batch:
+    def make_transfer_data(
+        client: globus_sdk.TransferClient | None,
+    ) -> globus_sdk.TransferData:
+        return globus_sdk.TransferData(
+            client,
+            source_endpoint,
+            dest_endpoint,
+            label=label,
+            sync_level=sync_level,
+            verify_checksum=verify_checksum,
+            preserve_timestamp=preserve_timestamp,
+            encrypt_data=encrypt_data,
+            submission_id=submission_id,
+            deadline=deadline,
+            skip_source_errors=skip_source_errors,
+            fail_on_quota_errors=fail_on_quota_errors,
+            additional_fields={
+                "delete_destination_extra": delete,
+                "skip_activation_check": skip_activation_check,
+                "filter_rules": filter_rules,
+                **notify,
+                **perf_opts,
+            },
+        )
+
+    if max_items_per_task is not None:
+        _submit_batch_shards(
+            transfer_client,
+            iter_batch_transfer_shards(
+                cmd_source_path,
+                cmd_dest_path,
+                checksum_algorithm,
+                # shards get their submission IDs when they are submitted
+                lambda: make_transfer_data(None),
+                batch,
+                max_items_per_task,
+            ),
+            source_endpoint=source_endpoint,
+            dest_endpoint=dest_endpoint,
+            exclude=bool(exclude),
+            dry_run=dry_run,
+            skip_activation_check=skip_activation_check,
+        )
+        return
+
+    transfer_data = make_transfer_data(transfer_client)
+
+    if plan:
+        # the listings for the plan require activation
+        if not skip_activation_check:
+            autoactivate(transfer_client, source_endpoint, if_expires_in=60)
+            autoactivate(transfer_client, dest_endpoint, if_expires_in=60)
+
+        sync_plan = SyncPlan(
+            transfer_client,
+            source_endpoint,
+            cmd_source_path,
+            dest_endpoint,
+            cmd_dest_path,
+            sync_level=sync_level or "mtime",
+            exclude=exclude,
+        )
+        for plan_source, plan_dest in sync_plan:
+            if plan_output:
+                plan_output.write(
+                    f"{shlex.quote(plan_source)} {shlex.quote(plan_dest)}\n"
+                )
+            else:
+                transfer_data.add_item(
+                    plan_source, plan_dest, checksum_algorithm=checksum_algorithm
+                )
+        click.echo(
+            f"Compared {sync_plan.compared} files, "
+            f"{sync_plan.changed} need to be transferred",
+            err=True,
+        )
+        if plan_output or (not sync_plan.changed and not dry_run):
+            return
+    elif batch:
         add_batch_to_transfer_data(
             cmd_source_path, cmd_dest_path, checksum_algorithm, transfer_data, batch
         )
@@ -349,7 +615,7 @@ def transfer_command(
     else:
         has_recursive_items = False
 
-    if exclude and not has_recursive_items:
+    if exclude and not plan and not has_recursive_items:
         raise click.UsageError("--exclude can only be used with --recursive transfers")
 
     if dry_run:
@@ -367,8 +633,8 @@ def transfer_command(
         return
 
     # autoactivate after parsing all args and putting things together
-    # skip this if skip-activation-check is given
-    if not skip_activation_check:
+    # skip this if skip-activation-check is given, or if it was done for --plan
+    if not skip_activation_check and not plan:
         autoactivate(transfer_client, source_endpoint, if_expires_in=60)
         autoactivate(transfer_client, dest_endpoint, if_expires_in=60)
 
@@ -0,0 +1,15 @@
+"""
+An opt-in daemon mode, in which `globus` forwards commands to a long-running
+`globus daemon` process over a Unix socket, rather than running them itself.
+
+This saves each command from paying for interpreter startup, imports, opening
+token storage, and new HTTPS connections. It is used when GLOBUS_CLI_DAEMON_SOCKET
+names the socket of a running daemon.
+
+Only the client half is imported here, since it is imported by every command. The
+daemon itself is in `globus_cli.daemon.server`.
+"""
+from .client import forward_to_daemon
+from .protocol import DAEMON_SOCKET_ENV_VAR, default_socket_path
+
+__all__ = ["forward_to_daemon", "DAEMON_SOCKET_ENV_VAR", "default_socket_path"]
@@ -0,0 +1,106 @@
+"""
+The `globus` side of the daemon: forward a command to a running daemon, if one has
+been configured, and report its exit code.
+
+This is imported by every `globus` invocation, so it must stay cheap to import.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import socket
+import sys
+import typing as t
+
+from .protocol import DAEMON_SOCKET_ENV_VAR, recv_message, send_message
+
+log = logging.getLogger(__name__)
+
+# commands which are never forwarded to the daemon
+_LOCAL_COMMANDS = ("daemon",)
+
+
+def _forwarded_env() -> dict[str, str]:
+    env = dict(os.environ)
+    # the daemon cannot see the client's terminal size, so pass it along the same
+    # way that a user could set it
+    if sys.stdout.isatty() and "COLUMNS" not in env:
+        size = shutil.get_terminal_size()
+        env["COLUMNS"] = str(size.columns)
+        env["LINES"] = str(size.lines)
+    return env
+
+
+def _stdio_fds() -> list[int] | None:
+    try:
+        return [stream.fileno() for stream in (sys.stdin, sys.stdout, sys.stderr)]
+    # a stream may be closed, or replaced with an object which has no fd
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def forward_to_daemon(
+    argv: list[str], options_with_values: t.Container[str] = ()
+) -> int | None:
+    """
+    Run a command in the daemon listening on the socket named by
+    GLOBUS_CLI_DAEMON_SOCKET, if it is set.
+
+    Returns the command's exit code, or None if the command was not run by a daemon
+    (e.g. because none is running, or it is for another version of the CLI), in
+    which case it should be run in this process instead.
+
+    :param argv: The command line, without the leading 'globus'
+    :param options_with_values: The options of 'globus' itself which take a value,
+        so that they can be skipped when finding the command which is being run
+    """
+    from globus_cli.version import __version__
+
+    socket_path = os.getenv(DAEMON_SOCKET_ENV_VAR)
+    if not socket_path or not hasattr(socket, "AF_UNIX"):
+        return None
+    from globus_cli.utils import command_name
+
+    if command_name(argv, options_with_values) in _LOCAL_COMMANDS:
+        return None
+    fds = _stdio_fds()
+    if fds is None:
+        return None
+
+    # anything buffered so far must be written before the daemon starts writing
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            sock.connect(socket_path)
+        except OSError as err:
+            log.debug("not using daemon at %s: %s", socket_path, err)
+            return None
+
+        try:
+            send_message(
+                sock,
+                {
+                    "version": __version__,
+                    "argv": argv,
+                    "env": _forwarded_env(),
+                    "cwd": os.getcwd(),
+                    "encoding": sys.stdout.encoding,
+                },
+                fds=fds,
+            )
+            response, _ = recv_message(sock)
+        # the command may have partly run, so it must not be run again here
+        except OSError as err:
+            sys.stderr.write(f"Lost connection to the Globus CLI daemon: {err}\n")
+            return 1
+    finally:
+        sock.close()
+
+    if response["status"] != "ok":
+        log.debug("daemon declined to run command: %s", response.get("reason"))
+        return None
+    return int(response["exit_code"])
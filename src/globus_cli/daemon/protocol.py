@@ -0,0 +1,84 @@
+"""
+The wire protocol spoken between `globus` and `globus daemon`, over a Unix socket.
+
+A request is a JSON document describing the command to run (its arguments,
+environment, and working directory). The client's stdin, stdout, and stderr file
+descriptors are sent along with it, so that the daemon reads and writes them
+directly, exactly as the command would if it ran in the client's own process.
+
+The response is a JSON document containing the command's exit code, or the reason
+that the daemon declined to run it.
+
+Each message is framed as a 4-byte big-endian length, followed by that many bytes
+of UTF-8 encoded JSON.
+"""
+from __future__ import annotations
+
+import array
+import json
+import os
+import socket
+import struct
+import typing as t
+
+# the environment variable which opts into using the daemon, by naming its socket
+DAEMON_SOCKET_ENV_VAR = "GLOBUS_CLI_DAEMON_SOCKET"
+
+_HEADER = struct.Struct(">I")
+_NUM_FDS = 3
+
+
+def default_socket_path() -> str:
+    """
+    Get the socket path for the daemon, if none was given.
+    """
+    from globus_cli.login_manager.diskcache import get_cache_filename
+
+    return os.getenv(DAEMON_SOCKET_ENV_VAR) or get_cache_filename("daemon.sock")
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size > 0:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("connection closed while reading a message")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def send_message(
+    sock: socket.socket,
+    message: dict[str, t.Any],
+    fds: t.Sequence[int] = (),
+) -> None:
+    """
+    Send a message, along with some file descriptors.
+    """
+    payload = json.dumps(message).encode("utf-8")
+    header = _HEADER.pack(len(payload))
+    if fds:
+        ancillary = [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))]
+        sock.sendmsg([header], ancillary)
+    else:
+        sock.sendall(header)
+    sock.sendall(payload)
+
+
+def recv_message(sock: socket.socket) -> tuple[dict[str, t.Any], list[int]]:
+    """
+    Receive a message, along with any file descriptors which were sent with it.
+    """
+    fds = array.array("i")
+    header, ancdata, _flags, _addr = sock.recvmsg(
+        _HEADER.size, socket.CMSG_SPACE(_NUM_FDS * fds.itemsize)
+    )
+    for level, kind, data in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(data[: len(data) - (len(data) % fds.itemsize)])
+    if len(header) < _HEADER.size:
+        header += _recv_exactly(sock, _HEADER.size - len(header))
+
+    (size,) = _HEADER.unpack(header)
+    return json.loads(_recv_exactly(sock, size).decode("utf-8")), list(fds)
@@ -0,0 +1,294 @@
+"""
+The `globus daemon` side of the daemon: a process which stays resident, listening
+on a Unix socket, and runs the commands which `globus` forwards to it.
+
+Commands are run one at a time, in the daemon's own process, so that everything
+which the CLI memoizes for the life of a process (imported modules, token storage,
+SDK clients, and pooled HTTP connections) is reused from one command to the next.
+
+Each command sees the environment, working directory, and standard streams of the
+`globus` process which sent it. Memoized state which depends on the environment
+(e.g. token storage, which is namespaced by GLOBUS_PROFILE) is kept separately for
+each environment and profile.
+"""
+from __future__ import annotations
+
+import codecs
+import contextlib
+import logging
+import os
+import signal
+import socket
+import sys
+import traceback
+import typing as t
+import warnings
+
+import click
+
+from globus_cli.endpointish import endpoint_cache, endpoint_type_cache
+from globus_cli.login_manager import (
+    identity_cache,
+    internal_auth_client,
+    token_storage_adapter,
+)
+from globus_cli.login_manager.connection_pool import shared_session
+from globus_cli.parsing.path_completion import path_completion_cache
+from globus_cli.termio import help_content_width
+from globus_cli.utils import preserve_logging, system_exit_code
+from globus_cli.version import __version__
+
+from .protocol import recv_message, send_message
+
+log = logging.getLogger(__name__)
+
+# the number of connections which may wait while a command runs
+DAEMON_LISTEN_BACKLOG = 64
+
+# memoized functions whose results depend on the environment (e.g. the token
+# storage namespace) and are kept separately for each environment
+_NAMESPACED_MEMOS: tuple[t.Callable[..., t.Any], ...] = (
+    token_storage_adapter,
+    internal_auth_client,
+    identity_cache,
+    endpoint_type_cache,
+    path_completion_cache,
+)
+# memoized functions whose results are only good for a single command (the helptext
+# width depends on the terminal of the command's client)
+_PER_COMMAND_MEMOS: tuple[t.Callable[..., t.Any], ...] = (
+    endpoint_cache,
+    help_content_width,
+)
+
+# the environment variables which select a token storage namespace, along with
+# HOME, which selects the storage file
+_NAMESPACE_ENV_VARS = (
+    "HOME",
+    "GLOBUS_SDK_ENVIRONMENT",
+    "GLOBUS_PROFILE",
+    "GLOBUS_CLI_CLIENT_ID",
+    "GLOBUS_CLI_CLIENT_SECRET",
+)
+
+
+# stub to allow type casting of a memoized function to an object with an attribute
+class _MemoizedFuncProto:
+    _instance: t.Any
+
+
+class _Shutdown(BaseException):
+    pass
+
+
+def _open_streams(fds: list[int], encoding: str) -> tuple[t.TextIO, t.TextIO, t.TextIO]:
+    # like the interpreter's own streams, stdout is line buffered only when it is a
+    # terminal, and stderr is always line buffered
+    stdin = open(fds[0], "r", encoding=encoding)
+    stdout = open(
+        fds[1], "w", buffering=1 if os.isatty(fds[1]) else -1, encoding=encoding
+    )
+    stderr = open(
+        fds[2], "w", buffering=1, encoding=encoding, errors="backslashreplace"
+    )
+    return stdin, stdout, stderr
+
+
+@contextlib.contextmanager
+def _replace_environ(env: dict[str, str]) -> t.Iterator[None]:
+    saved = dict(os.environ)
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+class DaemonServer:
+    """
+    Run forwarded commands, one at a time.
+
+    :param socket_path: The path of the Unix socket on which to listen
+    :param command: The command (normally the `globus` group) to run
+    """
+
+    def __init__(self, socket_path: str, command: click.Command) -> None:
+        self.socket_path = socket_path
+        self.command = command
+        # the memoized values for each namespace, keyed by the environment
+        # variables which select it
+        self._namespaces: dict[tuple[str | None, ...], dict[t.Any, t.Any]] = {}
+
+    def preload(self) -> None:
+        """
+        Load all commands, so that no command pays to import its module.
+        """
+
+        def _load(ctx: click.Context, command: click.Command) -> None:
+            if isinstance(command, click.MultiCommand):
+                for name in command.list_commands(ctx):
+                    subcommand = command.get_command(ctx, name)
+                    if subcommand is not None:
+                        _load(ctx, subcommand)
+
+        with click.Context(self.command) as ctx:
+            _load(ctx, self.command)
+
+    def _bind(self) -> socket.socket:
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+            except OSError:
+                # nothing is listening, so the socket was left behind by a daemon
+                # which did not exit cleanly
+                os.unlink(self.socket_path)
+            else:
+                raise click.ClickException(
+                    f"A daemon is already listening on {self.socket_path}"
+                )
+            finally:
+                probe.close()
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # only the current user may connect
+        old_umask = os.umask(0o177)
+        try:
+            sock.bind(self.socket_path)
+        finally:
+            os.umask(old_umask)
+        sock.listen(DAEMON_LISTEN_BACKLOG)
+        return sock
+
+    def serve_forever(self) -> None:
+        """
+        Listen on the socket, and run commands until interrupted or terminated.
+        """
+
+        def _on_sigterm(signum: int, frame: t.Any) -> None:
+            raise _Shutdown()
+
+        sock = self._bind()
+        previous_handler = signal.signal(signal.SIGTERM, _on_sigterm)
+        try:
+            while True:
+                conn, _ = sock.accept()
+                with conn:
+                    try:
+                        self.handle_connection(conn)
+                    except (OSError, ValueError) as err:
+                        log.warning("error handling daemon request: %s", err)
+        except (KeyboardInterrupt, _Shutdown):
+            pass
+        finally:
+            signal.signal(signal.SIGTERM, previous_handler)
+            sock.close()
+            os.unlink(self.socket_path)
+
+    def handle_connection(self, conn: socket.socket) -> None:
+        """
+        Read one request from a connection, run it, and reply with its exit code.
+        """
+        request, fds = recv_message(conn)
+        reason = self._check_request(request, fds)
+        if reason is not None:
+            for fd in fds:
+                os.close(fd)
+            send_message(conn, {"status": "declined", "reason": reason})
+            return
+        streams = _open_streams(fds, request["encoding"])
+
+        exit_code = self.run(request, streams)
+        send_message(conn, {"status": "ok", "exit_code": exit_code})
+
+    def _check_request(self, request: dict[str, t.Any], fds: list[int]) -> str | None:
+        if request.get("version") != __version__:
+            return f"daemon is version {__version__}, not {request.get('version')}"
+        if len(fds) != 3:
+            return f"expected 3 file descriptors, got {len(fds)}"
+        try:
+            codecs.lookup(request["encoding"])
+        except LookupError:
+            return f"unknown encoding {request['encoding']}"
+        if not os.path.isdir(request["cwd"]):
+            return f"working directory {request['cwd']} does not exist"
+        return None
+
+    @contextlib.contextmanager
+    def _namespace(self, env: dict[str, str]) -> t.Iterator[None]:
+        # swap in the memoized values for the request's namespace (and none for
+        # per-command values), then put back whatever was there before
+        key = tuple(env.get(x) for x in _NAMESPACE_ENV_VARS)
+        memos = self._namespaces.setdefault(key, {})
+        saved = {
+            func: t.cast(_MemoizedFuncProto, func)._instance
+            for func in _NAMESPACED_MEMOS + _PER_COMMAND_MEMOS
+            if hasattr(func, "_instance")
+        }
+
+        def _set_instances(values: dict[t.Any, t.Any]) -> None:
+            for func in _NAMESPACED_MEMOS + _PER_COMMAND_MEMOS:
+                as_proto = t.cast(_MemoizedFuncProto, func)
+                if func in values:
+                    as_proto._instance = values[func]
+                elif hasattr(as_proto, "_instance"):
+                    del as_proto._instance
+
+        _set_instances(memos)
+        # cookies are the only per-user state held by the shared session
+        shared_session().cookies.clear()
+        try:
+            yield
+        finally:
+            for func in _NAMESPACED_MEMOS:
+                if hasattr(func, "_instance"):
+                    memos[func] = t.cast(_MemoizedFuncProto, func)._instance
+            _set_instances(saved)
+
+    def run(
+        self,
+        request: dict[str, t.Any],
+        streams: tuple[t.TextIO, t.TextIO, t.TextIO],
+    ) -> int:
+        """
+        Run a command, as requested, with the given standard streams, and return
+        its exit code. The streams are closed afterwards.
+        """
+        saved_streams = (sys.stdin, sys.stdout, sys.stderr)
+        saved_argv = sys.argv
+        saved_cwd = os.getcwd()
+        try:
+            with contextlib.ExitStack() as stack:
+                stack.enter_context(_replace_environ(request["env"]))
+                stack.enter_context(self._namespace(request["env"]))
+                stack.enter_context(preserve_logging())
+                stack.enter_context(warnings.catch_warnings())
+                os.chdir(request["cwd"])
+                sys.stdin, sys.stdout, sys.stderr = streams
+                sys.argv = ["globus", *request["argv"]]
+                try:
+                    self.command.main(args=request["argv"], prog_name="globus")
+                except SystemExit as err:
+                    return system_exit_code(err.code)
+                except Exception:
+                    traceback.print_exc()
+                    return 1
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = saved_streams
+            sys.argv = saved_argv
+            os.chdir(saved_cwd)
+            for stream in streams:
+                # the client may have stopped reading its output (e.g. `| head`)
+                with contextlib.suppress(OSError, ValueError):
+                    stream.close()
+
+
+def serve(socket_path: str, command: click.Command) -> None:
+    """
+    Run a daemon on a socket until it is interrupted or terminated.
+    """
+    server = DaemonServer(socket_path, command)
+    server.preload()
+    server.serve_forever()
@@ -12,6 +12,7 @@ introspection and other niceties.
 Think of it as a TransferClient.get_endpoint call + a location to cache the result + any
 decoration we might want for this.
 """
+from .cache import EndpointCache, endpoint_cache
 from .endpoint_type import EndpointType
 from .endpointish import Endpointish
 from .errors import (
@@ -19,9 +20,15 @@ from .errors import (
     ExpectedEndpointError,
     WrongEndpointTypeError,
 )
+from .typecache import EndpointTypeCache, EndpointTypeInfo, endpoint_type_cache
 
 __all__ = [
     "Endpointish",
+    "EndpointCache",
+    "endpoint_cache",
+    "EndpointTypeCache",
+    "EndpointTypeInfo",
+    "endpoint_type_cache",
     "WrongEndpointTypeError",
     "ExpectedCollectionError",
     "ExpectedEndpointError",
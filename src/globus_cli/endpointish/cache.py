@@ -0,0 +1,161 @@
+"""
+A cache of endpoint documents, so that commands which look up the same endpoints
+many times (e.g. one lookup per row of a listing) only call Transfer once for each.
+
+Documents are always memoized for the life of the process. They can also be
+cached on disk between commands, by setting GLOBUS_CLI_ENDPOINT_CACHE_TTL to a
+number of seconds. This is off by default, because endpoint documents include
+details (such as activation) which can change at any time.
+"""
+from __future__ import annotations
+
+import logging
+import typing as t
+import uuid
+
+import globus_sdk
+
+if t.TYPE_CHECKING:
+    from globus_cli.login_manager.diskcache import DiskCache
+
+log = logging.getLogger(__name__)
+
+# the number of seconds for which endpoint documents are cached on disk, unless
+# GLOBUS_CLI_ENDPOINT_CACHE_TTL is set
+DEFAULT_ENDPOINT_CACHE_TTL = 0
+# the maximum number of endpoint documents kept on disk
+ENDPOINT_CACHE_MAX_SIZE = 10_000
+# the number of endpoints which may be fetched at once when prefetching
+ENDPOINT_PREFETCH_WORKERS = 8
+
+
+# stub to allow type casting of a function to an object with an attribute
+class _EndpointCacheFuncProto:
+    _instance: "EndpointCache"
+
+
+class EndpointCache:
+    """
+    A cache of endpoint documents, keyed by endpoint ID.
+
+    Errors from looking up an endpoint (e.g. because it was deleted) are memoized
+    too, and raised again for later lookups.
+
+    :param disk_cache: Where to cache documents between commands, if anywhere
+    :param ttl: The number of seconds for which documents are cached on disk
+    """
+
+    def __init__(self, disk_cache: DiskCache | None = None, ttl: int = 0) -> None:
+        self.disk_cache = disk_cache if ttl > 0 else None
+        self.ttl = ttl
+        self._memo: dict[str, dict[str, t.Any] | globus_sdk.TransferAPIError] = {}
+
+    def _from_memo(self, endpoint_id: str) -> dict[str, t.Any]:
+        value = self._memo[endpoint_id]
+        if isinstance(value, globus_sdk.TransferAPIError):
+            raise value
+        return value
+
+    def _fetch(
+        self, transfer_client: globus_sdk.TransferClient, endpoint_id: str
+    ) -> dict[str, t.Any] | globus_sdk.TransferAPIError:
+        log.debug("EndpointCache fetching %s", endpoint_id)
+        try:
+            return t.cast(
+                t.Dict[str, t.Any], transfer_client.get_endpoint(endpoint_id).data
+            )
+        except globus_sdk.TransferAPIError as err:
+            return err
+
+    def get(
+        self,
+        transfer_client: globus_sdk.TransferClient,
+        endpoint_id: str | uuid.UUID,
+    ) -> dict[str, t.Any]:
+        """
+        Get the document for an endpoint, looking it up if it is not cached.
+        """
+        endpoint_id = str(endpoint_id)
+        if endpoint_id not in self._memo:
+            self.prefetch(transfer_client, [endpoint_id])
+        return self._from_memo(endpoint_id)
+
+    def prefetch(
+        self,
+        transfer_client: globus_sdk.TransferClient,
+        endpoint_ids: t.Iterable[str | uuid.UUID],
+    ) -> None:
+        """
+        Make sure that the documents for several endpoints are cached. Each endpoint
+        which is not already cached is looked up once, concurrently.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        missing = [
+            x
+            for x in dict.fromkeys(str(x) for x in endpoint_ids)
+            if x not in self._memo
+        ]
+        if missing and self.disk_cache is not None:
+            for endpoint_id, doc in self.disk_cache.get_many(missing).items():
+                self._memo[endpoint_id] = doc
+            missing = [x for x in missing if x not in self._memo]
+        if not missing:
+            return
+
+        if len(missing) == 1:
+            results = [self._fetch(transfer_client, missing[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=ENDPOINT_PREFETCH_WORKERS) as executor:
+                results = list(
+                    executor.map(lambda x: self._fetch(transfer_client, x), missing)
+                )
+
+        found = []
+        for endpoint_id, result in zip(missing, results):
+            self._memo[endpoint_id] = result
+            if not isinstance(result, globus_sdk.TransferAPIError):
+                found.append((endpoint_id, result, self.ttl))
+        if self.disk_cache is not None:
+            self.disk_cache.set_many(found)
+
+    def invalidate(self, endpoint_id: str | uuid.UUID) -> None:
+        """
+        Remove an endpoint from the cache, e.g. after it has been updated.
+        """
+        endpoint_id = str(endpoint_id)
+        self._memo.pop(endpoint_id, None)
+        if self.disk_cache is not None:
+            self.disk_cache.delete_many([endpoint_id])
+
+    def clear(self) -> None:
+        self._memo.clear()
+        if self.disk_cache is not None:
+            self.disk_cache.clear()
+
+
+def endpoint_cache() -> EndpointCache:
+    """
+    Get the endpoint cache, creating it on first use.
+    """
+    as_proto = t.cast(_EndpointCacheFuncProto, endpoint_cache)
+    if not hasattr(as_proto, "_instance"):
+        from globus_cli.login_manager.diskcache import (
+            DiskCache,
+            get_cache_filename,
+            get_cache_ttl,
+        )
+        from globus_cli.login_manager.tokenstore import _resolve_namespace
+
+        ttl = get_cache_ttl("GLOBUS_CLI_ENDPOINT_CACHE_TTL", DEFAULT_ENDPOINT_CACHE_TTL)
+        disk_cache = None
+        if ttl > 0:
+            # endpoint documents depend on who is logged in, so they are kept
+            # separately for each profile
+            disk_cache = DiskCache(
+                get_cache_filename("endpoint_cache.db"),
+                namespace=_resolve_namespace(),
+                max_size=ENDPOINT_CACHE_MAX_SIZE,
+            )
+        as_proto._instance = EndpointCache(disk_cache, ttl=ttl)
+    return as_proto._instance
@@ -7,12 +7,14 @@ import uuid
 import click
 import globus_sdk
 
+from .cache import endpoint_cache
 from .endpoint_type import EndpointType
 from .errors import (
     ExpectedCollectionError,
     ExpectedEndpointError,
     WrongEndpointTypeError,
 )
+from .typecache import EndpointTypeInfo, endpoint_type_cache
 
 log = logging.getLogger(__name__)
 
@@ -26,16 +28,27 @@ class Endpointish:
     ):
         self._client = transfer_client
         self.endpoint_id = endpoint_id
+        self._data: dict[str, t.Any] | None = None
 
-        log.debug("Endpointish getting ep data")
-        res = self._client.get_endpoint(endpoint_id)
-        self.data = res.data
-        log.debug("Endpointish.data=%s", self.data)
-
+        # the type of an endpoint (along with its owner and GCS hostname) does not
+        # change, so it may be known without fetching the endpoint document
         log.debug("Endpointish determine ep type")
-        self.ep_type = EndpointType.determine_endpoint_type(self.data)
+        info = endpoint_type_cache().get(endpoint_id)
+        if info is None:
+            info = EndpointTypeInfo.from_document(self.data)
+            endpoint_type_cache().store(endpoint_id, info)
+        self._info = info
+        self.ep_type = info.ep_type
         log.debug("Endpointish.ep_type=%s", self.ep_type)
 
+    @property
+    def data(self) -> dict[str, t.Any]:
+        if self._data is None:
+            log.debug("Endpointish getting ep data")
+            self._data = endpoint_cache().get(self._client, self.endpoint_id)
+            log.debug("Endpointish.data=%s", self._data)
+        return self._data
+
     @property
     def nice_type_name(self) -> str:
         return EndpointType.nice_name(self.ep_type)
@@ -72,15 +85,17 @@ class Endpointish:
 
     def get_collection_endpoint_id(self) -> str:
         self.assert_is_gcsv5_collection()
-        return t.cast(str, self.data["owner_id"])
+        return t.cast(str, self._info.owner_id)
 
     def get_gcs_address(self) -> str:
         self.assert_ep_type(EndpointType.gcsv5_types())
+        if self._info.gcs_hostname is not None:
+            return self._info.gcs_hostname
         return t.cast(str, self.data["DATA"][0]["hostname"])
 
     @property
     def requires_data_access_scope(self) -> bool:
         if self.ep_type is EndpointType.MAPPED_COLLECTION:
-            if self.data.get("high_assurance") is False:
+            if self._info.high_assurance is False:
                 return True
         return False
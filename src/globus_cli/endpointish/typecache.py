@@ -0,0 +1,128 @@
+"""
+A persistent cache of the few facts about an endpoint which never (or almost never)
+change: its type, its owner (which, for a GCSv5 collection, is the ID of its
+endpoint), and the hostname of its GCS server.
+
+Commands which talk to GCS only need these to build their client, so caching them
+lets those commands skip looking up the endpoint in Transfer on later runs.
+"""
+from __future__ import annotations
+
+import typing as t
+import uuid
+
+from .endpoint_type import EndpointType
+
+if t.TYPE_CHECKING:
+    from globus_cli.login_manager.diskcache import DiskCache
+
+# the number of seconds for which endpoint types are cached, unless
+# GLOBUS_CLI_ENDPOINT_TYPE_CACHE_TTL is set
+# setting the TTL to 0 disables the cache
+DEFAULT_ENDPOINT_TYPE_CACHE_TTL = 86400
+# the maximum number of endpoints kept in the cache
+ENDPOINT_TYPE_CACHE_MAX_SIZE = 10_000
+
+
+# stub to allow type casting of a function to an object with an attribute
+class _EndpointTypeCacheFuncProto:
+    _instance: "EndpointTypeCache"
+
+
+class EndpointTypeInfo(t.NamedTuple):
+    """
+    The cached facts about an endpoint.
+    """
+
+    ep_type: EndpointType
+    owner_id: str | None
+    gcs_hostname: str | None
+    high_assurance: bool | None
+
+    @classmethod
+    def from_document(cls, ep_doc: dict[str, t.Any]) -> EndpointTypeInfo:
+        ep_type = EndpointType.determine_endpoint_type(ep_doc)
+        gcs_hostname = None
+        if ep_type in EndpointType.gcsv5_types() and ep_doc.get("DATA"):
+            gcs_hostname = ep_doc["DATA"][0].get("hostname")
+        return cls(
+            ep_type,
+            ep_doc.get("owner_id"),
+            gcs_hostname,
+            ep_doc.get("high_assurance"),
+        )
+
+
+class EndpointTypeCache:
+    """
+    A cache of ``EndpointTypeInfo``, keyed by endpoint ID.
+
+    :param disk_cache: Where to cache endpoint types between commands. If not given,
+        nothing is cached.
+    :param ttl: The number of seconds for which endpoint types are cached
+    """
+
+    def __init__(self, disk_cache: DiskCache | None = None, ttl: int = 0) -> None:
+        self.disk_cache = disk_cache if ttl > 0 else None
+        self.ttl = ttl
+
+    def get(self, endpoint_id: str | uuid.UUID) -> EndpointTypeInfo | None:
+        """
+        Get the cached facts about an endpoint, or None if it is not cached.
+        """
+        if self.disk_cache is None:
+            return None
+        value = self.disk_cache.get_many([str(endpoint_id)]).get(str(endpoint_id))
+        if value is None:
+            return None
+        return EndpointTypeInfo(
+            EndpointType[value["ep_type"]],
+            value["owner_id"],
+            value["gcs_hostname"],
+            value["high_assurance"],
+        )
+
+    def store(self, endpoint_id: str | uuid.UUID, info: EndpointTypeInfo) -> None:
+        """
+        Add the facts about an endpoint to the cache.
+        """
+        if self.disk_cache is None:
+            return
+        value = {**info._asdict(), "ep_type": info.ep_type.name}
+        self.disk_cache.set_many([(str(endpoint_id), value, self.ttl)])
+
+    def invalidate(self, endpoint_id: str | uuid.UUID) -> None:
+        """
+        Remove an endpoint from the cache, e.g. after it has been deleted.
+        """
+        if self.disk_cache is not None:
+            self.disk_cache.delete_many([str(endpoint_id)])
+
+    def clear(self) -> None:
+        if self.disk_cache is not None:
+            self.disk_cache.clear()
+
+
+def endpoint_type_cache() -> EndpointTypeCache:
+    """
+    Get the endpoint type cache, creating it on first use.
+    """
+    as_proto = t.cast(_EndpointTypeCacheFuncProto, endpoint_type_cache)
+    if not hasattr(as_proto, "_instance"):
+        from globus_cli.login_manager.diskcache import (
+            DiskCache,
+            get_cache_filename,
+            get_cache_ttl,
+        )
+
+        ttl = get_cache_ttl(
+            "GLOBUS_CLI_ENDPOINT_TYPE_CACHE_TTL", DEFAULT_ENDPOINT_TYPE_CACHE_TTL
+        )
+        disk_cache = None
+        if ttl > 0:
+            disk_cache = DiskCache(
+                get_cache_filename("endpoint_type_cache.db"),
+                max_size=ENDPOINT_TYPE_CACHE_MAX_SIZE,
+            )
+        as_proto._instance = EndpointTypeCache(disk_cache, ttl=ttl)
+    return as_proto._instance
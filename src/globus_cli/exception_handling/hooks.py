@@ -98,13 +98,14 @@ def consent_required_hook(exception: globus_sdk.GlobusAPIError) -> None:
 
 
 @error_handler(
+    error_class="GlobusAPIError",
     condition=lambda err: (
         (
             isinstance(err, globus_sdk.TransferAPIError)
             and err.code == "ClientError.AuthenticationFailed"
         )
         or (isinstance(err, globus_sdk.AuthAPIError) and err.code == "UNAUTHORIZED")
-    )
+    ),
 )
 def authentication_hook(
     exception: globus_sdk.TransferAPIError | globus_sdk.AuthAPIError,
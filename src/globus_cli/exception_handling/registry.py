@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import functools
+import sys
 import typing as t
 
 import click
@@ -51,8 +52,16 @@ def error_handler(
 
 
 def find_handler(exception: Exception) -> HOOK_TYPE | None:
+    # SDK error classes are named, rather than imported, so that they are only
+    # loaded when needed
+    # if the SDK's errors were never loaded, then the exception cannot be one of them
+    # (e.g. it is the click.exceptions.Exit from `--help`), and looking them up would
+    # import the whole SDK
+    sdk_errors_loaded = "globus_sdk.exc" in sys.modules
     for handler, error_class, condition in _REGISTERED_HOOKS:
         if isinstance(error_class, str):
+            if not sdk_errors_loaded:
+                continue
             error_class_: type[Exception] = getattr(globus_sdk, error_class)
             assert issubclass(error_class_, Exception)
         else:
@@ -1,10 +1,12 @@
 from .client_login import get_client_login, is_client_login
 from .errors import MissingLoginError
+from .identitycache import identity_cache
 from .manager import LoginManager
 from .tokenstore import (
     delete_templated_client,
     internal_auth_client,
     internal_native_client,
+    invalidate_token_validation_cache,
     token_storage_adapter,
 )
 from .utils import is_remote_session
@@ -16,7 +18,9 @@ __all__ = [
     "delete_templated_client",
     "internal_auth_client",
     "internal_native_client",
+    "invalidate_token_validation_cache",
     "token_storage_adapter",
     "is_client_login",
     "get_client_login",
+    "identity_cache",
 ]
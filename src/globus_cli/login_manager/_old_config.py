@@ -3,7 +3,7 @@ from configparser import ConfigParser
 
 import globus_sdk
 
-GLOBUS_ENV = os.environ.get("GLOBUS_SDK_ENVIRONMENT")
+from .tokenstore import get_globus_env
 
 
 def _get_old_conf_path():
@@ -17,6 +17,7 @@ def _old_conf_parser():
 
 
 def _token_conf_keys():
+    globus_env = get_globus_env()
     for k in [
         "auth_refresh_token",
         "auth_access_token",
@@ -24,7 +25,7 @@ def _token_conf_keys():
         "transfer_access_token",
     ]:
         # if the env is set, rewrite the option names to have it as a prefix
-        yield (f"{GLOBUS_ENV}_{k}" if GLOBUS_ENV else k)
+        yield (f"{globus_env}_{k}" if globus_env else k)
 
 
 def _old_tokens_to_revoke(conf):
@@ -36,8 +37,9 @@ def _old_tokens_to_revoke(conf):
 
 def _get_client_creds(conf):
     id_key, secret_key = ("client_id", "client_secret")
-    if GLOBUS_ENV:
-        id_key, secret_key = (f"{GLOBUS_ENV}_client_id", f"{GLOBUS_ENV}_client_secret")
+    globus_env = get_globus_env()
+    if globus_env:
+        id_key, secret_key = (f"{globus_env}_client_id", f"{globus_env}_client_secret")
     client_id = conf.get("cli", id_key, fallback=None)
     client_secret = conf.get("cli", secret_key, fallback=None)
     if client_id and client_secret:
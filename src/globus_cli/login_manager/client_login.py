@@ -7,6 +7,8 @@ import os
 
 import globus_sdk
 
+from .connection_pool import use_shared_session
+
 
 def _get_client_creds_from_env() -> tuple[str | None, str | None]:
     client_id = os.getenv("GLOBUS_CLI_CLIENT_ID")
@@ -42,7 +44,9 @@ def get_client_login() -> globus_sdk.ConfidentialAppAuthClient:
 
     client_id, client_secret = _get_client_creds_from_env()
 
-    return globus_sdk.ConfidentialAppAuthClient(
-        client_id=str(client_id),
-        client_secret=str(client_secret),
+    return use_shared_session(
+        globus_sdk.ConfidentialAppAuthClient(
+            client_id=str(client_id),
+            client_secret=str(client_secret),
+        )
     )
@@ -0,0 +1,60 @@
+"""
+A process-wide HTTP connection pool, shared by all of the SDK clients which the
+CLI builds.
+
+Each SDK client normally gets a transport with its own `requests.Session`, so a
+command which uses several clients opens (and TLS handshakes) a new connection
+for each one, even when they talk to the same host. Replacing the session on
+each client's transport with a single shared session lets connections be kept
+alive and reused across clients.
+"""
+from __future__ import annotations
+
+import typing as t
+
+if t.TYPE_CHECKING:
+    import globus_sdk
+    import requests
+
+    ClientT = t.TypeVar("ClientT", bound=globus_sdk.BaseClient)
+
+# the number of hosts for which connections are kept, and the number of kept-alive
+# connections for each host
+# the per-host size should be at least the number of threads which may make calls
+# to one host at once (e.g. `globus ls --recursive-concurrency`)
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 16
+
+
+# stub to allow type casting of a function to an object with an attribute
+class _SessionFuncProto:
+    _instance: "requests.Session"
+
+
+def shared_session() -> requests.Session:
+    """
+    Get the shared session, creating it on first use.
+    """
+    import requests
+
+    as_proto = t.cast(_SessionFuncProto, shared_session)
+    if not hasattr(as_proto, "_instance"):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        as_proto._instance = session
+    return as_proto._instance
+
+
+def use_shared_session(client: ClientT) -> ClientT:
+    """
+    Make a client send its requests using the shared session.
+
+    Only the connection pool is shared: headers, SSL verification, timeouts, and
+    retries are all still set per request by the client's transport.
+    """
+    client.transport.session = shared_session()
+    return client
@@ -0,0 +1,166 @@
+"""
+A small key-value cache of JSON documents, stored in SQLite in the CLI data dir
+next to the token storage.
+
+Each entry has its own expiry time, and entries are stored in a namespace (by
+default, the Globus environment), so that (e.g.) sandbox data never appears in
+production.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import typing as t
+
+from .tokenstore import _ensure_data_dir, get_globus_env
+
+if t.TYPE_CHECKING:
+    import sqlite3
+
+log = logging.getLogger(__name__)
+
+# the number of keys to look up in a single query, kept well under SQLite's limit
+# on the number of parameters in a statement
+_QUERY_BATCH_SIZE = 500
+
+
+def get_cache_ttl(env_var: str, default: int) -> int:
+    """
+    Get a cache TTL, in seconds, from an environment variable.
+
+    If the variable is not an integer, it is ignored and the default is used.
+    """
+    value = os.getenv(env_var)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        log.warning("ignoring invalid %s=%r, using %d", env_var, value, default)
+        return default
+
+
+def get_cache_filename(name: str) -> str:
+    """
+    Get the path of a cache file in the CLI data dir.
+    """
+    return os.path.join(_ensure_data_dir(), name)
+
+
+class DiskCache:
+    """
+    A cache of JSON documents, keyed by strings.
+
+    :param filename: The SQLite database file to use
+    :param namespace: The namespace to which cached data belongs. If not given, the
+        current Globus environment is used.
+    :param max_size: The maximum number of entries to keep, after which the entries
+        closest to expiring are evicted
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        *,
+        namespace: str | None = None,
+        max_size: int,
+    ) -> None:
+        self.filename = filename
+        self.namespace = namespace or get_globus_env() or "production"
+        self.max_size = max_size
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        import sqlite3
+
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.filename, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "namespace TEXT NOT NULL, "
+                "key TEXT NOT NULL, "
+                "value TEXT, "
+                "expires_at REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def get_many(self, keys: t.Iterable[str]) -> dict[str, t.Any]:
+        """
+        Look up keys in the cache. Keys which are not in the cache (or whose entries
+        have expired) are omitted from the result.
+        """
+        keys = list(keys)
+        now = time.time()
+        found: dict[str, t.Any] = {}
+        with self._lock:
+            for start in range(0, len(keys), _QUERY_BATCH_SIZE):
+                batch = keys[start : start + _QUERY_BATCH_SIZE]
+                rows = self.connection.execute(
+                    "SELECT key, value FROM cache "
+                    "WHERE namespace = ? AND expires_at > ? "
+                    f"AND key IN ({', '.join('?' * len(batch))})",
+                    (self.namespace, now, *batch),
+                )
+                for key, value in rows:
+                    found[key] = json.loads(value)
+        return found
+
+    def set_many(self, items: t.Iterable[tuple[str, t.Any, float]]) -> None:
+        """
+        Add ``(key, value, ttl)`` entries to the cache.
+        """
+        now = time.time()
+        rows = [
+            (self.namespace, key, json.dumps(value), now + ttl)
+            for key, value, ttl in items
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._evict(now)
+            self.connection.commit()
+
+    def _evict(self, now: float) -> None:
+        (size,) = self.connection.execute("SELECT COUNT(*) FROM cache").fetchone()
+        if size <= self.max_size:
+            return
+        self.connection.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+        (size,) = self.connection.execute("SELECT COUNT(*) FROM cache").fetchone()
+        if size > self.max_size:
+            self.connection.execute(
+                "DELETE FROM cache WHERE rowid IN ("
+                "SELECT rowid FROM cache ORDER BY expires_at LIMIT ?)",
+                (size - self.max_size,),
+            )
+
+    def delete_many(self, keys: t.Iterable[str]) -> None:
+        """
+        Remove keys from the cache.
+        """
+        with self._lock:
+            self.connection.executemany(
+                "DELETE FROM cache WHERE namespace = ? AND key = ?",
+                ((self.namespace, key) for key in keys),
+            )
+            self.connection.commit()
+
+    def clear(self) -> None:
+        """
+        Remove all entries, in all namespaces.
+        """
+        with self._lock:
+            self.connection.execute("DELETE FROM cache")
+            self.connection.commit()
@@ -0,0 +1,112 @@
+"""
+A persistent cache of Globus Auth identities, stored in the CLI data dir next to
+the token storage.
+
+Commands which show identities (ACLs, roles, etc.) tend to show the same
+identities every time they are run. Caching identity records on disk lets those
+commands skip most of their calls to Globus Auth.
+
+Lookups which found no identity are cached as well, for a shorter time, so that
+unknown principals are not looked up again on every run.
+
+What Globus Auth shows of an identity depends on who is asking, so identities are
+cached separately for each profile (and client login), like tokens.
+"""
+from __future__ import annotations
+
+import typing as t
+
+from .diskcache import DiskCache, get_cache_filename, get_cache_ttl
+from .tokenstore import _resolve_namespace
+
+# the number of seconds for which a cached identity is used, unless
+# GLOBUS_CLI_IDENTITY_CACHE_TTL is set
+# setting the TTL to 0 disables the cache
+DEFAULT_IDENTITY_CACHE_TTL = 86400
+# the maximum number of seconds for which a lookup which found no identity is cached
+IDENTITY_CACHE_NEGATIVE_TTL = 600
+# the maximum number of entries (identity IDs, usernames, and missing lookups) kept
+# in the cache, after which the entries closest to expiring are evicted
+IDENTITY_CACHE_MAX_SIZE = 100_000
+
+
+# stub to allow type casting of a function to an object with an attribute
+class _IdentityCacheFuncProto:
+    _instance: "IdentityCache"
+
+
+class IdentityCache(DiskCache):
+    """
+    A cache of identity records, keyed by both identity ID and username.
+
+    :param filename: The SQLite database file to use
+    :param namespace: The namespace to which cached identities belong. If not
+        given, the namespace of the current profile's tokens is used.
+    :param ttl: The number of seconds for which an identity is cached. If this is
+        0 or less, nothing is cached.
+    :param max_size: The maximum number of entries to keep
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        *,
+        namespace: str | None = None,
+        ttl: int = DEFAULT_IDENTITY_CACHE_TTL,
+        max_size: int = IDENTITY_CACHE_MAX_SIZE,
+    ) -> None:
+        super().__init__(
+            filename, namespace=namespace or _resolve_namespace(), max_size=max_size
+        )
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get_many(self, keys: t.Iterable[str]) -> dict[str, dict[str, t.Any] | None]:
+        """
+        Look up identity IDs and usernames in the cache.
+
+        The result maps each key which was found in the cache to its identity record,
+        or to None if the key is cached as having no identity. Keys which are not in
+        the cache (or whose entries have expired) are omitted.
+        """
+        if not self.enabled:
+            return {}
+        return super().get_many(keys)
+
+    def store(
+        self,
+        identities: t.Iterable[dict[str, t.Any]],
+        missing: t.Iterable[str] = (),
+    ) -> None:
+        """
+        Add identity records to the cache, along with any keys (identity IDs or
+        usernames) for which no identity was found.
+        """
+        if not self.enabled:
+            return
+
+        missing_ttl = min(self.ttl, IDENTITY_CACHE_NEGATIVE_TTL)
+        items: list[tuple[str, t.Any, float]] = []
+        for identity in identities:
+            items.append((identity["id"], identity, self.ttl))
+            items.append((identity["username"], identity, self.ttl))
+        items.extend((key, None, missing_ttl) for key in missing)
+        self.set_many(items)
+
+
+def identity_cache() -> IdentityCache:
+    """
+    Get the identity cache, creating it on first use.
+    """
+    as_proto = t.cast(_IdentityCacheFuncProto, identity_cache)
+    if not hasattr(as_proto, "_instance"):
+        as_proto._instance = IdentityCache(
+            get_cache_filename("identity_cache.db"),
+            ttl=get_cache_ttl(
+                "GLOBUS_CLI_IDENTITY_CACHE_TTL", DEFAULT_IDENTITY_CACHE_TTL
+            ),
+        )
+    return as_proto._instance
@@ -21,8 +21,15 @@ from globus_cli.endpointish import Endpointish, EndpointType
 from .. import version
 from .auth_flows import do_link_auth_flow, do_local_server_auth_flow
 from .client_login import get_client_login, is_client_login
+from .connection_pool import use_shared_session
 from .errors import MissingLoginError
-from .tokenstore import internal_auth_client, token_storage_adapter
+from .tokenstore import (
+    cache_token_validation,
+    internal_auth_client,
+    invalidate_token_validation_cache,
+    token_storage_adapter,
+    token_validation_is_cached,
+)
 from .utils import is_remote_session
 
 if t.TYPE_CHECKING:
@@ -30,6 +37,9 @@ if t.TYPE_CHECKING:
     from ..services.gcs import CustomGCSClient
     from ..services.transfer import CustomTransferClient
 
+# the maximum number of tokens to validate at once, when checking several logins
+MAX_LOGIN_VALIDATION_WORKERS = 8
+
 
 class LoginManager:
     # TEST_MODE skips token validation
@@ -96,16 +106,18 @@ class LoginManager:
         yield from self.STATIC_SCOPES[self.AUTH_RS]
 
     def is_logged_in(self) -> bool:
-        res = []
-        for rs_name, _scopes in self.login_requirements:
-            res.append(self.has_login(rs_name))
-        return all(res)
+        return not self._missing_logins(
+            rs_name for rs_name, _scopes in self.login_requirements
+        )
 
-    def _validate_token(self, token: str) -> bool:
+    def _validate_token(
+        self, token: str, auth_client: globus_sdk.AuthClient | None = None
+    ) -> bool:
         if self._TEST_MODE:
             return True
 
-        auth_client = internal_auth_client()
+        if auth_client is None:
+            auth_client = internal_auth_client()
         try:
             res = auth_client.oauth2_validate_token(token)
         # if the instance client is invalid, an AuthAPIError will be raised
@@ -113,6 +125,12 @@ class LoginManager:
             return False
         return bool(res["active"])
 
+    def _get_refresh_token(self, resource_server: str) -> str | None:
+        tokens = self._token_storage.get_token_data(resource_server)
+        if tokens is None or "refresh_token" not in tokens:
+            return None
+        return t.cast(str, tokens["refresh_token"])
+
     def has_login(self, resource_server: str) -> bool:
         """
         Determines if the user has a valid refresh token for the given
@@ -122,11 +140,66 @@ class LoginManager:
         if is_client_login():
             return True
 
-        tokens = self._token_storage.get_token_data(resource_server)
-        if tokens is None or "refresh_token" not in tokens:
+        rt = self._get_refresh_token(resource_server)
+        if rt is None:
+            return False
+        # a recent successful validation of the same token is trusted, to avoid an
+        # Auth call for each resource server on every command
+        if token_validation_is_cached(resource_server, rt):
+            return True
+        if not self._validate_token(rt):
             return False
-        rt = tokens["refresh_token"]
-        return self._validate_token(rt)
+        cache_token_validation(resource_server, rt)
+        return True
+
+    def _missing_logins(self, resource_servers: t.Iterable[str]) -> set[str]:
+        """
+        Get the resource servers, of those given, for which the user does not have a
+        valid login. This is `has_login` for many resource servers, but the tokens
+        which need validation are validated concurrently.
+        """
+        # client identities are always logged in
+        if is_client_login():
+            return set()
+
+        # token lookups (and caching the results) are quick, local reads and writes,
+        # so they happen here, and only the validation calls, which go to Globus
+        # Auth, are made on the pool
+        missing: set[str] = set()
+        to_validate: dict[str, str] = {}
+        for rs in resource_servers:
+            rt = self._get_refresh_token(rs)
+            if rt is None:
+                missing.add(rs)
+            elif not token_validation_is_cached(rs, rt):
+                to_validate[rs] = rt
+
+        if len(to_validate) > 1 and not self._TEST_MODE:
+            from concurrent.futures import ThreadPoolExecutor
+
+            auth_client = internal_auth_client()
+            with ThreadPoolExecutor(
+                max_workers=min(len(to_validate), MAX_LOGIN_VALIDATION_WORKERS)
+            ) as executor:
+                results = list(
+                    executor.map(
+                        lambda rt: self._validate_token(rt, auth_client=auth_client),
+                        to_validate.values(),
+                    )
+                )
+        else:
+            results = [self._validate_token(rt) for rt in to_validate.values()]
+
+        for (rs, rt), valid in zip(to_validate.items(), results):
+            if valid:
+                cache_token_validation(rs, rt)
+            else:
+                missing.add(rs)
+        return missing
+
+    def _on_refresh(self, token_response: globus_sdk.OAuthTokenResponse) -> None:
+        self._token_storage.on_refresh(token_response)
+        invalidate_token_validation_cache(token_response.by_resource_server)
 
     def run_login_flow(
         self,
@@ -168,7 +241,7 @@ class LoginManager:
 
     def assert_logins(self, *resource_servers, assume_gcs=False):
         # determine the set of resource servers missing logins
-        missing_servers = {s for s in resource_servers if not self.has_login(s)}
+        missing_servers = self._missing_logins(resource_servers)
 
         # if we are missing logins, assemble error text
         # text is slightly different for 1, 2, or 3+ missing servers
@@ -241,7 +314,7 @@ class LoginManager:
                 scopes=scopes,
                 access_token=access_token,
                 expires_at=expires_at,
-                on_refresh=self._token_storage.on_refresh,
+                on_refresh=self._on_refresh,
             )
 
         else:
@@ -260,36 +333,48 @@ class LoginManager:
                 internal_auth_client(),
                 access_token=tokens["access_token"],
                 expires_at=tokens["expires_at_seconds"],
-                on_refresh=self._token_storage.on_refresh,
+                on_refresh=self._on_refresh,
             )
 
     def get_transfer_client(self) -> CustomTransferClient:
         from ..services.transfer import CustomTransferClient
 
         authorizer = self._get_client_authorizer(TransferScopes.resource_server)
-        return CustomTransferClient(authorizer=authorizer, app_name=version.app_name)
+        return use_shared_session(
+            CustomTransferClient(authorizer=authorizer, app_name=version.app_name)
+        )
 
     def get_auth_client(self) -> CustomAuthClient:
         from ..services.auth import CustomAuthClient
 
         authorizer = self._get_client_authorizer(AuthScopes.resource_server)
-        return CustomAuthClient(authorizer=authorizer, app_name=version.app_name)
+        return use_shared_session(
+            CustomAuthClient(authorizer=authorizer, app_name=version.app_name)
+        )
 
     def get_groups_client(self) -> globus_sdk.GroupsClient:
         authorizer = self._get_client_authorizer(GroupsScopes.resource_server)
-        return globus_sdk.GroupsClient(authorizer=authorizer, app_name=version.app_name)
+        return use_shared_session(
+            globus_sdk.GroupsClient(authorizer=authorizer, app_name=version.app_name)
+        )
 
     def get_flows_client(self) -> globus_sdk.FlowsClient:
         authorizer = self._get_client_authorizer(FlowsScopes.resource_server)
-        return globus_sdk.FlowsClient(authorizer=authorizer, app_name=version.app_name)
+        return use_shared_session(
+            globus_sdk.FlowsClient(authorizer=authorizer, app_name=version.app_name)
+        )
 
     def get_search_client(self) -> globus_sdk.SearchClient:
         authorizer = self._get_client_authorizer(SearchScopes.resource_server)
-        return globus_sdk.SearchClient(authorizer=authorizer, app_name=version.app_name)
+        return use_shared_session(
+            globus_sdk.SearchClient(authorizer=authorizer, app_name=version.app_name)
+        )
 
     def get_timer_client(self) -> globus_sdk.TimerClient:
         authorizer = self._get_client_authorizer(TimerScopes.resource_server)
-        return globus_sdk.TimerClient(authorizer=authorizer, app_name=version.app_name)
+        return use_shared_session(
+            globus_sdk.TimerClient(authorizer=authorizer, app_name=version.app_name)
+        )
 
     def _get_gcs_info(
         self,
@@ -339,9 +424,11 @@ class LoginManager:
                 f"Try login with '--gcs {gcs_id}' to fix."
             ),
         )
-        return CustomGCSClient(
-            epish.get_gcs_address(),
-            source_epish=epish,
-            authorizer=authorizer,
-            app_name=version.app_name,
+        return use_shared_session(
+            CustomGCSClient(
+                epish.get_gcs_address(),
+                source_epish=epish,
+                authorizer=authorizer,
+                app_name=version.app_name,
+            )
         )
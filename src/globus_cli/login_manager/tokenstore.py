@@ -1,5 +1,9 @@
+from __future__ import annotations
+
+import hashlib
 import os
 import sys
+import time
 import typing as t
 
 import globus_sdk
@@ -8,12 +12,27 @@ if t.TYPE_CHECKING:
     from globus_sdk.tokenstorage import SQLiteAdapter
 
 from .client_login import get_client_login, is_client_login
+from .connection_pool import use_shared_session
 
 # internal constants
 _CLIENT_DATA_CONFIG_KEY = "auth_client_data"
+_TOKEN_VALIDATION_CONFIG_KEY = "token_validation_cache"
+
+# the number of seconds for which a successful token validation is trusted, unless
+# GLOBUS_CLI_TOKEN_VALIDATION_TTL is set
+# setting the TTL to 0 validates tokens on every command
+DEFAULT_TOKEN_VALIDATION_TTL = 300
+
+
+def get_globus_env() -> t.Optional[str]:
+    """
+    Get the Globus environment in use, if one is set.
 
-# env vars used throughout this module
-GLOBUS_ENV = os.environ.get("GLOBUS_SDK_ENVIRONMENT")
+    This is read when it is used, rather than once at import time, so that a
+    long-running process (`globus daemon`) can serve commands for several
+    environments.
+    """
+    return os.environ.get("GLOBUS_SDK_ENVIRONMENT")
 
 
 # stub to allow type casting of a function to an object with an attribute
@@ -21,16 +40,22 @@ class _TokenStoreFuncProto:
     _instance: "SQLiteAdapter"
 
 
+# stub for the memoized internal auth client, stored with its credentials
+class _InternalAuthClientFuncProto:
+    _instance: "t.Tuple[str, str, globus_sdk.ConfidentialAppAuthClient]"
+
+
 def _template_client_id():
     template_id = "95fdeba8-fac2-42bd-a357-e068d82ff78e"
-    if GLOBUS_ENV:
+    globus_env = get_globus_env()
+    if globus_env:
         template_id = {
             "sandbox": "33b6a241-bce4-4359-9c6d-09f88b3c9eef",
             "integration": "e0c31fd1-663b-44e1-840f-f4304bb9ee7a",
             "test": "0ebfd058-452f-40c3-babf-5a6b16a7b337",
             "staging": "3029c3cb-c8d9-4f2b-979c-c53330aa7327",
             "preview": "b2867dbb-0846-4579-8486-dc70763d700b",
-        }.get(GLOBUS_ENV, template_id)
+        }.get(globus_env, template_id)
     return template_id
 
 
@@ -39,8 +64,10 @@ def internal_native_client():
     This is the client that represents the CLI itself (prior to templating)
     """
     template_id = _template_client_id()
-    return globus_sdk.NativeAppAuthClient(
-        template_id, app_name="Globus CLI (native client)"
+    return use_shared_session(
+        globus_sdk.NativeAppAuthClient(
+            template_id, app_name="Globus CLI (native client)"
+        )
     )
 
 
@@ -94,7 +121,7 @@ def _resolve_namespace():
     clientprofile/production/926cc9c6-b481-4a5e-9ccd-b497f04c643b (default)
     clientprofile/sandbox/926cc9c6-b481-4a5e-9ccd-b497f04c643b    (sandbox env)
     """
-    env = GLOBUS_ENV if GLOBUS_ENV else "production"
+    env = get_globus_env() or "production"
     profile = os.environ.get("GLOBUS_PROFILE")
 
     if is_client_login():
@@ -118,7 +145,13 @@ def token_storage_adapter() -> "SQLiteAdapter":
 
             invalidate_old_config(internal_native_client())
         # namespace is equal to the current environment
-        as_proto._instance = SQLiteAdapter(fname, namespace=_resolve_namespace())
+        # the connection may be shared by commands running in worker threads (with
+        # `globus batch-run --jobs`), which SQLite serializes
+        as_proto._instance = SQLiteAdapter(
+            fname,
+            namespace=_resolve_namespace(),
+            connect_params={"check_same_thread": False},
+        )
     return as_proto._instance
 
 
@@ -129,6 +162,8 @@ def internal_auth_client():
     In the event that credentials are not found, template a new client via the Auth API,
     save the credentials for that client, and then build and return the
     ConfidentialAppAuthClient.
+
+    The client is memoized for as long as the stored credentials do not change.
     """
     if is_client_login():
         raise ValueError("client logins shouldn't create internal auth clients")
@@ -155,9 +190,18 @@ def internal_auth_client():
             {"client_id": client_id, "client_secret": client_secret},
         )
 
-    return globus_sdk.ConfidentialAppAuthClient(
-        client_id, client_secret, app_name="Globus CLI"
+    as_proto = t.cast(_InternalAuthClientFuncProto, internal_auth_client)
+    cached = getattr(as_proto, "_instance", None)
+    if cached is not None and cached[:2] == (client_id, client_secret):
+        return cached[2]
+
+    client = use_shared_session(
+        globus_sdk.ConfidentialAppAuthClient(
+            client_id, client_secret, app_name="Globus CLI"
+        )
     )
+    as_proto._instance = (client_id, client_secret, client)
+    return client
 
 
 def delete_templated_client():
@@ -173,3 +217,69 @@ def delete_templated_client():
     # note that this could raise an exception if the creds are already invalid -- the
     # caller may or may not want to ignore, so allow it to raise from here
     ac.delete(f"/v2/api/clients/{ac.client_id}")
+
+
+def _token_validation_ttl() -> int:
+    value = os.environ.get("GLOBUS_CLI_TOKEN_VALIDATION_TTL")
+    if value is None:
+        return DEFAULT_TOKEN_VALIDATION_TTL
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        return DEFAULT_TOKEN_VALIDATION_TTL
+
+
+def _hash_token(token: str) -> str:
+    # tokens are never stored in the cache, only their hashes
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def token_validation_is_cached(resource_server: str, token: str) -> bool:
+    """
+    Check if a token for a resource server was successfully validated recently
+    enough to trust the result, rather than validating it again.
+    """
+    ttl = _token_validation_ttl()
+    if ttl == 0:
+        return False
+    cache = token_storage_adapter().read_config(_TOKEN_VALIDATION_CONFIG_KEY) or {}
+    entry = cache.get(resource_server)
+    if entry is None or entry["token_hash"] != _hash_token(token):
+        return False
+    # an entry from the future (e.g. after the clock is changed) is not trusted
+    return bool(0 <= time.time() - entry["validated_at"] < ttl)
+
+
+def cache_token_validation(resource_server: str, token: str) -> None:
+    """
+    Record the successful validation of a token for a resource server.
+    """
+    if _token_validation_ttl() == 0:
+        return
+    adapter = token_storage_adapter()
+    cache = adapter.read_config(_TOKEN_VALIDATION_CONFIG_KEY) or {}
+    cache[resource_server] = {
+        "token_hash": _hash_token(token),
+        "validated_at": time.time(),
+    }
+    adapter.store_config(_TOKEN_VALIDATION_CONFIG_KEY, cache)
+
+
+def invalidate_token_validation_cache(
+    resource_servers: t.Iterable[str] | None = None,
+) -> None:
+    """
+    Remove cached token validations for the given resource servers, or for all
+    resource servers if none are given.
+    """
+    adapter = token_storage_adapter()
+    if resource_servers is None:
+        adapter.remove_config(_TOKEN_VALIDATION_CONFIG_KEY)
+        return
+
+    cache = adapter.read_config(_TOKEN_VALIDATION_CONFIG_KEY)
+    if not cache:
+        return
+    for rs in resource_servers:
+        cache.pop(rs, None)
+    adapter.store_config(_TOKEN_VALIDATION_CONFIG_KEY, cache)
@@ -1,3 +1,4 @@
+from .batch_input import BatchInputParser
 from .commands import command, group, main_group
 from .mutex_group import MutexInfo, mutex_option_group
 from .one_use_option import one_use_option
@@ -14,6 +15,7 @@ from .param_types import (
     TimedeltaType,
     UrlOrNull,
     nullable_multi_callback,
+    resolve_task_path,
 )
 from .shared_options import (
     collection_id_arg,
@@ -45,6 +47,8 @@ __all__ = [
     "group",
     "main_group",
     "one_use_option",
+    # batch input
+    "BatchInputParser",
     # param types
     "ENDPOINT_PLUS_OPTPATH",
     "ENDPOINT_PLUS_REQPATH",
@@ -60,6 +64,7 @@ __all__ = [
     "UrlOrNull",
     "mutex_option_group",
     "nullable_multi_callback",
+    "resolve_task_path",
     "one_use_option",
     # Transfer options
     "collection_id_arg",
@@ -0,0 +1,159 @@
+"""
+Parsing for `--batch` input, as used by `globus transfer` and `globus delete`.
+
+Batch input can be very large (millions of lines), so rather than running a click
+command for each line, lines are split and matched against a small, fixed grammar
+of positional arguments, flags, and options which take a value.
+The grammar matches what click would accept for an equivalent command, and
+errors are reported as usage errors which include the line number.
+"""
+from __future__ import annotations
+
+import re
+import shlex
+import typing as t
+
+import click
+
+from ..utils import format_list_of_words
+
+# a line can be split with `str.split()` unless it contains quotes, escapes, or
+# comments, or whitespace characters which shlex does not treat as whitespace
+_NEEDS_SHLEX = re.compile(r"['\"\\#]|[^\S \t\r\n]")
+
+
+def split_batch_line(line: str) -> list[str]:
+    """
+    Split a line of batch input into words, respecting quotes and dropping any
+    trailing comment. Equivalent to `shlex.split(line, comments=True)`.
+
+    Raises a UsageError if the line cannot be split (e.g. it has unbalanced quotes)
+    """
+    if _NEEDS_SHLEX.search(line) is None:
+        return line.split()
+    try:
+        return shlex.split(line, comments=True)
+    except ValueError as err:
+        raise click.UsageError(str(err)) from err
+
+
+class BatchInputParser:
+    """
+    A parser for lines of batch input.
+
+    :param arguments: names for the positional arguments, all of which are required
+    :param flags: a mapping from flag strings (e.g. "--recursive", "-r") to names
+    :param options: a mapping from option strings (e.g. "--external-checksum") to
+        names, for options which take a value
+    :param mutually_exclusive: groups of names which may not be used together
+
+    Parsing a line produces a dict of names to values. Flags default to False and
+    options to None.
+    """
+
+    def __init__(
+        self,
+        arguments: t.Sequence[str],
+        *,
+        flags: dict[str, str] | None = None,
+        options: dict[str, str] | None = None,
+        mutually_exclusive: t.Sequence[t.Sequence[str]] = (),
+    ) -> None:
+        self.arguments = tuple(arguments)
+        self.flags = flags or {}
+        self.options = options or {}
+        self.mutually_exclusive = [tuple(group) for group in mutually_exclusive]
+
+        # the default values for each line, copied for each line parsed
+        self._defaults: dict[str, t.Any] = {}
+        for name in self.flags.values():
+            self._defaults[name] = False
+        for name in self.options.values():
+            self._defaults[name] = None
+
+        # the option strings for each name, used in error messages
+        self._option_strings: dict[str, str] = {}
+        for opt, name in (*self.options.items(), *self.flags.items()):
+            self._option_strings.setdefault(name, opt)
+
+    def parse_line(self, line: str) -> dict[str, t.Any] | None:
+        """
+        Parse a single line of input, returning None for lines which are blank or
+        only contain a comment.
+
+        Raises a UsageError (without line number information) if the line is invalid
+        """
+        words = split_batch_line(line)
+        if not words:
+            return None
+
+        values = dict(self._defaults)
+        positionals: list[str] = []
+        seen: set[str] = set()
+
+        words.reverse()
+        while words:
+            word = words.pop()
+            if word == "--":
+                words.reverse()
+                positionals.extend(words)
+                break
+            if len(word) < 2 or not word.startswith("-"):
+                positionals.append(word)
+                continue
+
+            opt, has_value, value = word.partition("=")
+            if not opt.startswith("--"):
+                opt, has_value, value = word, "", ""
+
+            if opt in self.flags:
+                if has_value:
+                    raise click.UsageError(f"Option '{opt}' does not take a value.")
+                values[self.flags[opt]] = True
+                seen.add(self.flags[opt])
+            elif opt in self.options:
+                if not has_value:
+                    if not words:
+                        raise click.UsageError(f"Option '{opt}' requires an argument.")
+                    value = words.pop()
+                values[self.options[opt]] = value
+                seen.add(self.options[opt])
+            else:
+                raise click.UsageError(f"No such option: {opt}")
+
+        if len(positionals) < len(self.arguments):
+            missing = self.arguments[len(positionals)]
+            raise click.UsageError(f"Missing argument '{missing.upper()}'.")
+        if len(positionals) > len(self.arguments):
+            extra = positionals[len(self.arguments) :]
+            argument = "arguments" if len(extra) > 1 else "argument"
+            raise click.UsageError(
+                f"Got unexpected extra {argument} ({' '.join(extra)})"
+            )
+        values.update(zip(self.arguments, positionals))
+
+        for group in self.mutually_exclusive:
+            found = [name for name in group if name in seen]
+            if len(found) > 1:
+                option_str = format_list_of_words(
+                    *(self._option_strings[x] for x in group)
+                )
+                raise click.UsageError(f"{option_str} are mutually exclusive")
+
+        return values
+
+    def iter_parsed(self, stream: t.Iterable[str]) -> t.Iterator[dict[str, t.Any]]:
+        """
+        Lazily parse lines from a stream, skipping blank and comment lines.
+
+        Errors are raised as UsageErrors which include the line number.
+        """
+        for lineno, line in enumerate(stream, start=1):
+            try:
+                values = self.parse_line(line)
+            except click.UsageError as err:
+                raise click.UsageError(
+                    f"Invalid batch input on line {lineno}: {err.message}"
+                ) from err
+            if values is not None:
+                yield values
@@ -0,0 +1,142 @@
+"""
+A precomputed index of the command tree, so that listings of commands (group
+helptext, tab completion, and `globus list-commands`) can be produced without
+importing the module of every command which they list.
+
+The index is generated by `scripts/generate_command_index.py` and shipped with the
+CLI. It records the version of the CLI for which it was generated, and is ignored
+if that does not match the running version. Each group also checks that the index
+lists the same subcommands that it has, so a stale list of commands is never used.
+Helptext is not checked, so the index must be regenerated whenever it changes.
+
+Commands are keyed by their path below the top-level command, e.g. "endpoint show",
+with "" for the top-level command itself.
+"""
+from __future__ import annotations
+
+import json
+import os
+import typing as t
+
+import click
+
+INDEX_FILENAME = os.path.join(os.path.dirname(__file__), "command_index.json")
+
+
+# stub to allow type casting of a function to an object with an attribute
+class _LoadIndexFuncProto:
+    _instance: "dict[str, t.Any] | None"
+
+
+def _first_paragraph(text: str | None) -> str | None:
+    # short help is made from the first paragraph of the helptext, so the index only
+    # needs to store that much of it
+    if text is None:
+        return None
+    paragraph_end = text.find("\n\n")
+    return text if paragraph_end == -1 else text[:paragraph_end]
+
+
+def _index_entry(command: click.Command, ctx: click.Context) -> dict[str, t.Any]:
+    entry: dict[str, t.Any] = {
+        "help": _first_paragraph(command.help),
+        "short_help": command.short_help,
+        "hidden": command.hidden,
+        "deprecated": command.deprecated,
+    }
+    if isinstance(command, click.MultiCommand):
+        entry["subcommands"] = command.list_commands(ctx)
+    return entry
+
+
+def build_command_index(command: click.Command) -> dict[str, t.Any]:
+    """
+    Build an index of a command tree, by loading every command in it.
+    """
+    from globus_cli.version import __version__
+
+    commands: dict[str, dict[str, t.Any]] = {}
+
+    def _add(path: str, command: click.Command, ctx: click.Context) -> None:
+        entry = _index_entry(command, ctx)
+        commands[path] = entry
+        for name in entry.get("subcommands", ()):
+            assert isinstance(command, click.MultiCommand)
+            subcommand = command.get_command(ctx, name)
+            if subcommand is not None:
+                subctx = click.Context(subcommand, info_name=name, parent=ctx)
+                _add(f"{path} {name}".strip(), subcommand, subctx)
+
+    _add("", command, click.Context(command, info_name=command.name))
+    return {"version": __version__, "commands": commands}
+
+
+def load_command_index() -> dict[str, t.Any] | None:
+    """
+    Load the index shipped with the CLI, or get None if it is missing or for
+    another version of the CLI.
+    """
+    from globus_cli.version import __version__
+
+    as_proto = t.cast(_LoadIndexFuncProto, load_command_index)
+    if not hasattr(as_proto, "_instance"):
+        index = None
+        try:
+            with open(INDEX_FILENAME, encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if index is not None and index.get("version") != __version__:
+            index = None
+        as_proto._instance = index
+    return as_proto._instance
+
+
+def command_path(ctx: click.Context) -> str:
+    """
+    Get the key of the command for a context in the index.
+    """
+    names = []
+    while ctx.parent is not None:
+        names.append(ctx.info_name or "")
+        ctx = ctx.parent
+    return " ".join(reversed(names))
+
+
+def indexed_subcommands(
+    group: click.MultiCommand, ctx: click.Context
+) -> list[tuple[str, click.Command]] | None:
+    """
+    Get the subcommands of a group from the index, as (name, command) pairs.
+
+    The commands are stand-ins which have the names and helptext of the real
+    commands, but cannot be run. If the index does not match the group, return None.
+    """
+    index = load_command_index()
+    if index is None:
+        return None
+    path = command_path(ctx)
+    entry = index["commands"].get(path)
+    if entry is None or entry.get("subcommands") != group.list_commands(ctx):
+        return None
+
+    subcommands = []
+    for name in entry["subcommands"]:
+        subentry = index["commands"].get(f"{path} {name}".strip())
+        if subentry is None:
+            return None
+        subcommands.append((name, indexed_command(name, subentry)))
+    return subcommands
+
+
+def indexed_command(name: str, entry: dict[str, t.Any]) -> click.Command:
+    """
+    Make a stand-in for a command from its index entry.
+    """
+    return click.Command(
+        name,
+        help=entry["help"],
+        short_help=entry["short_help"],
+        hidden=entry["hidden"],
+        deprecated=entry["deprecated"],
+    )
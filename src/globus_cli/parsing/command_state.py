@@ -9,6 +9,7 @@ import click
 JSON_FORMAT = "json"
 TEXT_FORMAT = "text"
 UNIX_FORMAT = "unix"
+NDJSON_FORMAT = "ndjson"
 
 
 def _setup_logging(level="DEBUG"):
@@ -60,6 +61,9 @@ class CommandState:
     def outformat_is_unix(self):
         return self.output_format == UNIX_FORMAT
 
+    def outformat_is_ndjson(self):
+        return self.output_format == NDJSON_FORMAT
+
     def is_verbose(self):
         return self.verbosity > 0
 
@@ -93,9 +97,13 @@ def format_option(f: t.Callable) -> t.Callable:
         "-F",
         "--format",
         type=click.Choice(
-            [UNIX_FORMAT, JSON_FORMAT, TEXT_FORMAT], case_sensitive=False
+            [UNIX_FORMAT, JSON_FORMAT, NDJSON_FORMAT, TEXT_FORMAT],
+            case_sensitive=False,
+        ),
+        help=(
+            "Output format for stdout. Defaults to text. "
+            "ndjson prints one compact JSON document per line"
         ),
-        help="Output format for stdout. Defaults to text",
         expose_value=False,
         callback=callback,
     )(f)
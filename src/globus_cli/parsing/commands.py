@@ -10,19 +10,39 @@ from __future__ import annotations
 import importlib
 import logging
 import sys
-from shutil import get_terminal_size
+import typing as t
 
 import click
 
 from globus_cli.exception_handling import custom_except_hook
-from globus_cli.termio import env_interactive
+from globus_cli.termio import env_interactive, help_content_width
 
+from .command_index import indexed_subcommands
 from .shared_options import common_options
 from .shell_completion import print_completer_option
 
+if t.TYPE_CHECKING:
+    from click.shell_completion import CompletionItem
+
 log = logging.getLogger(__name__)
 
 
+class GlobusCommandContext(click.Context):
+    """
+    A context which sizes helptext to the terminal, unless a max_content_width was
+    set explicitly.
+
+    The terminal is not queried until helptext is rendered, so that commands which
+    are only constructed (e.g. when loading the command tree) or only run never pay
+    for it.
+    """
+
+    def make_formatter(self) -> click.HelpFormatter:
+        if self.max_content_width is None:
+            self.max_content_width = help_content_width()
+        return super().make_formatter()
+
+
 class GlobusCommand(click.Command):
     """
     A custom command class which stores the special attributes
@@ -40,6 +60,8 @@ class GlobusCommand(click.Command):
     you will need to manually activate the endpoint. See 'globus endpoint activate'
     for more details."""
 
+    context_class = GlobusCommandContext
+
     def __init__(self, *args, **kwargs):
         self.adoc_skip = kwargs.pop("adoc_skip", False)
         self.adoc_output = kwargs.pop("adoc_output", None)
@@ -53,23 +75,18 @@ class GlobusCommand(click.Command):
             kwargs["help"] = helptext.format(
                 AUTOMATIC_ACTIVATION=self.AUTOMATIC_ACTIVATION_HELPTEXT
             )
-        if "context_settings" not in kwargs:
-            kwargs["context_settings"] = {}
-        if "max_content_width" not in kwargs["context_settings"]:
-            try:
-                cols = get_terminal_size(fallback=(80, 20)).columns
-                content_width = cols if cols < 100 else int(0.8 * cols)
-                kwargs["context_settings"]["max_content_width"] = content_width
-            except OSError:
-                pass
         super().__init__(*args, **kwargs)
 
     def invoke(self, ctx):
+        from .path_completion import record_endpoint_use
+
         log.debug("command invoke start")
         try:
-            return super().invoke(ctx)
+            result = super().invoke(ctx)
         finally:
             log.debug("command invoke exit")
+        record_endpoint_use(ctx)
+        return result
 
     def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
         # args will be consumed, so check it before super()
@@ -152,6 +169,40 @@ class GlobusCommandGroup(click.Group):
             )
         return cmd_object
 
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter):
+        # list subcommands from the command index, if possible, rather than
+        # importing all of them to get their helptext
+        indexed = indexed_subcommands(self, ctx)
+        if indexed is None:
+            return super().format_commands(ctx, formatter)
+
+        commands = [(name, cmd) for name, cmd in indexed if not cmd.hidden]
+        if commands:
+            limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+            with formatter.section("Commands"):
+                formatter.write_dl(
+                    [(name, cmd.get_short_help_str(limit)) for name, cmd in commands]
+                )
+
+    def shell_complete(
+        self, ctx: click.Context, incomplete: str
+    ) -> list[CompletionItem]:
+        # as with helptext, complete subcommand names from the command index
+        indexed = indexed_subcommands(self, ctx)
+        if indexed is None:
+            return super().shell_complete(ctx, incomplete)
+
+        from click.shell_completion import CompletionItem
+
+        results = [
+            CompletionItem(name, help=cmd.get_short_help_str())
+            for name, cmd in indexed
+            if name.startswith(incomplete) and not cmd.hidden
+        ]
+        # options are completed as for any other command
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
     def invoke(self, ctx):
         # if no subcommand was given (but, potentially, flags were passed),
         # ctx.protected_args will be empty
@@ -174,6 +225,18 @@ class TopLevelGroup(GlobusCommandGroup):
     passes them to a custom error handler.
     """
 
+    def __call__(self, *args, **kwargs):
+        # when run as the `globus` entrypoint, a command may be forwarded to a
+        # `globus daemon` instead of being run here
+        if not args and not kwargs:
+            from globus_cli.daemon import forward_to_daemon
+            from globus_cli.utils import options_with_values
+
+            exit_code = forward_to_daemon(sys.argv[1:], options_with_values(self))
+            if exit_code is not None:
+                sys.exit(exit_code)
+        return super().__call__(*args, **kwargs)
+
     def invoke(self, ctx):
         try:
             return super().invoke(ctx)
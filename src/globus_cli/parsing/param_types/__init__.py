@@ -8,7 +8,7 @@ from .identity_type import IdentityType, ParsedIdentity
 from .location import LocationType
 from .nullable import StringOrNull, UrlOrNull, nullable_multi_callback
 from .prefix_mapper import JSONStringOrFile
-from .task_path import TaskPath
+from .task_path import TaskPath, resolve_task_path
 from .timedelta import TimedeltaType
 
 __all__ = (
@@ -24,5 +24,6 @@ __all__ = (
     "nullable_multi_callback",
     "JSONStringOrFile",
     "TaskPath",
+    "resolve_task_path",
     "TimedeltaType",
 )
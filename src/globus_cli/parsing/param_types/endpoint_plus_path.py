@@ -1,5 +1,12 @@
+from __future__ import annotations
+
+import typing as t
+
 import click
 
+if t.TYPE_CHECKING:
+    from click.shell_completion import CompletionItem
+
 
 class EndpointPlusPath(click.ParamType):
     """
@@ -60,8 +67,26 @@ class EndpointPlusPath(click.ParamType):
         if path is None and self.path_required:
             self.fail("The path component is required", param=param)
 
+        # note the endpoint, to be remembered for tab completion if the command
+        # succeeds, except when parsing for completion itself
+        if ctx is not None and not ctx.resilient_parsing:
+            from globus_cli.parsing.path_completion import note_endpoint_use
+
+            note_endpoint_use(ctx, endpoint_id)
+
         return (endpoint_id, path)
 
+    def shell_complete(
+        self, ctx: click.Context, param: click.Parameter, incomplete: str
+    ) -> list[CompletionItem]:
+        """
+        Complete endpoint IDs from bookmarks and recently used endpoints, and paths
+        by listing them on the endpoint.
+        """
+        from globus_cli.parsing.path_completion import complete_endpoint_plus_path
+
+        return complete_endpoint_plus_path(incomplete)
+
 
 ENDPOINT_PLUS_OPTPATH = EndpointPlusPath(path_required=False)
 ENDPOINT_PLUS_REQPATH = EndpointPlusPath(path_required=True)
@@ -0,0 +1,264 @@
+"""
+Tab completion of ENDPOINT_ID:PATH arguments.
+
+Endpoint IDs are completed from the user's bookmarks and from the endpoints which
+they have used recently. Paths are completed by listing the directory being
+completed on the endpoint, with a single `operation_ls`.
+
+Bookmarks and directory listings are cached on disk for a short time (separately
+for each profile), so that pressing TAB repeatedly only calls Transfer once. A
+completion which is served from the cache does not load the SDK at all.
+"""
+from __future__ import annotations
+
+import logging
+import typing as t
+import uuid
+
+if t.TYPE_CHECKING:
+    import click
+    from click.shell_completion import CompletionItem
+
+    from globus_cli.login_manager.diskcache import DiskCache
+    from globus_cli.services.transfer import CustomTransferClient
+
+log = logging.getLogger(__name__)
+
+# the number of seconds for which bookmarks and directory listings are cached,
+# unless GLOBUS_CLI_PATH_COMPLETION_CACHE_TTL is set
+# setting the TTL to 0 disables the cache, and the recording of recent endpoints
+DEFAULT_PATH_COMPLETION_CACHE_TTL = 60
+# the maximum number of entries (listings, bookmarks, and recent endpoints) kept in
+# the cache
+PATH_COMPLETION_CACHE_MAX_SIZE = 1000
+# the number of recently used endpoints which are remembered, and for how long
+MAX_RECENT_ENDPOINTS = 10
+RECENT_ENDPOINTS_TTL = 30 * 86400
+
+_BOOKMARKS_KEY = "bookmarks"
+_RECENT_ENDPOINTS_KEY = "recent_endpoints"
+# where the endpoints used by a command are noted, in the click context's meta
+_USED_ENDPOINTS_META_KEY = "globus_cli.used_endpoints"
+
+
+# stub to allow type casting of a function to an object with an attribute
+class _PathCompletionCacheFuncProto:
+    _instance: "PathCompletionCache"
+
+
+class PathCompletionCache:
+    """
+    A cache of the data used to complete ENDPOINT_ID:PATH arguments.
+
+    :param disk_cache: Where to cache data between completions. If not given,
+        nothing is cached.
+    :param ttl: The number of seconds for which bookmarks and listings are cached
+    """
+
+    def __init__(self, disk_cache: DiskCache | None = None, ttl: int = 0) -> None:
+        self.disk_cache = disk_cache if ttl > 0 else None
+        self.ttl = ttl
+
+    def _get(self, key: str) -> t.Any:
+        if self.disk_cache is None:
+            return None
+        return self.disk_cache.get_many([key]).get(key)
+
+    def _set(self, key: str, value: t.Any, ttl: int) -> None:
+        if self.disk_cache is not None:
+            self.disk_cache.set_many([(key, value, ttl)])
+
+    def get_listing(self, endpoint_id: str, path: str) -> list[dict[str, str]] | None:
+        """
+        Get the cached entries of a directory, as dicts with a name and a type, or
+        None if the directory is not cached.
+        """
+        return t.cast(
+            "list[dict[str, str]] | None", self._get(f"ls:{endpoint_id}:{path}")
+        )
+
+    def store_listing(
+        self, endpoint_id: str, path: str, entries: list[dict[str, str]]
+    ) -> None:
+        self._set(f"ls:{endpoint_id}:{path}", entries, self.ttl)
+
+    def get_bookmarks(self) -> list[dict[str, str]] | None:
+        """
+        Get the cached bookmarks, as dicts with a name, endpoint_id, and path, or
+        None if they are not cached.
+        """
+        return t.cast("list[dict[str, str]] | None", self._get(_BOOKMARKS_KEY))
+
+    def store_bookmarks(self, bookmarks: list[dict[str, str]]) -> None:
+        self._set(_BOOKMARKS_KEY, bookmarks, self.ttl)
+
+    def recent_endpoints(self) -> list[str]:
+        """
+        Get the IDs of the recently used endpoints, most recent first.
+        """
+        return t.cast("list[str]", self._get(_RECENT_ENDPOINTS_KEY) or [])
+
+    def add_recent_endpoint(self, endpoint_id: str | uuid.UUID) -> None:
+        if self.disk_cache is None:
+            return
+        endpoint_id = str(endpoint_id)
+        recent = self.recent_endpoints()
+        if recent[:1] == [endpoint_id]:
+            return
+        recent = [endpoint_id] + [x for x in recent if x != endpoint_id]
+        self._set(
+            _RECENT_ENDPOINTS_KEY, recent[:MAX_RECENT_ENDPOINTS], RECENT_ENDPOINTS_TTL
+        )
+
+    def clear(self) -> None:
+        if self.disk_cache is not None:
+            self.disk_cache.clear()
+
+
+def path_completion_cache() -> PathCompletionCache:
+    """
+    Get the path completion cache, creating it on first use.
+    """
+    as_proto = t.cast(_PathCompletionCacheFuncProto, path_completion_cache)
+    if not hasattr(as_proto, "_instance"):
+        from globus_cli.login_manager.diskcache import (
+            DiskCache,
+            get_cache_filename,
+            get_cache_ttl,
+        )
+        from globus_cli.login_manager.tokenstore import _resolve_namespace
+
+        ttl = get_cache_ttl(
+            "GLOBUS_CLI_PATH_COMPLETION_CACHE_TTL", DEFAULT_PATH_COMPLETION_CACHE_TTL
+        )
+        disk_cache = None
+        if ttl > 0:
+            # bookmarks and listings depend on who is logged in, so they are kept
+            # separately for each profile, like tokens
+            disk_cache = DiskCache(
+                get_cache_filename("path_completion_cache.db"),
+                namespace=_resolve_namespace(),
+                max_size=PATH_COMPLETION_CACHE_MAX_SIZE,
+            )
+        as_proto._instance = PathCompletionCache(disk_cache, ttl=ttl)
+    return as_proto._instance
+
+
+def _transfer_client() -> CustomTransferClient:
+    from globus_cli.login_manager import LoginManager
+
+    return LoginManager().get_transfer_client()
+
+
+def _bookmarks() -> list[dict[str, str]]:
+    cache = path_completion_cache()
+    bookmarks = cache.get_bookmarks()
+    if bookmarks is None:
+        bookmarks = [
+            {
+                "name": x["name"],
+                "endpoint_id": x["endpoint_id"],
+                "path": x["path"],
+            }
+            for x in _transfer_client().bookmark_list()
+        ]
+        cache.store_bookmarks(bookmarks)
+    return bookmarks
+
+
+def _listing(endpoint_id: str, path: str) -> list[dict[str, str]]:
+    cache = path_completion_cache()
+    entries = cache.get_listing(endpoint_id, path)
+    if entries is None:
+        # hidden entries are always listed, and filtered out when completing, so
+        # that one listing serves all completions in the directory
+        response = _transfer_client().operation_ls(
+            endpoint_id, path=path or None, show_hidden=True
+        )
+        entries = [{"name": x["name"], "type": x["type"]} for x in response]
+        cache.store_listing(endpoint_id, path, entries)
+    return entries
+
+
+def complete_endpoint_id(incomplete: str) -> list[CompletionItem]:
+    """
+    Complete an endpoint ID, from bookmarks (completed along with their paths) and
+    recently used endpoints.
+    """
+    from click.shell_completion import CompletionItem
+
+    items: dict[str, CompletionItem] = {}
+    try:
+        for bookmark in _bookmarks():
+            value = f"{bookmark['endpoint_id']}:{bookmark['path']}"
+            items.setdefault(value, CompletionItem(value, help=bookmark["name"]))
+    except Exception as err:
+        # completion must not fail or print errors, e.g. when not logged in
+        log.debug("could not complete from bookmarks: %r", err)
+    for endpoint_id in path_completion_cache().recent_endpoints():
+        value = f"{endpoint_id}:"
+        items.setdefault(value, CompletionItem(value, help="recently used"))
+    return [item for value, item in items.items() if value.startswith(incomplete)]
+
+
+def complete_path(endpoint_id: str, incomplete_path: str) -> list[CompletionItem]:
+    """
+    Complete a path on an endpoint, by listing the directory which contains it.
+    """
+    from click.shell_completion import CompletionItem
+
+    try:
+        uuid.UUID(endpoint_id)
+    except ValueError:
+        return []
+
+    # "" is the endpoint's default directory
+    slash = incomplete_path.rfind("/") + 1
+    dirname, basename = incomplete_path[:slash], incomplete_path[slash:]
+    try:
+        entries = _listing(endpoint_id, dirname)
+    except Exception as err:
+        log.debug("could not list %s:%s for completion: %r", endpoint_id, dirname, err)
+        return []
+
+    items = []
+    for entry in entries:
+        name = entry["name"]
+        if not name.startswith(basename):
+            continue
+        if name.startswith(".") and not basename.startswith("."):
+            continue
+        suffix = "/" if entry["type"] == "dir" else ""
+        items.append(CompletionItem(f"{endpoint_id}:{dirname}{name}{suffix}"))
+    return items
+
+
+def complete_endpoint_plus_path(incomplete: str) -> list[CompletionItem]:
+    """
+    Complete an ENDPOINT_ID:PATH argument.
+    """
+    endpoint_id, sep, path = incomplete.partition(":")
+    if not sep:
+        return complete_endpoint_id(incomplete)
+    return complete_path(endpoint_id, path)
+
+
+def note_endpoint_use(ctx: click.Context, endpoint_id: str | uuid.UUID) -> None:
+    """
+    Note that a command is using an endpoint. The endpoint is remembered by
+    `record_endpoint_use` if the command succeeds.
+    """
+    ctx.meta.setdefault(_USED_ENDPOINTS_META_KEY, []).append(str(endpoint_id))
+
+
+def record_endpoint_use(ctx: click.Context) -> None:
+    """
+    Remember the endpoints which a command used, after it succeeded, so that their
+    IDs can be completed.
+    """
+    for endpoint_id in ctx.meta.get(_USED_ENDPOINTS_META_KEY, ()):
+        try:
+            path_completion_cache().add_recent_endpoint(endpoint_id)
+        except Exception as err:
+            # a command which succeeded must not fail because of its completion data
+            log.debug("could not record use of %s: %r", endpoint_id, err)
@@ -263,9 +263,6 @@ def delete_and_rm_options(
 
 def synchronous_task_wait_options(f):
     def polling_interval_callback(ctx, param, value):
-        if not value:
-            return None
-
         if value < 1:
             raise click.UsageError(
                 f"--polling-interval={value} was less than minimum of 1"
@@ -295,11 +292,14 @@ def synchronous_task_wait_options(f):
     )(f)
     f = click.option(
         "--polling-interval",
-        default=1,
+        default=60,
         type=int,
         show_default=True,
         callback=polling_interval_callback,
-        help="Number of seconds between Task status checks.",
+        help=(
+            "The maximum number of seconds between Task status checks. Checks "
+            "start 1 second apart and back off up to this interval."
+        ),
     )(f)
     f = click.option(
         "--heartbeat",
@@ -1,6 +1,9 @@
+from __future__ import annotations
+
 import os
 
 import click
+from click.shell_completion import BashComplete, add_completion_class, split_arg_string
 
 # pulled by running `_GLOBUS_COMPLETE=source globus` in a bash shell
 BASH_SHELL_COMPLETER = r"""
@@ -21,6 +24,10 @@ _globus_completion() {
             compopt -o default
         elif [[ $type == 'plain' ]]; then
             COMPREPLY+=($value)
+            # don't add a space after an endpoint ID or a directory
+            if [[ $value == *: || $value == */ ]]; then
+                compopt -o nospace
+            fi
         fi
     done
 
@@ -51,7 +58,7 @@ _globus_completion() {
             if [[ "$descr" == "_" ]]; then
                 completions+=("$key")
             else
-                completions_with_descriptions+=("$key":"$descr")
+                completions_with_descriptions+=("${key//:/\\:}":"$descr")
             fi
         elif [[ "$type" == "dir" ]]; then
             _path_files -/
@@ -73,6 +80,55 @@ compdef _globus_completion globus;
 """  # noqa: E501
 
 
+class GlobusBashComplete(BashComplete):
+    """
+    Bash completion which handles words containing colons, like ENDPOINT_ID:PATH.
+
+    Bash splits words on colons, so "ENDPOINT_ID:/a" is sent as the three words
+    "ENDPOINT_ID", ":", and "/a", and a completion only replaces the last of them.
+    The words are joined back together before completing, and each completion is
+    trimmed to the part which replaces the word bash is completing.
+    """
+
+    def get_completion_args(self) -> tuple[list[str], str]:
+        cwords = split_arg_string(os.environ["COMP_WORDS"])
+        cword = int(os.environ["COMP_CWORD"])
+        self._bash_incomplete = cwords[cword] if cword < len(cwords) else ""
+
+        words: list[str] = []
+        # the index of the word being completed, after joining
+        joined_cword = cword
+        follows_colon = False
+        for index, word in enumerate(cwords):
+            if words and (word == ":" or follows_colon):
+                words[-1] += word
+                if index <= cword:
+                    joined_cword -= 1
+            else:
+                words.append(word)
+            follows_colon = word == ":"
+
+        incomplete = words[joined_cword] if joined_cword < len(words) else ""
+        return words[1:joined_cword], incomplete
+
+    def complete(self) -> str:
+        args, incomplete = self.get_completion_args()
+        trim = len(incomplete) - len(self._bash_incomplete)
+        out = []
+        for item in self.get_completions(args, incomplete):
+            if (
+                trim
+                and item.type == "plain"
+                and item.value.startswith(incomplete[:trim])
+            ):
+                item.value = item.value[trim:]
+            out.append(self.format_completion(item))
+        return "\n".join(out)
+
+
+add_completion_class(GlobusBashComplete)
+
+
 def print_completer_option(f):
     def callback(ctx, param, value):
         if not value or ctx.resilient_parsing:
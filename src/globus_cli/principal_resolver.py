@@ -18,14 +18,19 @@ whole paginated call to be walked at once.
 
 This also lets us keep the resolution work only in the text-mode printed output (and not
 applied on JSON output).
+
+Because resolvers are defined once, but one process may run many commands (e.g. with
+`globus daemon` or `globus batch-run`), the identities which a resolver looks up are
+kept with the running command, not with the resolver.
 """
 from __future__ import annotations
 
 import typing as t
 
-import globus_sdk
+import click
 
 from globus_cli.login_manager import LoginManager
+from globus_cli.services.auth import CachedIdentityMap
 from globus_cli.types import DATA_CONTAINER_T
 
 IDENTITY_URN_PREFIX = "urn:globus:auth:identity:"
@@ -36,6 +41,17 @@ class InvalidPrincipalError(ValueError):
         self.value = value
 
 
+class _ResolverState:
+    """
+    The identities which a resolver has seen, and looked up, in one command.
+    """
+
+    def __init__(self) -> None:
+        self.idmap: CachedIdentityMap | None = None
+        # values seen by `page_callback` before the idmap was needed
+        self.pending: list[str] = []
+
+
 class PrincipalResolver:
     """
     Everything is done lazily via properties so that nothing happens during
@@ -43,7 +59,7 @@ class PrincipalResolver:
 
     Pass ``PrincipalResolver.field`` as a field key for output printing
 
-    Pass ``PrincipalResolver.page_callback`` as a page callback for output printing.
+    Pass ``PrincipalResolver.page_callback`` as a page callback to ``PagingWrapper``.
 
     Usage:
 
@@ -59,13 +75,30 @@ class PrincipalResolver:
     def __init__(self, key: str, use_urns: bool = True) -> None:
         self.key = key
         self.use_urns = use_urns
-        self._idmap: globus_sdk.IdentityMap | None = None
+        # the state used outside of a command
+        self._default_state = _ResolverState()
+
+    def _state(self) -> _ResolverState:
+        """
+        Get the state of this resolver for the running command, which is stored on
+        the command's root context. Each command (and each thread running one)
+        starts with no identities, and looks them up as the current user.
+        """
+        ctx = click.get_current_context(silent=True)
+        if ctx is None:
+            return self._default_state
+        states = ctx.find_root().meta.setdefault(__name__, {})
+        return t.cast(_ResolverState, states.setdefault(self, _ResolverState()))
 
     @property
-    def idmap(self) -> globus_sdk.IdentityMap:
-        if not self._idmap:
-            self._idmap = globus_sdk.IdentityMap(LoginManager().get_auth_client())
-        return self._idmap
+    def idmap(self) -> CachedIdentityMap:
+        state = self._state()
+        if not state.idmap:
+            state.idmap = CachedIdentityMap(
+                LoginManager().get_auth_client(), state.pending
+            )
+            state.pending = []
+        return state.idmap
 
     def _raw_id_from_object(self, obj: DATA_CONTAINER_T) -> tuple[str, str]:
         """
@@ -96,17 +129,26 @@ class PrincipalResolver:
         # but default to the original value if this doesn't resolve
         return t.cast(str, self.idmap.get(value, {}).get("username", original))
 
-    # TODO: In gcs-cli, page_callback is suported by the pretty printer. In globus-cli,
-    # we should attach this to the PagingWrapper. The purpose is to get the map
-    # populated on a per-page basis.
     def page_callback(self, data_page: t.Iterable[DATA_CONTAINER_T]) -> None:
+        """
+        Add all of the principals in a page of results to the map, so that they are
+        resolved in bulk when the first of them is looked up.
+
+        Pass this in the ``page_callbacks`` of a ``PagingWrapper``.
+        """
+        state = self._state()
         for item in data_page:
             try:
                 _original, value = self._raw_id_from_object(item)
             except InvalidPrincipalError:
                 continue
 
-            self.idmap.add(value)
+            # the idmap (and an auth client) is only built if a field is rendered,
+            # so that e.g. JSON output never requires an auth login
+            if state.idmap:
+                state.idmap.add(value)
+            else:
+                state.pending.append(value)
 
 
 default_principal_resolver = PrincipalResolver("principal")
@@ -1,7 +1,18 @@
+from __future__ import annotations
+
+import typing as t
 import uuid
 
 import globus_sdk
 
+from globus_cli.login_manager import identity_cache
+
+# the maximum number of IDs or usernames sent in one call to get identities, which
+# keeps the URL of each call well under common length limits
+GET_IDENTITIES_CHUNK_SIZE = 100
+# the number of calls to get identities which may be made at once
+GET_IDENTITIES_WORKERS = 4
+
 
 def _is_uuid(s):
     try:
@@ -40,3 +51,158 @@ class CustomAuthClient(globus_sdk.AuthClient):
 
     def lookup_identity_name(self, identity_id):
         return self._lookup_identity_field(id_id=identity_id, field="username")
+
+    def get_identities_in_chunks(
+        self,
+        *,
+        ids: t.Iterable[str] = (),
+        usernames: t.Iterable[str] = (),
+        provision: bool = False,
+        max_workers: int = GET_IDENTITIES_WORKERS,
+    ) -> list[dict[str, t.Any]]:
+        """
+        Look up any number of identities, by ID and by username.
+
+        Duplicate values are dropped, and the rest are split into chunks of at most
+        ``GET_IDENTITIES_CHUNK_SIZE``, which are looked up concurrently. The
+        identities are returned in the order of the chunks in which they were found,
+        IDs first.
+
+        :param ids: Identity IDs to look up
+        :param usernames: Usernames to look up
+        :param provision: Provision identities for usernames which have none
+        :param max_workers: The maximum number of concurrent calls to make
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        chunks: list[dict[str, t.Any]] = []
+        for key, values in (("ids", ids), ("usernames", usernames)):
+            unique = list(dict.fromkeys(values))
+            for start in range(0, len(unique), GET_IDENTITIES_CHUNK_SIZE):
+                chunk = unique[start : start + GET_IDENTITIES_CHUNK_SIZE]
+                chunks.append({key: chunk, "provision": provision})
+
+        def fetch(kwargs: dict[str, t.Any]) -> list[dict[str, t.Any]]:
+            return t.cast(
+                t.List[t.Dict[str, t.Any]], self.get_identities(**kwargs)["identities"]
+            )
+
+        if len(chunks) <= 1 or max_workers <= 1:
+            results = [fetch(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(fetch, chunks))
+        return [identity for result in results for identity in result]
+
+
+class _IdentityCacheMapping(t.MutableMapping[str, t.Dict[str, t.Any]]):
+    """
+    The identities known to a CachedIdentityMap, keyed by both ID and username.
+
+    Keys which the map expects to look up are checked in the identity cache in bulk
+    when the first of them is needed. Keys which are known to have no identity are
+    tracked separately, since the mapping only holds identity records.
+    """
+
+    def __init__(self) -> None:
+        self._identities: dict[str, dict[str, t.Any]] = {}
+        self.missing: set[str] = set()
+        self._checked: set[str] = set()
+        self._unchecked: set[str] = set()
+
+    def expect(self, keys: t.Iterable[str]) -> None:
+        self._unchecked.update(key for key in keys if key not in self._checked)
+
+    def load(self, key: str) -> None:
+        """
+        Check the identity cache for a key, along with every other key which is
+        expected and has not been checked yet.
+        """
+        keys = (self._unchecked | {key}) - self._checked
+        self._unchecked = set()
+        if not keys:
+            return
+        self._checked |= keys
+        for value, identity in identity_cache().get_many(keys).items():
+            if identity is None:
+                self.missing.add(value)
+            else:
+                self._identities[value] = identity
+
+    def __getitem__(self, key: str) -> dict[str, t.Any]:
+        return self._identities[key]
+
+    def __setitem__(self, key: str, value: dict[str, t.Any]) -> None:
+        self._identities[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._identities[key]
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._identities)
+
+    def __len__(self) -> int:
+        return len(self._identities)
+
+
+class _CachingIdentityLookups:
+    """
+    Make get_identities calls with an auth client, saving the results (including the
+    IDs and usernames for which no identity was found) to the identity cache.
+    """
+
+    def __init__(
+        self, auth_client: globus_sdk.AuthClient, identities: _IdentityCacheMapping
+    ) -> None:
+        self.auth_client = auth_client
+        self.identities = identities
+
+    def get_identities(self, **kwargs: t.Any) -> globus_sdk.GlobusHTTPResponse:
+        values = set(kwargs.get("usernames") or ()) | set(kwargs.get("ids") or ())
+        response = self.auth_client.get_identities(**kwargs)
+        found = response["identities"]
+        missing = values - {x["id"] for x in found} - {x["username"] for x in found}
+        self.identities.missing |= missing
+        identity_cache().store(found, missing)
+        return response
+
+
+class CachedIdentityMap(globus_sdk.IdentityMap):
+    """
+    An IdentityMap which uses the CLI's identity cache.
+
+    The first lookup checks the cache for every ID and username which has been
+    added to the map, in bulk. Only the remainder are looked up in Globus Auth, and
+    the results of those lookups (including any lookups which found no identity) are
+    saved to the cache.
+    """
+
+    def __init__(
+        self,
+        auth_client: globus_sdk.AuthClient,
+        identity_ids: t.Iterable[str] | None = None,
+        *,
+        id_batch_size: int | None = None,
+    ) -> None:
+        identity_ids = list(identity_ids or ())
+        self._identities = _IdentityCacheMapping()
+        self._identities.expect(identity_ids)
+        super().__init__(
+            t.cast(
+                globus_sdk.AuthClient,
+                _CachingIdentityLookups(auth_client, self._identities),
+            ),
+            identity_ids,
+            id_batch_size=id_batch_size,
+            cache=self._identities,
+        )
+
+    def add(self, identity_id: str) -> bool:
+        self._identities.expect([identity_id])
+        return super().add(identity_id)
+
+    def __getitem__(self, key: str) -> t.Any:
+        self._identities.load(key)
+        if key in self._identities.missing:
+            raise KeyError(key)
+        return super().__getitem__(key)
@@ -76,3 +76,11 @@ class CustomGCSClient(globus_sdk.GCSClient):
     def __init__(self, *args, source_epish=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.source_epish = source_epish
+
+    def delete_collection(self, collection_id, *args, **kwargs):
+        from globus_cli.endpointish import endpoint_cache, endpoint_type_cache
+
+        res = super().delete_collection(collection_id, *args, **kwargs)
+        endpoint_cache().invalidate(collection_id)
+        endpoint_type_cache().invalidate(collection_id)
+        return res
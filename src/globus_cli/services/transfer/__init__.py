@@ -8,10 +8,13 @@ from .data import (
     add_batch_to_transfer_data,
     assemble_generic_doc,
     display_name_or_cname,
+    iter_batch_transfer_shards,
+    iter_response_data,
     iterable_response_to_dict,
 )
 from .delegate_proxy import fill_delegate_proxy_activation_requirements
-from .recursive_ls import RecursiveLsResponse
+from .recursive_ls import RecursiveLsCheckpoint, RecursiveLsResponse
+from .sync_plan import SyncPlan
 
 ENDPOINT_LIST_FIELDS = (
     ("ID", "id"),
@@ -23,13 +26,17 @@ ENDPOINT_LIST_FIELDS = (
 __all__ = (
     "ENDPOINT_LIST_FIELDS",
     "CustomTransferClient",
+    "RecursiveLsCheckpoint",
     "RecursiveLsResponse",
+    "SyncPlan",
     "supported_activation_methods",
     "activation_requirements_help_text",
     "autoactivate",
     "fill_delegate_proxy_activation_requirements",
     "display_name_or_cname",
+    "iter_response_data",
     "iterable_response_to_dict",
     "assemble_generic_doc",
     "add_batch_to_transfer_data",
+    "iter_batch_transfer_shards",
 )
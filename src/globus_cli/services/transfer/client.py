@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import collections
 import logging
 import textwrap
 import typing as t
@@ -14,13 +15,17 @@ from globus_sdk.transport import (
     set_retry_check_flags,
 )
 
+from globus_cli.endpointish import endpoint_cache, endpoint_type_cache
 from globus_cli.login_manager import get_client_login, is_client_login
 
 from .data import display_name_or_cname
-from .recursive_ls import RecursiveLsResponse
+from .recursive_ls import RecursiveLsCheckpoint, RecursiveLsResponse
 
 log = logging.getLogger(__name__)
 
+# the default number of transfer shards to submit concurrently
+SHARD_SUBMISSION_WORKERS = 4
+
 
 @set_retry_check_flags(RetryCheckFlags.RUN_ONCE)
 def _retry_client_consent(ctx: RetryContext) -> RetryCheckResult:
@@ -54,6 +59,8 @@ class CustomTransferClient(globus_sdk.TransferClient):
         endpoint_id: str | uuid.UUID,
         params: dict[str, t.Any],
         depth: int = 3,
+        max_workers: int = 1,
+        checkpoint: RecursiveLsCheckpoint | None = None,
     ) -> RecursiveLsResponse:
         """
         Makes recursive calls to ``GET /operation/endpoint/<endpoint_id>/ls``
@@ -67,29 +74,122 @@ class CustomTransferClient(globus_sdk.TransferClient):
             in params, the start path is determined by this endpoint.
         :param params: Parameters that will be passed through as query params.
         :param depth: The maximum file depth the recursive ls will go to.
+        :param max_workers: The maximum number of concurrent ls calls to make.
+        :param checkpoint: A checkpoint used to save (or resume) the listing's
+            progress.
         """
         endpoint_id = str(endpoint_id)
         log.info(
-            "TransferClient.recursive_operation_ls(%s, %s, %s)",
+            "TransferClient.recursive_operation_ls(%s, %s, %s, %s)",
             endpoint_id,
             depth,
             params,
+            max_workers,
+        )
+        return RecursiveLsResponse(
+            self,
+            endpoint_id,
+            params,
+            max_depth=depth,
+            max_workers=max_workers,
+            checkpoint=checkpoint,
         )
-        return RecursiveLsResponse(self, endpoint_id, params, max_depth=depth)
+
+    def submit_transfer_shards(
+        self,
+        shards: t.Iterable[globus_sdk.TransferData],
+        max_workers: int = SHARD_SUBMISSION_WORKERS,
+    ) -> t.Iterator[tuple[globus_sdk.TransferData, globus_sdk.GlobusHTTPResponse]]:
+        """
+        Submit many transfer tasks, producing (shard, response) pairs in the order
+        in which the shards were given.
+
+        Each shard is given its own submission ID before it is submitted, so that
+        the submission can be safely retried. At most ``max_workers`` shards are
+        submitted at once, and shards are only pulled from ``shards`` as there is
+        room for them, so a lazy iterable of shards is never read far ahead.
+
+        If a submission fails, no more shards are submitted, and the error is raised
+        once the shards which were already submitted have been produced.
+
+        :param shards: The TransferData documents to submit
+        :param max_workers: The maximum number of concurrent submissions to make
+        """
+        from concurrent.futures import Future, ThreadPoolExecutor
+
+        def submit(
+            shard: globus_sdk.TransferData,
+        ) -> globus_sdk.GlobusHTTPResponse:
+            if not shard.get("submission_id"):
+                shard["submission_id"] = self.get_submission_id()["value"]
+            return self.submit_transfer(shard)
+
+        shard_iter = iter(shards)
+        in_flight: collections.deque[
+            tuple[globus_sdk.TransferData, Future[globus_sdk.GlobusHTTPResponse]]
+        ] = collections.deque()
+        error: Exception | None = None
+
+        def drain(
+            limit: int,
+        ) -> t.Iterator[tuple[globus_sdk.TransferData, globus_sdk.GlobusHTTPResponse]]:
+            nonlocal error
+            while len(in_flight) > limit:
+                done_shard, future = in_flight.popleft()
+                try:
+                    res = future.result()
+                except Exception as err:
+                    error = error or err
+                    continue
+                yield done_shard, res
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            while error is None:
+                # errors in producing shards (e.g. invalid batch input) also stop
+                # submission, but only after the shards in flight are reported
+                try:
+                    shard = next(shard_iter)
+                except StopIteration:
+                    break
+                except Exception as err:
+                    error = err
+                    break
+                in_flight.append((shard, executor.submit(submit, shard)))
+                yield from drain(max_workers - 1)
+            yield from drain(0)
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+        if error is not None:
+            raise error
+
+    def update_endpoint(self, endpoint_id, *args, **kwargs):
+        res = super().update_endpoint(endpoint_id, *args, **kwargs)
+        endpoint_cache().invalidate(endpoint_id)
+        return res
+
+    def delete_endpoint(self, endpoint_id, *args, **kwargs):
+        res = super().delete_endpoint(endpoint_id, *args, **kwargs)
+        endpoint_cache().invalidate(endpoint_id)
+        endpoint_type_cache().invalidate(endpoint_id)
+        return res
 
     def get_endpoint_w_server_list(
         self, endpoint_id
-    ) -> tuple[globus_sdk.GlobusHTTPResponse, str | globus_sdk.GlobusHTTPResponse]:
+    ) -> tuple[dict[str, t.Any], str | globus_sdk.GlobusHTTPResponse]:
         """
         A helper for handling endpoint server list lookups correctly accounting
         for various endpoint types.
 
         - Raises click.UsageError when used on Shares
-        - Returns (<get_endpoint_response>, "S3") for S3 endpoints
-        - Returns (<get_endpoint_response>, <server_list_response>) for all other
+        - Returns (<endpoint_document>, "S3") for S3 endpoints
+        - Returns (<endpoint_document>, <server_list_response>) for all other
           Endpoints
         """
-        endpoint = self.get_endpoint(endpoint_id)
+        endpoint = endpoint_cache().get(self, endpoint_id)
 
         if endpoint["host_endpoint_id"]:  # not GCS -- this is a share endpoint
             raise click.UsageError(
@@ -103,7 +203,7 @@ class CustomTransferClient(globus_sdk.TransferClient):
                 To list the servers on the share's host endpoint, use
                     globus endpoint server list {host_endpoint_id}
             """
-                ).format(display_name_or_cname(endpoint), **endpoint.data)
+                ).format(display_name_or_cname(endpoint), **endpoint)
             )
 
         if endpoint["s3_url"]:  # not GCS -- legacy S3 endpoint type
@@ -3,12 +3,41 @@ from __future__ import annotations
 import typing as t
 import uuid
 
-import click
 import globus_sdk
 
 from globus_cli.constants import EXPLICIT_NULL
-from globus_cli.parsing import TaskPath, mutex_option_group
-from globus_cli.utils import shlex_process_stream
+from globus_cli.parsing import BatchInputParser, resolve_task_path
+
+
+def iter_batch_transfer_items(
+    source_base_path: str | None,
+    dest_base_path: str | None,
+    batch: t.TextIO,
+) -> t.Iterator[dict[str, t.Any]]:
+    """
+    Lazily parse lines of batch input, producing the keyword arguments for
+    `TransferData.add_item` for each one (other than `checksum_algorithm`).
+
+    Lines are of the form
+      [--recursive] [--external-checksum TEXT] SOURCE_PATH DEST_PATH
+    """
+    parser = BatchInputParser(
+        ("source_path", "dest_path"),
+        flags={"--recursive": "recursive", "-r": "recursive"},
+        options={"--external-checksum": "external_checksum"},
+        mutually_exclusive=[("recursive", "external_checksum")],
+    )
+    for item in parser.iter_parsed(batch):
+        yield {
+            "source_path": resolve_task_path(
+                item["source_path"], base_dir=source_base_path
+            ),
+            "destination_path": resolve_task_path(
+                item["dest_path"], base_dir=dest_base_path
+            ),
+            "external_checksum": item["external_checksum"],
+            "recursive": item["recursive"],
+        }
 
 
 def add_batch_to_transfer_data(
@@ -18,42 +47,56 @@ def add_batch_to_transfer_data(
     transfer_data: globus_sdk.TransferData,
     batch: t.TextIO,
 ) -> None:
-    @click.command()
-    @click.option("--external-checksum")
-    @click.option("--recursive", "-r", is_flag=True)
-    @click.argument("source_path", type=TaskPath(base_dir=source_base_path))
-    @click.argument("dest_path", type=TaskPath(base_dir=dest_base_path))
-    @mutex_option_group("--recursive", "--external-checksum")
-    def process_batch_line(dest_path, source_path, recursive, external_checksum):
-        """
-        Parse a line of batch input and turn it into a transfer submission
-        item.
-        """
-        transfer_data.add_item(
-            str(source_path),
-            str(dest_path),
-            external_checksum=external_checksum,
-            checksum_algorithm=checksum_algorithm,
-            recursive=recursive,
-        )
-
-    shlex_process_stream(process_batch_line, batch)
+    """
+    Parse lines of batch input and turn them into transfer submission items.
+    """
+    for item in iter_batch_transfer_items(source_base_path, dest_base_path, batch):
+        transfer_data.add_item(**item, checksum_algorithm=checksum_algorithm)
+
+
+def iter_batch_transfer_shards(
+    source_base_path: str | None,
+    dest_base_path: str | None,
+    checksum_algorithm: str | None,
+    make_transfer_data: t.Callable[[], globus_sdk.TransferData],
+    batch: t.TextIO,
+    max_items: int,
+) -> t.Iterator[globus_sdk.TransferData]:
+    """
+    Parse lines of batch input into a series of TransferData objects, each with at
+    most `max_items` items. `make_transfer_data` is called to create each one.
+
+    Each shard is produced as soon as it is full, so only one shard of the batch
+    is held in memory at a time by this iterator.
+    """
+    shard = None
+    for item in iter_batch_transfer_items(source_base_path, dest_base_path, batch):
+        if shard is None:
+            shard = make_transfer_data()
+        shard.add_item(**item, checksum_algorithm=checksum_algorithm)
+        if len(shard["DATA"]) >= max_items:
+            yield shard
+            shard = None
+    if shard is not None:
+        yield shard
 
 
 def display_name_or_cname(ep_doc):
     return ep_doc["display_name"] or ep_doc["canonical_name"]
 
 
-def iterable_response_to_dict(iterator):
-    output_dict = {"DATA": []}
+def iter_response_data(iterator):
     for item in iterator:
         dat = item
         try:
             dat = item.data
         except AttributeError:
             pass
-        output_dict["DATA"].append(dat)
-    return output_dict
+        yield dat
+
+
+def iterable_response_to_dict(iterator):
+    return {"DATA": list(iter_response_data(iterator))}
 
 
 def assemble_generic_doc(datatype, **kwargs):
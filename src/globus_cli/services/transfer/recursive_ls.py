@@ -9,29 +9,229 @@ from collections import deque
 
 import globus_sdk
 
+if t.TYPE_CHECKING:
+    from concurrent.futures import Future
+
 log = logging.getLogger(__name__)
 
 ITEM_T = t.Dict[str, t.Any]
 QUEUE_T = t.Deque[t.Tuple[t.Optional[str], str, int]]
+# queue entries for the concurrent traversal also carry the (possibly pending)
+# operation_ls call which was started for the directory
+CONCURRENT_QUEUE_T = t.List[
+    t.Tuple[
+        t.Optional[str], str, int, t.Optional["Future[globus_sdk.GlobusHTTPResponse]"]
+    ]
+]
 
 # constants for controlling client-side rate limiting
-SLEEP_FREQUENCY = 25
-SLEEP_LEN = 1
+# the limiter starts out allowing INITIAL_RATE calls per second, with bursts of up
+# to BURST_SIZE calls
+INITIAL_RATE = 25.0
+MIN_RATE = 0.5
+MAX_RATE = 100.0
+BURST_SIZE = 25
+# while calls complete in under HEALTHY_LATENCY seconds, the rate is increased by
+# RATE_INCREASE each call; when the endpoint is throttling us, it is multiplied by
+# RATE_DECREASE_FACTOR
+HEALTHY_LATENCY = 1.0
+RATE_INCREASE = 0.5
+RATE_DECREASE_FACTOR = 0.5
+# the number of times a single listing is retried after being throttled
+MAX_THROTTLE_RETRIES = 3
+
+# constants for controlling how often checkpoints are saved
+CHECKPOINT_INTERVAL = 100
+CHECKPOINT_SECONDS = 30.0
+
+
+def _is_throttling_error(err: globus_sdk.GlobusAPIError) -> bool:
+    """
+    Errors which indicate that the service or the endpoint is overloaded, and
+    that we should slow down.
+    """
+    return err.http_status in (429, 502) or err.code == "ExternalError"
+
+
+class _AdaptiveRateLimiter:
+    """
+    A token-bucket rate limiter whose rate is adjusted with an additive-increase,
+    multiplicative-decrease (AIMD) policy.
+
+    Callers ``acquire()`` before each call, and report on its outcome with
+    ``record_success()`` or ``record_throttled()``.
+    This is safe to share between threads.
+    """
+
+    def __init__(self) -> None:
+        import threading
 
+        self._lock = threading.Lock()
+        self._rate = INITIAL_RATE
+        self._tokens = float(BURST_SIZE)
+        self._last_refill = time.monotonic()
 
-def _client_side_limiter() -> t.Iterator[None]:
-    counter = 0
-    while True:
-        counter += 1
-        # rate limit based on number of ls calls we have made
-        if counter % SLEEP_FREQUENCY == 0:
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def _set_rate(self, rate: float) -> None:
+        rate = min(max(rate, MIN_RATE), MAX_RATE)
+        if rate != self._rate:
+            log.debug(
+                "recursive_operation_ls rate limit is now %.2f calls/second", rate
+            )
+        self._rate = rate
+
+    def acquire(self) -> None:
+        """
+        Take a token from the bucket, sleeping if none is available.
+
+        Tokens are reserved under the lock, but the sleep happens outside of it, so
+        that concurrent callers each wait for their own slot.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(BURST_SIZE),
+                self._tokens + (now - self._last_refill) * self._rate,
+            )
+            self._last_refill = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
             log.debug(
-                "recursive_operation_ls sleeping %s seconds to rate limit itself.",
-                SLEEP_LEN,
+                "recursive_operation_ls sleeping %.3f seconds to rate limit itself.",
+                wait,
             )
-            time.sleep(SLEEP_LEN)
+            time.sleep(wait)
 
-        yield
+    def record_success(self, latency: float) -> None:
+        if latency < HEALTHY_LATENCY:
+            with self._lock:
+                self._set_rate(self._rate + RATE_INCREASE)
+
+    def record_throttled(self) -> None:
+        with self._lock:
+            self._set_rate(self._rate * RATE_DECREASE_FACTOR)
+            # drop any saved-up burst, so that the new rate takes effect at once
+            self._tokens = min(self._tokens, 0.0)
+
+
+class RecursiveLsCheckpoint:
+    """
+    An on-disk checkpoint of the progress of a recursive ls, used to continue a
+    listing which was interrupted.
+
+    The checkpoint records the queue of directories which have yet to be listed
+    and the number of directories which have been listed and fully yielded. It is
+    saved every ``CHECKPOINT_INTERVAL`` directories or ``CHECKPOINT_SECONDS``
+    seconds, whichever comes first, and when the listing stops (because of an
+    error, or because iteration stopped early).
+    A directory which was being yielded when the listing stopped is listed again
+    on resume, so resumed output may repeat some of the last entries. If the
+    process is killed, so that no final save is made, all entries yielded since
+    the last periodic save are repeated.
+
+    :param filename: The file in which the checkpoint is stored
+    :param endpoint_id: The endpoint being recursively ls'ed
+    :param ls_params: The query params of the listing. Used, along with
+        ``endpoint_id`` and ``max_depth``, to check that a checkpoint is resumed by
+        the same listing which wrote it.
+    :param max_depth: The maximum depth of the listing
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        filename: str,
+        endpoint_id: str,
+        ls_params: dict[str, t.Any],
+        max_depth: int,
+    ) -> None:
+        self.filename = filename
+        self._identity = {
+            "endpoint_id": str(endpoint_id),
+            "ls_params": dict(ls_params),
+            "max_depth": max_depth,
+        }
+        self._last_save = time.monotonic()
+        self._unsaved_count = 0
+
+        # state loaded from the file, if any
+        self.queue: list[tuple[str | None, str, int]] | None = None
+        self.listed = 0
+
+    def load(self) -> None:
+        """
+        Load the checkpoint from disk.
+
+        :raises ValueError: if the file does not contain a checkpoint for this
+            listing
+        """
+        import json
+
+        try:
+            with open(self.filename) as fp:
+                doc = json.load(fp)
+        except (OSError, ValueError) as err:
+            raise ValueError(
+                f"Could not read checkpoint file '{self.filename}': {err}"
+            ) from err
+
+        if not isinstance(doc, dict) or doc.get("version") != self.VERSION:
+            raise ValueError(f"'{self.filename}' is not a recursive ls checkpoint file")
+        if {k: doc.get(k) for k in self._identity} != self._identity:
+            raise ValueError(
+                f"Checkpoint file '{self.filename}' was written by a different "
+                "listing. The endpoint, path, and listing options must match."
+            )
+
+        self.listed = doc["listed"]
+        self.queue = [
+            (abs_path, rel_path, depth) for abs_path, rel_path, depth in doc["queue"]
+        ]
+        log.info(
+            "Loaded recursive ls checkpoint: %d directories listed, %d to go",
+            self.listed,
+            len(self.queue),
+        )
+
+    def save(self, queue: t.Iterable[tuple[str | None, str, int]], listed: int) -> None:
+        """
+        Write the checkpoint to disk. The file is replaced atomically, so a
+        listing which is stopped during a save leaves the previous checkpoint in
+        place.
+        """
+        import json
+        import os
+
+        doc = {
+            "version": self.VERSION,
+            **self._identity,
+            "queue": [list(entry) for entry in queue],
+            "listed": listed,
+        }
+        tmp_filename = self.filename + ".tmp"
+        with open(tmp_filename, "w") as fp:
+            json.dump(doc, fp)
+        os.replace(tmp_filename, self.filename)
+
+        self._last_save = time.monotonic()
+        self._unsaved_count = 0
+        log.debug("Saved recursive ls checkpoint to '%s'", self.filename)
+
+    def record_progress(self) -> bool:
+        """
+        Record that a directory was completed, and return True if a save is due.
+        """
+        self._unsaved_count += 1
+        return (
+            self._unsaved_count >= CHECKPOINT_INTERVAL
+            or time.monotonic() - self._last_save >= CHECKPOINT_SECONDS
+        )
 
 
 class RecursiveLsResponse:
@@ -43,7 +243,9 @@ class RecursiveLsResponse:
 
     Uses an internal queue for BFS of the filesystem.
 
-    Rate limits calls to reduce the changes of connection errors.
+    Rate limits calls to reduce the changes of connection errors. The rate
+    increases while the endpoint responds quickly, and backs off when it signals
+    that it is overloaded.
 
     :param client: `TransferClient`` used for making the operation_ls calls.
     :param endpoint_id: The endpoint that will be recursively ls'ed.
@@ -51,6 +253,12 @@ class RecursiveLsResponse:
     :param max_depth: The maximum depth the recursive ls will go into the filesys
     :param filter_after_first: If True, any filter in ``ls_params`` will be applied
         to all calls. If False, any filter will be removed after the first ls.
+    :param max_workers: The maximum number of operation_ls calls which may be in
+        flight at once. With the default of 1, directories are listed one at a
+        time. Regardless of this value, items are yielded in the same order.
+    :param checkpoint: If given, progress is periodically saved to this
+        checkpoint. If the checkpoint has been loaded, the listing continues from
+        its saved state.
     """
 
     def __init__(
@@ -61,12 +269,20 @@ class RecursiveLsResponse:
         *,
         max_depth: int = 3,
         filter_after_first: bool = True,
+        max_workers: int = 1,
+        checkpoint: RecursiveLsCheckpoint | None = None,
     ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
         self._client = client
         self._endpoint_id = endpoint_id
         self._ls_params = ls_params
         self._max_depth = max_depth
         self._filter_after_first = filter_after_first
+        self._max_workers = max_workers
+        self._limiter = _AdaptiveRateLimiter()
+        self._checkpoint = checkpoint
 
         start_path = t.cast(t.Optional[str], ls_params.get("path"))
         log.info(
@@ -75,8 +291,22 @@ class RecursiveLsResponse:
             endpoint_id,
         )
 
+        # the queue of (absolute_path, relative_path, depth) tuples to list and the
+        # number of directories which have already been listed
+        # initialized with the start path (if any) and a depth of 0, unless the
+        # listing is being resumed from a checkpoint
+        if checkpoint is not None and checkpoint.queue is not None:
+            initial_queue = checkpoint.queue
+            listed = checkpoint.listed
+        else:
+            initial_queue = [(start_path, "", 0)]
+            listed = 0
+
         # call the iterable_func method to convert it to a generator expression
-        self._generator = self._iterable_func(start_path)
+        if max_workers == 1:
+            self._generator = self._iterable_func(initial_queue, listed)
+        else:
+            self._generator = self._concurrent_iterable_func(initial_queue, listed)
 
         # grab the first element out of the internal iteration function
         # because this could raise a StopIteration exception, we need to be
@@ -94,7 +324,92 @@ class RecursiveLsResponse:
             yield self._first_elem
             yield from self._generator
 
-    def _iterable_func(self, start_path: str | None) -> t.Iterator[ITEM_T]:
+    def _params_for_path(
+        self, abs_path: str | None, is_first: bool
+    ) -> dict[str, t.Any]:
+        """
+        Build the operation_ls params for a single directory listing.
+
+        The params are copied so that listings which run concurrently never share
+        a mutable dict.
+        """
+        params = dict(self._ls_params)
+        # set the target path to the absolute path if it exists
+        if abs_path is not None:
+            params["path"] = abs_path
+        # if filter_after_first is False, stop filtering after the first
+        # ls call has been made
+        if not is_first and not self._filter_after_first:
+            params.pop("filter", None)
+        return params
+
+    def _list_dir(
+        self, abs_path: str | None, is_first: bool
+    ) -> globus_sdk.GlobusHTTPResponse:
+        """
+        Do the operation_ls for a single directory, reporting the outcome to the
+        rate limiter. Listings which are throttled are retried after backing off.
+
+        The caller is responsible for acquiring from the rate limiter before the
+        first attempt.
+        """
+        params = self._params_for_path(abs_path, is_first)
+        retries = 0
+        while True:
+            start = time.monotonic()
+            try:
+                res = self._client.operation_ls(self._endpoint_id, **params)
+            except globus_sdk.GlobusAPIError as err:
+                if not _is_throttling_error(err) or retries >= MAX_THROTTLE_RETRIES:
+                    raise
+                retries += 1
+                log.debug(
+                    "recursive_operation_ls throttled (%s, %s), retrying",
+                    err.http_status,
+                    err.code,
+                )
+                self._limiter.record_throttled()
+                self._limiter.acquire()
+                continue
+            self._limiter.record_success(time.monotonic() - start)
+            return res
+
+    def _child_entries(
+        self, res: globus_sdk.GlobusHTTPResponse, rel_path: str, depth: int
+    ) -> list[tuple[str, str, int]]:
+        """
+        Given the listing of a directory, get the (absolute_path, relative_path,
+        depth) tuples for its subdirectories which should be listed next.
+        """
+        # add to the queue if there are additional listings to do
+        # and we are not at the depth limit
+        if depth >= self._max_depth:
+            return []
+        # queue data includes the dir's name in the absolute and relative paths
+        # and increases the depth by one.
+        return [
+            (
+                res["path"] + item["name"],
+                (rel_path + "/" if rel_path else "") + item["name"],
+                depth + 1,
+            )
+            # data is reversed to maintain any "orderby" ordering
+            for item in reversed(res["DATA"])
+            if item["type"] == "dir"
+        ]
+
+    def _iter_items(
+        self, res: globus_sdk.GlobusHTTPResponse, rel_path: str
+    ) -> t.Iterator[ITEM_T]:
+        # for each item in the response data update the item's name with
+        # the relative path popped from the queue, and yield the item
+        for item in res["DATA"]:
+            item["name"] = (rel_path + "/" if rel_path else "") + item["name"]
+            yield t.cast(ITEM_T, item)
+
+    def _iterable_func(
+        self, initial_queue: list[tuple[str | None, str, int]], listed: int
+    ) -> t.Iterator[ITEM_T]:
         """
         An internal function which has generator semantics. Defined using the
         `yield` syntax.
@@ -103,57 +418,147 @@ class RecursiveLsResponse:
         We rely on the implicit StopIteration built into this type of function
         to propagate through the final `next()` call.
         """
-        # iterator used for client-side limiting
-        limiter = _client_side_limiter()
-
         # queue of (absolute_path, relative_path, depth) tuples.
-        dir_queue: QUEUE_T = deque()
-        # initialized with the start path (if any) and a depth of 0
-        dir_queue.append((start_path, "", 0))
+        dir_queue: QUEUE_T = deque(initial_queue)
+        # the directory being listed, and the number of its subdirectories which
+        # were queued, so that it can be put back if the listing stops
+        current: tuple[str | None, str, int] | None = None
+        num_children = 0
 
-        # BFS is not done until the queue is empty
-        while dir_queue:
-            next(limiter)
-            log.debug(
-                "recursive_operation_ls BFS queue not empty, getting next path now."
-            )
+        is_first = listed == 0
+        try:
+            # BFS is not done until the queue is empty
+            while dir_queue:
+                self._limiter.acquire()
+                log.debug(
+                    "recursive_operation_ls BFS queue not empty, getting next path now."
+                )
+
+                # get path and current depth from the queue
+                current = dir_queue.pop()
+                abs_path, rel_path, depth = current
+                num_children = 0
+
+                # do the operation_ls with the updated params
+                res = self._list_dir(abs_path, is_first)
+                is_first = False
 
-            # get path and current depth from the queue
-            abs_path, rel_path, depth = dir_queue.pop()
+                children = self._child_entries(res, rel_path, depth)
+                dir_queue.extend(children)
+                num_children = len(children)
+                yield from self._iter_items(res, rel_path)
 
-            # set the target path to the popped absolute path if it exists
-            if abs_path is not None:
-                self._ls_params["path"] = abs_path
+                current = None
+                listed += 1
+                if self._checkpoint and self._checkpoint.record_progress():
+                    self._checkpoint.save(dir_queue, listed)
+        finally:
+            if self._checkpoint is not None:
+                if current is not None:
+                    # the directory was not finished, so it is listed again (and
+                    # its subdirectories queued again) on resume
+                    for _ in range(num_children):
+                        dir_queue.pop()
+                    dir_queue.append(current)
+                self._checkpoint.save(dir_queue, listed)
 
-            # do the operation_ls with the updated params
-            res = self._client.operation_ls(self._endpoint_id, **self._ls_params)
-            res_data = res["DATA"]
+    def _concurrent_iterable_func(
+        self, initial_queue: list[tuple[str | None, str, int]], listed: int
+    ) -> t.Iterator[ITEM_T]:
+        """
+        A variant of ``_iterable_func`` which runs up to ``max_workers``
+        operation_ls calls at once on a thread pool.
+
+        The traversal order is the same as the serial one: the queue is consumed
+        in the same order, but the directories nearest the head of the queue are
+        listed ahead of time. Only the first ``max_workers`` entries at the head
+        of the queue are prefetched when a directory is consumed, so the number
+        of completed-but-unconsumed listings held in memory stays bounded by
+        ``max_workers`` per level of depth.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        # queue of (absolute_path, relative_path, depth, future) tuples, where the
+        # head of the queue is the end of the list
+        dir_queue: CONCURRENT_QUEUE_T = [
+            (abs_path, rel_path, depth, None)
+            for abs_path, rel_path, depth in initial_queue
+        ]
+
+        executor = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="globus-cli-recursive-ls",
+        )
+
+        def submit(abs_path: str | None, is_first: bool) -> Future:
+            self._limiter.acquire()
+            log.debug("recursive_operation_ls submitting listing of '%s'", abs_path)
+            return executor.submit(self._list_dir, abs_path, is_first)
+
+        def prefetch() -> None:
+            # walk from the head of the queue, up to max_workers entries
+            for idx in range(len(dir_queue) - 1, -1, -1)[: self._max_workers]:
+                abs_path, rel_path, depth, future = dir_queue[idx]
+                if future is None:
+                    dir_queue[idx] = (
+                        abs_path,
+                        rel_path,
+                        depth,
+                        submit(abs_path, False),
+                    )
+
+        def checkpoint_queue() -> list[tuple[str | None, str, int]]:
+            return [entry[:3] for entry in dir_queue]
+
+        # the directory being listed, and the number of its subdirectories which
+        # were queued, so that it can be put back if the listing stops
+        current: tuple[str | None, str, int] | None = None
+        num_children = 0
+
+        try:
+            if listed == 0:
+                # the first listing is submitted alone, as it may be the only one
+                # which applies a filter
+                abs_path, rel_path, depth, _ = dir_queue.pop()
+                dir_queue.append((abs_path, rel_path, depth, submit(abs_path, True)))
+            else:
+                prefetch()
+
+            while dir_queue:
+                log.debug(
+                    "recursive_operation_ls BFS queue not empty, getting next path now."
+                )
+                abs_path, rel_path, depth, future = dir_queue.pop()
+                current = (abs_path, rel_path, depth)
+                num_children = 0
+                assert future is not None
+                res = future.result()
 
-            # add to the queue if there are additional listings to do
-            # and we are not at the depth limit
-            if depth < self._max_depth:
-                # queue data includes the dir's name in the absolute and relative paths
-                # and increases the depth by one.
+                children = self._child_entries(res, rel_path, depth)
                 dir_queue.extend(
-                    [
-                        (
-                            res["path"] + item["name"],
-                            (rel_path + "/" if rel_path else "") + item["name"],
-                            depth + 1,
-                        )
-                        # data is reversed to maintain any "orderby" ordering
-                        for item in reversed(res_data)
-                        if item["type"] == "dir"
-                    ]
+                    (child_abs_path, child_rel_path, child_depth, None)
+                    for (child_abs_path, child_rel_path, child_depth) in children
                 )
+                num_children = len(children)
+                prefetch()
 
-            # if filter_after_first is False, stop filtering after the first
-            # ls call has been made
-            if not self._filter_after_first:
-                self._ls_params.pop("filter", None)
+                yield from self._iter_items(res, rel_path)
 
-            # for each item in the response data update the item's name with
-            # the relative path popped from the queue, and yield the item
-            for item in res_data:
-                item["name"] = (rel_path + "/" if rel_path else "") + item["name"]
-                yield t.cast(ITEM_T, item)
+                current = None
+                listed += 1
+                if self._checkpoint and self._checkpoint.record_progress():
+                    self._checkpoint.save(checkpoint_queue(), listed)
+        finally:
+            if self._checkpoint is not None:
+                if current is not None:
+                    # the directory was not finished, so it is listed again (and
+                    # its subdirectories queued again) on resume
+                    del dir_queue[len(dir_queue) - num_children :]
+                    dir_queue.append((*current, None))
+                self._checkpoint.save(checkpoint_queue(), listed)
+            # if iteration stops early (e.g. an error was raised), cancel any
+            # listings which have not started and do not wait on the others
+            for *_, future in dir_queue:
+                if future is not None:
+                    future.cancel()
+            executor.shutdown(wait=False)
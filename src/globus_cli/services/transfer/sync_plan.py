@@ -0,0 +1,212 @@
+"""
+Client-side planning of incremental transfers.
+
+A sync plan compares recursive listings of a source and destination directory,
+and produces only the files which need to be transferred. This avoids asking the
+service to walk (and compare) every file in two large, mostly unchanged trees.
+"""
+from __future__ import annotations
+
+import datetime
+import fnmatch
+import queue
+import sys
+import threading
+import typing as t
+
+import globus_sdk
+
+if t.TYPE_CHECKING:
+    from .client import CustomTransferClient
+
+# sync plans compare the whole tree, so the listings are not depth limited
+SYNC_PLAN_MAX_DEPTH = sys.maxsize
+# the number of concurrent ls calls made for each of the two listings
+SYNC_PLAN_LIST_WORKERS = 4
+# the number of listed items which may be buffered from each listing before the
+# listing waits for the comparison to catch up
+SYNC_PLAN_BUFFER_SIZE = 10000
+
+_SOURCE = 0
+_DEST = 1
+# sentinel put on the queue when a listing is done
+_DONE = object()
+
+
+def _parse_mtime(value: str) -> datetime.datetime:
+    # Transfer gives times like "2017-06-12 15:51:53+00:00"
+    return datetime.datetime.fromisoformat(value)
+
+
+def needs_transfer(
+    source_item: dict[str, t.Any], dest_item: dict[str, t.Any] | None, sync_level: str
+) -> bool:
+    """
+    Decide if a source file needs to be transferred, given the destination file
+    with the same name (or None if there isn't one) and the sync level.
+
+    As with the sync levels used by the service, each level includes the checks of
+    the levels before it: "exists", then "size", then "mtime".
+    """
+    if dest_item is None or dest_item["type"] != source_item["type"]:
+        return True
+    if sync_level == "exists":
+        return False
+    if source_item.get("size") != dest_item.get("size"):
+        return True
+    if sync_level == "size":
+        return False
+    return _parse_mtime(source_item["last_modified"]) > _parse_mtime(
+        dest_item["last_modified"]
+    )
+
+
+def _is_excluded(name: str, exclude: t.Sequence[str]) -> bool:
+    # exclude patterns match against the name of a file or any of its parent
+    # directories, like the service's exclude filter rules
+    return any(
+        fnmatch.fnmatchcase(part, pattern)
+        for part in name.split("/")
+        for pattern in exclude
+    )
+
+
+class SyncPlan:
+    """
+    A plan for an incremental transfer from ``source_path`` to ``dest_path``.
+
+    Iterating over the plan lists both directories at the same time, in separate
+    threads, and produces ``(source_path, dest_path)`` pairs for each file which
+    needs to be transferred.
+
+    Both listings visit directories in the same order, so when the trees are mostly
+    the same, files arrive from both listings at nearly the same time. Each file
+    is compared as soon as it has been seen in both listings, and only the files
+    which have not yet been matched are held in memory. Source files which are
+    missing from the destination are only known once the destination listing
+    is complete; from then on, they are produced as soon as they are listed.
+
+    :param transfer_client: The client used for the listings
+    :param source_endpoint: The source endpoint ID
+    :param source_path: The source directory
+    :param dest_endpoint: The destination endpoint ID
+    :param dest_path: The destination directory, which need not exist
+    :param sync_level: "exists", "size", or "mtime", as for ``--sync-level``
+    :param exclude: Patterns for names of files and directories to skip
+    """
+
+    def __init__(
+        self,
+        transfer_client: CustomTransferClient,
+        source_endpoint: str,
+        source_path: str,
+        dest_endpoint: str,
+        dest_path: str,
+        *,
+        sync_level: str = "mtime",
+        exclude: t.Sequence[str] = (),
+    ) -> None:
+        self._client = transfer_client
+        self._endpoints = (source_endpoint, dest_endpoint)
+        self._paths = (
+            source_path if source_path.endswith("/") else source_path + "/",
+            dest_path if dest_path.endswith("/") else dest_path + "/",
+        )
+        self._sync_level = sync_level
+        self._exclude = exclude
+
+        # the number of files compared, and the number which need transfer
+        self.compared = 0
+        self.changed = 0
+
+    def _list(self, side: int, out: queue.Queue, stop: threading.Event) -> None:
+        try:
+            try:
+                listing = self._client.recursive_operation_ls(
+                    self._endpoints[side],
+                    {"path": self._paths[side]},
+                    depth=SYNC_PLAN_MAX_DEPTH,
+                    max_workers=SYNC_PLAN_LIST_WORKERS,
+                )
+            except globus_sdk.TransferAPIError as err:
+                # a missing destination directory is the same as an empty one
+                if side == _DEST and err.http_status == 404:
+                    out.put((side, _DONE))
+                    return
+                raise
+            for item in listing:
+                if stop.is_set():
+                    return
+                out.put((side, item))
+            out.put((side, _DONE))
+        except Exception as err:
+            out.put((side, err))
+
+    def __iter__(self) -> t.Iterator[tuple[str, str]]:
+        out: queue.Queue = queue.Queue(maxsize=2 * SYNC_PLAN_BUFFER_SIZE)
+        stop = threading.Event()
+        threads = [
+            threading.Thread(target=self._list, args=(side, out, stop), daemon=True)
+            for side in (_SOURCE, _DEST)
+        ]
+        for thread in threads:
+            thread.start()
+
+        # items seen in one listing, but not yet in the other, by name
+        unmatched: tuple[dict[str, t.Any], dict[str, t.Any]] = ({}, {})
+        done = [False, False]
+        try:
+            while not all(done):
+                side, item = out.get()
+                if item is _DONE:
+                    done[side] = True
+                    if side == _DEST:
+                        # the destination is complete, so any source file which
+                        # has not been matched is missing from it
+                        for name, source_item in unmatched[_SOURCE].items():
+                            if self._check(source_item, None):
+                                yield self._transfer_paths(name)
+                    unmatched[1 - side].clear()
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+
+                name = item["name"]
+                if item["type"] == "dir" or _is_excluded(name, self._exclude):
+                    continue
+                other = unmatched[1 - side].pop(name, None)
+                if other is None:
+                    if not done[1 - side]:
+                        unmatched[side][name] = item
+                    # the other listing is complete, so this item has no match
+                    # a source file is missing from the destination, and is
+                    # produced immediately
+                    elif side == _SOURCE and self._check(item, None):
+                        yield self._transfer_paths(name)
+                    continue
+
+                source_item, dest_item = (
+                    (item, other) if side == _SOURCE else (other, item)
+                )
+                if self._check(source_item, dest_item):
+                    yield self._transfer_paths(name)
+        finally:
+            stop.set()
+            # unblock any listing which is waiting on a full queue
+            while any(thread.is_alive() for thread in threads):
+                try:
+                    out.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+    def _check(
+        self, source_item: dict[str, t.Any], dest_item: dict[str, t.Any] | None
+    ) -> bool:
+        self.compared += 1
+        if needs_transfer(source_item, dest_item, self._sync_level):
+            self.changed += 1
+            return True
+        return False
+
+    def _transfer_paths(self, name: str) -> tuple[str, str]:
+        return (self._paths[_SOURCE] + name, self._paths[_DEST] + name)
@@ -4,12 +4,15 @@ from .context import (
     env_interactive,
     err_is_terminal,
     get_jmespath_expression,
+    help_content_width,
     is_verbose,
     out_is_terminal,
     outformat_is_json,
+    outformat_is_ndjson,
     outformat_is_text,
     outformat_is_unix,
     term_is_interactive,
+    terminal_size_queries,
     verbosity,
 )
 from .errors import PrintableErrorField, write_error_info
@@ -50,7 +53,10 @@ __all__ = [
     "env_interactive",
     "err_is_terminal",
     "term_is_interactive",
+    "help_content_width",
+    "terminal_size_queries",
     "outformat_is_json",
+    "outformat_is_ndjson",
     "outformat_is_text",
     "outformat_is_unix",
     "get_jmespath_expression",
@@ -1,12 +1,26 @@
 from __future__ import annotations
 
+import logging
 import os
+import shutil
 import sys
+import typing as t
 
 import click
 
 from globus_cli.parsing.command_state import CommandState
 
+log = logging.getLogger(__name__)
+
+# a count of the number of times that the size of the terminal has been queried
+# this is instrumentation, to ensure that only helptext rendering ever queries it
+_TERMINAL_SIZE_QUERIES = 0
+
+
+# stub to allow type casting of a function to an object with an attribute
+class _HelpWidthFuncProto:
+    _instance: "int | None"
+
 
 def outformat_is_json():
     """
@@ -26,6 +40,15 @@ def outformat_is_unix():
     return state.outformat_is_unix()
 
 
+def outformat_is_ndjson():
+    """
+    Only safe to call within a click context.
+    """
+    ctx = click.get_current_context()
+    state = ctx.ensure_object(CommandState)
+    return state.outformat_is_ndjson()
+
+
 def outformat_is_text():
     """
     Only safe to call within a click context.
@@ -70,17 +93,54 @@ def err_is_terminal():
     return sys.stderr.isatty()
 
 
+def terminal_size_queries() -> int:
+    """
+    Get the number of times that the size of the terminal has been queried.
+    """
+    return _TERMINAL_SIZE_QUERIES
+
+
+def help_content_width() -> int | None:
+    """
+    Get the maximum width for helptext, based on the size of the terminal.
+
+    The terminal is only queried the first time that this is called, so it should
+    only be called when helptext is actually rendered. None means that the size
+    could not be determined, and the default width should be used.
+    """
+    global _TERMINAL_SIZE_QUERIES
+
+    as_proto = t.cast(_HelpWidthFuncProto, help_content_width)
+    if not hasattr(as_proto, "_instance"):
+        _TERMINAL_SIZE_QUERIES += 1
+        log.debug("querying terminal size for helptext")
+        try:
+            cols = shutil.get_terminal_size(fallback=(80, 20)).columns
+            as_proto._instance = cols if cols < 100 else int(0.8 * cols)
+        except OSError:
+            as_proto._instance = None
+    return as_proto._instance
+
+
+def _strtobool(val: str) -> bool:
+    # equivalent to `distutils.util.strtobool`, which is slow to import (and
+    # removed in python 3.12)
+    if val in ("y", "yes", "t", "true", "on", "1"):
+        return True
+    if val in ("n", "no", "f", "false", "off", "0"):
+        return False
+    raise ValueError(f"invalid truth value {val!r}")
+
+
 def env_interactive() -> bool | None:
     """
     Check the `GLOBUS_CLI_INTERACTIVE` environment variable for a boolean, and *let*
     `strtobool` raise a `ValueError` if it doesn't parse.
     """
-    from distutils.util import strtobool
-
     explicit_val = os.getenv("GLOBUS_CLI_INTERACTIVE")
     if explicit_val is None:
         return None
-    return bool(strtobool(explicit_val.lower()))
+    return _strtobool(explicit_val.lower())
 
 
 def term_is_interactive() -> bool:
@@ -2,7 +2,7 @@ import json
 
 import click
 
-from .context import outformat_is_json
+from .context import outformat_is_json, outformat_is_ndjson
 
 
 class PrintableErrorField:
@@ -40,7 +40,16 @@ class PrintableErrorField:
 
 def write_error_info(error_name, fields, message=None):
 
-    if outformat_is_json():
+    if outformat_is_ndjson():
+        # one compact document, like the rest of the NDJSON output
+        message = json.dumps(
+            dict(
+                [("error_name", error_name)] + [(f.name, f.raw_value) for f in fields]
+            ),
+            separators=(",", ":"),
+            sort_keys=True,
+        )
+    elif outformat_is_json():
         # dictify joined tuple lists and dump to json string
         message = click.style(
             json.dumps(
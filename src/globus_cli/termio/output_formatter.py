@@ -1,3 +1,4 @@
+import itertools
 import json
 import textwrap
 
@@ -7,7 +8,12 @@ import globus_sdk
 from globus_cli.utils import CLIStubResponse
 
 from .awscli_text import unix_formatted_print
-from .context import get_jmespath_expression, outformat_is_json, outformat_is_unix
+from .context import (
+    get_jmespath_expression,
+    outformat_is_json,
+    outformat_is_ndjson,
+    outformat_is_unix,
+)
 
 FORMAT_SILENT = "silent"
 FORMAT_JSON = "json"
@@ -17,6 +23,11 @@ FORMAT_TEXT_RECORD_LIST = "text_record_list"
 FORMAT_TEXT_RAW = "text_raw"
 FORMAT_TEXT_CUSTOM = "text_custom"
 
+# the number of rows which table output reads ahead in order to size its columns
+# tables with more rows than this are printed as their rows are read, with columns
+# sized to fit the first TABLE_LOOKAHEAD_ROWS rows
+TABLE_LOOKAHEAD_ROWS = 1000
+
 
 class FormatField:
     """A field which will be shown in record or table output.
@@ -97,6 +108,12 @@ def print_json_response(res):
     click.echo(res)
 
 
+def print_ndjson_response(res):
+    res = _jmespath_preprocess(res)
+    res = json.dumps(res, separators=(",", ":"), sort_keys=True)
+    click.echo(res)
+
+
 def print_unix_response(res):
     res = _jmespath_preprocess(res)
     try:
@@ -144,31 +161,39 @@ def colon_formatted_print(data, fields):
         click.echo("{}{}".format((field.name + ":").ljust(maxlen), value))
 
 
-def print_table(iterable, fields, print_headers=True):
-    # the iterable may not be safe to walk multiple times, so we must walk it
-    # only once -- however, to let us write things naturally, convert it to a
-    # list and we can assume it is safe to walk repeatedly
-    iterable = list(iterable)
+def print_table(iterable, fields, print_headers=True, lookahead=TABLE_LOOKAHEAD_ROWS):
+    # the iterable may not be safe to walk multiple times, and may be very large or
+    # slow to produce (e.g. when it fetches pages of results), so walk it only once
+    # read ahead (up to `lookahead` rows) to size the columns, and then print rows
+    # as they are read
+    # if every row fits in the lookahead window, this is the same as reading the
+    # whole iterable before printing
+    #
+    # fields may be expensive to compute (e.g. they may parse dates or make API
+    # calls), so each cell is computed exactly once: the cells of the lookahead
+    # window are kept and used both to size the columns and to print those rows
+    iterator = iter(iterable)
+
+    def get_cells(item):
+        return tuple(f(item) for f in fields)
+
+    window = [get_cells(i) for i in itertools.islice(iterator, lookahead)]
 
     # extract headers and keys as separate lists
     headers = [f.name for f in fields]
 
-    # use the iterable to find the max width of an element for each column
+    # use the lookahead window to find the max width of an element for each column
     # use a special function to handle empty iterable
-    def get_max_colwidth(f):
-        def _safelen(x):
-            try:
-                return len(x)
-            except TypeError:
-                return len(str(x))
-
-        lengths = [_safelen(f(i)) for i in iterable]
-        if not lengths:
-            return 0
-        else:
-            return max(lengths)
+    def _safelen(x):
+        try:
+            return len(x)
+        except TypeError:
+            return len(str(x))
+
+    def get_max_colwidth(column):
+        return max((_safelen(cells[column]) for cells in window), default=0)
 
-    widths = [get_max_colwidth(f) for f in fields]
+    widths = [get_max_colwidth(column) for column in range(len(fields))]
     # handle the case in which the column header is the widest thing
     widths = [max(w, len(h)) for w, h in zip(widths, headers)]
 
@@ -197,8 +222,8 @@ def print_table(iterable, fields, print_headers=True):
         )
 
     # print the rows of data
-    for i in iterable:
-        click.echo(format_line([none_to_null(f(i)) for f in fields]))
+    for cells in itertools.chain(window, map(get_cells, iterator)):
+        click.echo(format_line([none_to_null(x) for x in cells]))
 
 
 def formatted_print(
@@ -210,6 +235,7 @@ def formatted_print(
     json_converter=None,
     fields=None,
     response_key=None,
+    ndjson_items=None,
 ):
     """
     A generic output formatter. Consumes the following pieces of data:
@@ -239,6 +265,12 @@ def formatted_print(
     printing, it must get an iterable out, and when used with raw printing, it
     gets a string. Necessary for certain formats like text table (text output
     only)
+
+    ``ndjson_items`` is a callable which takes ``response_data`` and produces an
+    iterator of documents. Each document is printed on its own line as soon as it
+    is produced, and any JMESPath expression is applied to each one. If it is not
+    given, the response (processed by ``json_converter``) is printed as a single
+    line (ndjson output only)
     """
 
     def _assert_fields():
@@ -253,6 +285,15 @@ def formatted_print(
             json_converter(response_data) if json_converter else response_data
         )
 
+    def _print_as_ndjson():
+        if ndjson_items is not None:
+            for item in ndjson_items(response_data):
+                print_ndjson_response(item)
+        else:
+            print_ndjson_response(
+                json_converter(response_data) if json_converter else response_data
+            )
+
     def _print_as_unix():
         print_unix_response(
             json_converter(response_data) if json_converter else response_data
@@ -319,6 +360,8 @@ def formatted_print(
 
     if outformat_is_json():
         _print_as_json()
+    elif outformat_is_ndjson():
+        _print_as_ndjson()
     elif outformat_is_unix():
         _print_as_unix()
     else:
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import contextlib
 import json
+import logging
+import sys
 import typing as t
 
 import click
 
 from globus_cli.types import DATA_CONTAINER_T, FIELD_LIST_T
 
+if t.TYPE_CHECKING:
+    from globus_sdk.paging import Paginator
+
 
 def get_current_option_help(
     *, filter_names: t.Iterable[str] | None = None
@@ -138,19 +144,40 @@ class CLIStubResponse:
 
 
 # wrap to add a `has_next()` method and `limit` param to a naive iterator
+#
+# a paginator may be passed instead of an iterator, in which case each page of
+# results is passed to the `page_callbacks` before any of its items are yielded
+# this lets callers do work in bulk for a whole page (e.g. resolving identities)
 class PagingWrapper:
     def __init__(
         self,
-        iterator: t.Iterator[t.Any],
+        iterator: t.Iterator[t.Any] | Paginator[t.Any],
         limit: int | None = None,
         json_conversion_key: str | None = None,
+        *,
+        page_callbacks: t.Sequence[t.Callable[[t.Iterable[t.Any]], None]] = (),
     ) -> None:
+        from globus_sdk.paging import Paginator
+
+        self.page_callbacks = list(page_callbacks)
+        if isinstance(iterator, Paginator):
+            iterator = self._iter_paginator_items(iterator)
+        elif self.page_callbacks:
+            raise ValueError("page_callbacks can only be used with a paginator")
+
         self.iterator = iterator
         self.next = None
         self.limit = limit
         self.json_conversion_key = json_conversion_key
         self._step()
 
+    def _iter_paginator_items(self, paginator: Paginator[t.Any]) -> t.Iterator[t.Any]:
+        for page in paginator.pages():
+            items = page[paginator.items_key]
+            for callback in self.page_callbacks:
+                callback(items)
+            yield from items
+
     def _step(self) -> None:
         try:
             self.next = next(self.iterator)
@@ -182,28 +209,84 @@ class PagingWrapper:
         return converter
 
 
-def shlex_process_stream(process_command: click.Command, stream: t.TextIO) -> None:
+def system_exit_code(code: t.Any) -> int:
+    """
+    Get the exit status for the code of a SystemExit, in the same way as the
+    interpreter does (printing the code if it is a message).
+
+    This is used when running commands in-process (e.g. in `globus daemon` and
+    `globus batch-run`).
+    """
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def command_name(argv: list[str], options_with_values: t.Container[str]) -> str | None:
+    """
+    Get the name of the command in argv (a 'globus' command line, without the
+    leading 'globus'), skipping any options (and their values) which come before it.
+
+    This is used to decide how to run a command before parsing it, e.g. in
+    `globus daemon` and `globus batch-run`.
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg == "--":
+            return next(args, None)
+        if not arg.startswith("-") or arg == "-":
+            return arg
+        if arg.startswith("--"):
+            takes_value = arg in options_with_values
+        else:
+            # short options may be combined, as in `-vF json`, where only the last
+            # one can be followed by a separate value
+            takes_value = f"-{arg[-1]}" in options_with_values and not any(
+                f"-{c}" in options_with_values for c in arg[1:-1]
+            )
+        if takes_value:
+            next(args, None)
+    return None
+
+
+def options_with_values(command: click.Command) -> list[str]:
+    """
+    Get the names of the options of a command which take a value.
+    """
+    return [
+        opt
+        for param in command.params
+        if isinstance(param, click.Option) and not (param.is_flag or param.count)
+        for opt in param.opts
+    ]
+
+
+@contextlib.contextmanager
+def preserve_logging() -> t.Iterator[None]:
     """
-    Use shlex to process stdin line-by-line.
-    Also prints help text.
+    Restore the configuration of all loggers on exit.
 
-    Requires that @process_command be a Click command object, used for
-    processing single lines of input. helptext is prepended to the standard
-    message printed to interactive sessions.
+    -v and --debug reconfigure logging for a command, which must not carry over to
+    later commands run in the same process.
     """
-    import shlex
-
-    # use readlines() rather than implicit file read line looping to force
-    # python to properly capture EOF (otherwise, EOF acts as a flush and
-    # things get weird)
-    for line in stream.readlines():
-        # get the argument vector:
-        # do a shlex split to handle quoted paths with spaces in them
-        # also lets us have comments with #
-        argv = shlex.split(line, comments=True)
-        if argv:
-            try:
-                process_command.main(args=argv)
-            except SystemExit as e:
-                if e.code != 0:
-                    raise
+    manager = logging.Logger.manager
+    loggers = [logging.getLogger()] + [
+        x for x in manager.loggerDict.values() if isinstance(x, logging.Logger)
+    ]
+    saved = [(x, x.level, list(x.handlers), x.disabled, x.propagate) for x in loggers]
+    try:
+        yield
+    finally:
+        for logger in manager.loggerDict.values():
+            if isinstance(logger, logging.Logger):
+                logger.handlers = []
+                logger.setLevel(logging.NOTSET)
+                logger.disabled = False
+        for logger, level, handlers, disabled, propagate in saved:
+            logger.setLevel(level)
+            logger.handlers = handlers
+            logger.disabled = disabled
+            logger.propagate = propagate
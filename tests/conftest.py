@@ -16,6 +16,13 @@ from globus_sdk.transport import RequestsTransport
 from ruamel.yaml import YAML
 
 import globus_cli
+from globus_cli.endpointish import EndpointCache, EndpointTypeCache
+from globus_cli.login_manager.diskcache import DiskCache
+from globus_cli.login_manager.identitycache import IdentityCache
+from globus_cli.parsing.path_completion import (
+    PathCompletionCache,
+    path_completion_cache,
+)
 
 yaml = YAML()
 log = logging.getLogger(__name__)
@@ -110,7 +117,7 @@ def user_profile(monkeypatch):
 @pytest.fixture
 def test_token_storage(mock_login_token_response):
     """Put memory-backed sqlite token storage in place for the testsuite to use."""
-    mockstore = SQLiteAdapter(":memory:")
+    mockstore = SQLiteAdapter(":memory:", connect_params={"check_same_thread": False})
     mockstore.store_config(
         "auth_client_data",
         {"client_id": "fakeClientIDString", "client_secret": "fakeClientSecret"},
@@ -129,6 +136,62 @@ def patch_tokenstorage(monkeypatch, test_token_storage):
     )
 
 
+@pytest.fixture
+def test_identity_cache():
+    """Put a memory-backed identity cache in place for the testsuite to use."""
+    return IdentityCache(":memory:")
+
+
+@pytest.fixture(autouse=True)
+def patch_identity_cache(monkeypatch, test_identity_cache):
+    monkeypatch.setattr(
+        globus_cli.login_manager.identity_cache,
+        "_instance",
+        test_identity_cache,
+        raising=False,
+    )
+
+
+@pytest.fixture(autouse=True)
+def patch_endpoint_cache(monkeypatch):
+    # endpoint documents must not be remembered from one test to the next
+    monkeypatch.setattr(
+        globus_cli.endpointish.endpoint_cache,
+        "_instance",
+        EndpointCache(),
+        raising=False,
+    )
+
+
+@pytest.fixture
+def test_endpoint_type_cache():
+    """Put a memory-backed endpoint type cache in place for the testsuite to use."""
+    return EndpointTypeCache(DiskCache(":memory:", max_size=100), ttl=60)
+
+
+@pytest.fixture(autouse=True)
+def patch_endpoint_type_cache(monkeypatch, test_endpoint_type_cache):
+    monkeypatch.setattr(
+        globus_cli.endpointish.endpoint_type_cache,
+        "_instance",
+        test_endpoint_type_cache,
+        raising=False,
+    )
+
+
+@pytest.fixture
+def test_path_completion_cache():
+    """Put a memory-backed path completion cache in place for the testsuite to use."""
+    return PathCompletionCache(DiskCache(":memory:", max_size=100), ttl=60)
+
+
+@pytest.fixture(autouse=True)
+def patch_path_completion_cache(monkeypatch, test_path_completion_cache):
+    monkeypatch.setattr(
+        path_completion_cache, "_instance", test_path_completion_cache, raising=False
+    )
+
+
 @pytest.fixture
 def add_gcs_login(test_token_storage):
     def func(gcs_id):
@@ -46,3 +46,16 @@ def test_validation_error(run_line, tmp_path):
     )
     matcher.check(r"^location:\s+(\w+)$", groups=["json"], err=True)
     assert "Missing data for required field" in result.stderr
+
+
+def test_notfound_error_ndjson(run_line):
+    meta = load_response_set("cli.search").metadata
+    index_id = meta["error_index_id"]
+
+    result = run_line(
+        ["globus", "search", "query", index_id, "-q", "*", "-F", "ndjson"],
+        assert_exit_code=1,
+    )
+    # the error is a single JSON document, so that it can't break an NDJSON stream
+    (line,) = result.stderr.splitlines()
+    assert json.loads(line)["code"] == "NotFound.NoSuchIndex"
@@ -1,5 +1,8 @@
 import json
+import uuid
 
+import pytest
+import responses
 from globus_sdk._testing import load_response_set
 
 
@@ -70,3 +73,178 @@ def test_exlude_recursive_batch_file(run_line, go_ep1_id, go_ep2_id, tmp_path):
         assert_exit_code=2,
     )
     assert "--exclude can only be used with --recursive transfers" in result.stderr
+
+
+def _register_sharded_submission():
+    """
+    Register responses for submitting sharded transfers, returning the list of
+    submitted documents.
+    """
+    load_response_set("cli.transfer_activate_success")
+    submitted = []
+
+    def submission_id_callback(request):
+        return (200, {}, json.dumps({"value": str(uuid.uuid4())}))
+
+    def transfer_callback(request):
+        doc = json.loads(request.body)
+        submitted.append(doc)
+        body = {
+            "DATA_TYPE": "transfer_result",
+            "code": "Accepted",
+            "message": "The transfer has been accepted",
+            "submission_id": doc["submission_id"],
+            "task_id": f"task-{doc['DATA'][0]['source_path']}",
+        }
+        return (202, {}, json.dumps(body))
+
+    responses.add(
+        responses.CallbackResponse(
+            responses.GET,
+            "https://transfer.api.globus.org/v0.10/submission_id",
+            callback=submission_id_callback,
+        )
+    )
+    responses.add(
+        responses.CallbackResponse(
+            responses.POST,
+            "https://transfer.api.globus.org/v0.10/transfer",
+            callback=transfer_callback,
+        )
+    )
+    return submitted
+
+
+def test_max_items_per_task(run_line, go_ep1_id, go_ep2_id):
+    submitted = _register_sharded_submission()
+    batch_input = "".join(f"/src/{i} /dst/{i}\n" for i in range(5))
+
+    result = run_line(
+        f"globus transfer -F json --max-items-per-task 2 --batch - "
+        f"{go_ep1_id} {go_ep2_id}",
+        stdin=batch_input,
+    )
+
+    # shards may be submitted in any order
+    assert sorted(len(doc["DATA"]) for doc in submitted) == [1, 2, 2]
+    # every shard has its own submission ID
+    assert len({doc["submission_id"] for doc in submitted}) == 3
+
+    manifest = json.loads(result.output)["DATA"]
+    # the manifest is in the order of the batch input
+    assert [x["task_id"] for x in manifest] == [
+        "task-/src/0",
+        "task-/src/2",
+        "task-/src/4",
+    ]
+    assert [x["items"] for x in manifest] == [2, 2, 1]
+    assert {x["submission_id"] for x in manifest} == {
+        doc["submission_id"] for doc in submitted
+    }
+
+
+def test_max_items_per_task_reports_submitted_tasks_on_bad_input(
+    run_line, go_ep1_id, go_ep2_id
+):
+    submitted = _register_sharded_submission()
+    batch_input = "/src/0 /dst/0\n/src/1 /dst/1\n/src/2\n"
+
+    result = run_line(
+        f"globus transfer -F json --max-items-per-task 1 --batch - "
+        f"{go_ep1_id} {go_ep2_id}",
+        stdin=batch_input,
+        assert_exit_code=2,
+    )
+
+    assert len(submitted) == 2
+    manifest = json.loads(result.output)["DATA"]
+    assert [x["task_id"] for x in manifest] == ["task-/src/0", "task-/src/1"]
+    assert "Invalid batch input on line 3" in result.stderr
+
+
+def test_max_items_per_task_dry_run(run_line, go_ep1_id, go_ep2_id):
+    batch_input = "".join(f"/src/{i} /dst/{i}\n" for i in range(3))
+    result = run_line(
+        f"globus transfer --dry-run --max-items-per-task 2 --batch - "
+        f"{go_ep1_id} {go_ep2_id}",
+        stdin=batch_input,
+    )
+    lines = result.output.splitlines()
+    assert [x.strip() for x in lines[0].split("|")] == [
+        "Items",
+        "First Source Path",
+        "Last Source Path",
+    ]
+    assert lines[2].split() == ["2", "|", "/src/0", "|", "/src/1"]
+    assert lines[3].split() == ["1", "|", "/src/2", "|", "/src/2"]
+
+
+def test_max_items_per_task_dry_run_ndjson(run_line, go_ep1_id, go_ep2_id):
+    batch_input = "".join(f"/src/{i} /dst/{i}\n" for i in range(3))
+    result = run_line(
+        f"globus transfer -F ndjson --dry-run --max-items-per-task 2 --batch - "
+        f"{go_ep1_id} {go_ep2_id}",
+        stdin=batch_input,
+    )
+    # one document per shard
+    docs = [json.loads(line) for line in result.output.splitlines()]
+    assert [[x["source_path"] for x in doc["DATA"]] for doc in docs] == [
+        ["/src/0", "/src/1"],
+        ["/src/2"],
+    ]
+
+
+def test_max_items_per_task_exclude_requires_recursive_items(
+    run_line, go_ep1_id, go_ep2_id
+):
+    submitted = _register_sharded_submission()
+    batch_input = "".join(f"/src/{i} /dst/{i}\n" for i in range(3))
+    result = run_line(
+        f"globus transfer --exclude *.tmp --max-items-per-task 1 --batch - "
+        f"{go_ep1_id} {go_ep2_id}",
+        stdin=batch_input,
+        assert_exit_code=2,
+    )
+    assert "--exclude can only be used with --recursive transfers" in result.stderr
+    # no tasks are submitted
+    assert submitted == []
+
+
+def test_max_items_per_task_exclude_only_sent_with_recursive_items(
+    run_line, go_ep1_id, go_ep2_id
+):
+    submitted = _register_sharded_submission()
+    batch_input = "/src/0 /dst/0\n--recursive /src/1 /dst/1\n/src/2 /dst/2\n"
+    run_line(
+        f"globus transfer --exclude *.tmp --max-items-per-task 1 --batch - "
+        f"{go_ep1_id} {go_ep2_id}",
+        stdin=batch_input,
+    )
+    rules = {
+        doc["DATA"][0]["source_path"]: doc.get("filter_rules") for doc in submitted
+    }
+    assert rules == {
+        "/src/0": None,
+        "/src/1": [{"DATA_TYPE": "filter_rule", "method": "exclude", "name": "*.tmp"}],
+        "/src/2": None,
+    }
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        ("{src} {dst}", "--max-items-per-task can only be used with --batch"),
+        (
+            "--submission-id abc --batch - {src} {dst}",
+            "You cannot use --submission-id in addition to --max-items-per-task",
+        ),
+    ],
+)
+def test_max_items_per_task_usage_errors(run_line, go_ep1_id, go_ep2_id, args, message):
+    result = run_line(
+        "globus transfer --max-items-per-task 2 "
+        + args.format(src=f"{go_ep1_id}:/a", dst=f"{go_ep2_id}:/b"),
+        stdin="",
+        assert_exit_code=2,
+    )
+    assert message in result.stderr
@@ -0,0 +1,196 @@
+import json
+import uuid
+
+import pytest
+import responses
+
+TASK_LIST_URL = "https://transfer.api.globus.org/v0.10/task_list"
+
+
+def _add_task_list(*tasks):
+    responses.add(
+        responses.GET,
+        TASK_LIST_URL,
+        json={
+            "DATA": [
+                {
+                    "DATA_TYPE": "task",
+                    "task_id": task_id,
+                    "status": status,
+                    "type": "TRANSFER",
+                }
+                for task_id, status in tasks
+            ],
+            "DATA_TYPE": "task_list",
+            "length": len(tasks),
+            "limit": 1000,
+            "offset": 0,
+            "total": len(tasks),
+        },
+    )
+
+
+@pytest.fixture
+def task_ids():
+    return [str(uuid.uuid1()) for _ in range(3)]
+
+
+def test_multi_wait_success(run_line, task_ids):
+    # first poll, only one task is done; second poll, the others finish
+    _add_task_list(
+        (task_ids[0], "ACTIVE"), (task_ids[1], "SUCCEEDED"), (task_ids[2], "ACTIVE")
+    )
+    _add_task_list((task_ids[0], "SUCCEEDED"), (task_ids[2], "SUCCEEDED"))
+
+    result = run_line(["globus", "task", "wait"] + task_ids)
+    assert result.output == ""
+    lines = result.stderr.splitlines()
+    assert lines == [
+        f"Task {task_ids[1]} SUCCEEDED (1 of 3 tasks complete)",
+        f"Task {task_ids[0]} SUCCEEDED (2 of 3 tasks complete)",
+        f"Task {task_ids[2]} SUCCEEDED (3 of 3 tasks complete)",
+    ]
+
+    # one task_list call per poll, filtered to the tasks which were pending
+    assert len(responses.calls) == 2
+    assert responses.calls[0].request.params["filter"] == "task_id:" + ",".join(
+        task_ids
+    )
+    assert responses.calls[1].request.params["filter"] == "task_id:" + ",".join(
+        [task_ids[0], task_ids[2]]
+    )
+
+
+def test_multi_wait_failure_and_json(run_line, task_ids):
+    _add_task_list(
+        (task_ids[0], "SUCCEEDED"), (task_ids[1], "FAILED"), (task_ids[2], "SUCCEEDED")
+    )
+    result = run_line(
+        ["globus", "task", "wait", "-F", "json"] + task_ids, assert_exit_code=1
+    )
+    data = json.loads(result.output)["DATA"]
+    assert [x["task_id"] for x in data] == task_ids
+    assert [x["status"] for x in data] == ["SUCCEEDED", "FAILED", "SUCCEEDED"]
+
+
+def test_multi_wait_timeout(run_line, task_ids):
+    _add_task_list(
+        (task_ids[0], "SUCCEEDED"), (task_ids[1], "ACTIVE"), (task_ids[2], "ACTIVE")
+    )
+    result = run_line(
+        ["globus", "task", "wait", "--timeout", "2", "--timeout-exit-code", "50"]
+        + task_ids
+        + ["-F", "ndjson"],
+        assert_exit_code=50,
+    )
+    # the completed task is output first, then the others in their last state
+    docs = [json.loads(line) for line in result.output.splitlines()]
+    assert [x["task_id"] for x in docs] == [task_ids[0], task_ids[1], task_ids[2]]
+    assert "2 of 3 tasks have yet to complete after 2 seconds" in result.stderr
+
+
+def test_multi_wait_reads_stdin(run_line, task_ids):
+    _add_task_list(*[(x, "SUCCEEDED") for x in task_ids])
+    stdin = "# my tasks\n" + "\n".join(task_ids[1:]) + "\n\n"
+    result = run_line(["globus", "task", "wait", task_ids[0], "-"], stdin=stdin)
+    assert "3 of 3 tasks complete" in result.stderr
+    assert responses.calls[0].request.params["filter"] == "task_id:" + ",".join(
+        task_ids
+    )
+
+
+def test_multi_wait_unknown_task(run_line, task_ids):
+    _add_task_list((task_ids[0], "SUCCEEDED"), (task_ids[1], "SUCCEEDED"))
+    result = run_line(["globus", "task", "wait"] + task_ids, assert_exit_code=1)
+    assert f"Could not find tasks with these IDs: {task_ids[2]}" in result.stderr
+
+
+def _add_get_task(task_id, status, bytes_transferred=0):
+    responses.add(
+        responses.GET,
+        f"https://transfer.api.globus.org/v0.10/task/{task_id}",
+        json={
+            "DATA_TYPE": "task",
+            "task_id": task_id,
+            "status": status,
+            "type": "TRANSFER",
+            "bytes_transferred": bytes_transferred,
+        },
+    )
+
+
+def test_single_wait_reuses_last_poll(run_line, task_ids, mocksleep):
+    task_id = task_ids[0]
+    _add_get_task(task_id, "ACTIVE")
+    _add_get_task(task_id, "SUCCEEDED", bytes_transferred=100)
+
+    result = run_line(f"globus task wait -F json {task_id}")
+    assert json.loads(result.output)["status"] == "SUCCEEDED"
+    # one call per poll, and no extra call after completion
+    assert len(responses.calls) == 2
+    assert mocksleep.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "progress, expect_sleeps",
+    [
+        # a stalled task backs off quickly
+        ([0] * 8, [1, 2, 4, 8, 16, 32, 60, 60]),
+        # a task which is making progress backs off more slowly
+        ([0, 10, 20, 30, 40, 50], [1, 2, 3, 4.5, 6.75]),
+    ],
+)
+def test_single_wait_backoff(run_line, task_ids, mocksleep, progress, expect_sleeps):
+    task_id = task_ids[0]
+    for bytes_transferred in progress:
+        _add_get_task(task_id, "ACTIVE", bytes_transferred=bytes_transferred)
+    _add_get_task(task_id, "FAILED")
+
+    run_line(f"globus task wait {task_id}", assert_exit_code=1)
+    sleeps = [c.args[0] for c in mocksleep.call_args_list]
+    assert sleeps[: len(expect_sleeps)] == expect_sleeps
+
+
+@pytest.mark.parametrize(
+    "polling_interval, expect_sleeps",
+    [
+        # the polling interval caps the backoff
+        (10, [1, 2, 4, 8, 10, 10]),
+        # a polling interval longer than the default lets polls back off further
+        (300, [1, 2, 4, 8, 16, 32, 64, 128, 256, 300]),
+        # a polling interval of 1 polls every second
+        (1, [1, 1, 1]),
+    ],
+)
+def test_single_wait_polling_interval_is_maximum(
+    run_line, task_ids, mocksleep, polling_interval, expect_sleeps
+):
+    task_id = task_ids[0]
+    for _ in expect_sleeps:
+        _add_get_task(task_id, "ACTIVE")
+    _add_get_task(task_id, "FAILED")
+
+    run_line(
+        f"globus task wait --polling-interval {polling_interval} {task_id}",
+        assert_exit_code=1,
+    )
+    assert [c.args[0] for c in mocksleep.call_args_list] == expect_sleeps
+
+
+def test_wait_rejects_polling_interval_below_one(run_line, task_ids):
+    result = run_line(
+        f"globus task wait --polling-interval 0 {task_ids[0]}", assert_exit_code=2
+    )
+    assert "--polling-interval=0 was less than minimum of 1" in result.stderr
+
+
+def test_single_wait_does_not_sleep_past_timeout(run_line, task_ids, mocksleep):
+    task_id = task_ids[0]
+    _add_get_task(task_id, "ACTIVE")
+
+    result = run_line(
+        f"globus task wait --timeout 5 {task_id}",
+        assert_exit_code=1,
+    )
+    assert [c.args[0] for c in mocksleep.call_args_list] == [1, 2, 2]
+    assert "Task has yet to complete after 5 seconds" in result.stderr
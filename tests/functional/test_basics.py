@@ -198,6 +198,20 @@ def test_transfer_batch_file_dryrun(run_line, go_ep1_id, go_ep2_id, tmp_path):
         assert f'"destination_path": "{dst}"' in result.output
 
 
+def test_transfer_batch_error_reports_line_number(run_line, go_ep1_id, go_ep2_id):
+    load_response_set("cli.get_submission_id")
+    batch_input = "# comment\nabc /def\n/xyz p/q/r extra\n"
+    result = run_line(
+        f"globus transfer --batch - --dry-run {go_ep1_id} {go_ep2_id}",
+        stdin=batch_input,
+        assert_exit_code=2,
+    )
+    assert (
+        "Invalid batch input on line 3: Got unexpected extra argument (extra)"
+        in result.stderr
+    )
+
+
 def test_delete_batchmode_dryrun(run_line, go_ep1_id):
     """
     Dry-runs a delete in batchmode
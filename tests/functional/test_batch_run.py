@@ -0,0 +1,111 @@
+import json
+
+import pytest
+from globus_sdk._testing import load_response_set
+
+
+def _results(output):
+    return [json.loads(line) for line in output.splitlines()]
+
+
+def test_batch_run_reports_each_command(run_line, tmp_path):
+    meta = load_response_set("cli.bookmark_list").metadata
+    batch_file = tmp_path / "commands.txt"
+    batch_file.write_text(
+        "# list bookmarks, twice\n"
+        "globus bookmark list\n"
+        "\n"
+        "bookmark list -F json\n"
+        "bookmark show\n"
+    )
+
+    result = run_line(f"globus batch-run {batch_file}", assert_exit_code=1)
+    first, second, third = _results(result.output)
+
+    assert first["line"] == 2
+    assert first["command"] == "globus bookmark list"
+    assert first["exit_code"] == 0
+    for bm_id in meta["bookmarks"]:
+        assert bm_id in first["stdout"]
+
+    assert second["line"] == 4
+    assert second["exit_code"] == 0
+    assert len(json.loads(second["stdout"])["DATA"]) == len(meta["bookmarks"])
+
+    # a missing argument is a usage error
+    assert third["line"] == 5
+    assert third["exit_code"] == 2
+    assert "Missing argument" in third["stderr"]
+
+
+@pytest.mark.parametrize(
+    "line, message",
+    [
+        ("ls 'unterminated", "could not parse line"),
+        ("globus daemon", "cannot be run in a batch"),
+        ("-v -F json daemon status", "cannot be run in a batch"),
+        ("batch-run -", "cannot be run in a batch"),
+    ],
+)
+def test_batch_run_rejects_lines(run_line, line, message):
+    result = run_line("globus batch-run -", stdin=f"{line}\n", assert_exit_code=1)
+    (only,) = _results(result.output)
+    assert only["exit_code"] == 2
+    assert message in only["stderr"]
+
+
+def test_batch_run_concurrently(run_line):
+    load_response_set("cli.bookmark_list")
+    commands = ["bookmark list -F json"] * 5 + ["whoami --bad-option"]
+
+    result = run_line(
+        "globus batch-run --jobs 3 -", stdin="\n".join(commands), assert_exit_code=1
+    )
+    results = _results(result.output)
+
+    # results are streamed as commands complete, and are matched by line number
+    assert sorted(x["line"] for x in results) == [1, 2, 3, 4, 5, 6]
+    by_line = {x["line"]: x for x in results}
+    for lineno in range(1, 6):
+        assert by_line[lineno]["exit_code"] == 0
+        assert by_line[lineno]["stdout"] == by_line[1]["stdout"]
+        assert json.loads(by_line[lineno]["stdout"])["DATA"]
+    assert by_line[6]["exit_code"] == 2
+    assert "No such option" in by_line[6]["stderr"]
+
+
+def test_batch_run_reports_unexpected_errors(run_line, monkeypatch):
+    load_response_set("cli.bookmark_list")
+
+    def _fail(exc_info):
+        raise RuntimeError("unexpected")
+
+    # errors are normally handled by the except hook, which is made to fail here
+    monkeypatch.setattr("globus_cli.parsing.commands.custom_except_hook", _fail)
+    result = run_line(
+        "globus batch-run -",
+        stdin="bookmark show nonexistent\nbookmark list -F json\n",
+        assert_exit_code=1,
+    )
+    failed, succeeded = _results(result.output)
+    assert failed["exit_code"] == 1
+    assert "RuntimeError: unexpected" in failed["stderr"]
+    # the batch carries on after the error
+    assert succeeded["exit_code"] == 0
+
+
+def test_batch_run_concurrently_isolates_logging(run_line):
+    load_response_set("cli.bookmark_list")
+    commands = ["bookmark list -F json"] * 3 + ["bookmark list --debug"]
+    commands += ["bookmark list -F json"] * 3
+
+    result = run_line("globus batch-run -j 3 -", stdin="\n".join(commands))
+    results = _results(result.output)
+
+    # the line with --debug runs after the lines before it, and before the rest
+    assert sorted(x["line"] for x in results[:3]) == [1, 2, 3]
+    assert results[3]["line"] == 4
+    assert "[DEBUG]" in results[3]["stderr"]
+    # and its logging is not seen by any other line
+    for other in results[:3] + results[4:]:
+        assert other["stderr"] == ""
@@ -1,5 +1,7 @@
 import json
+import urllib.parse
 
+import responses
 from globus_sdk._testing import load_response_set
 
 
@@ -114,6 +116,27 @@ def test_bookmark_list(run_line):
             break
 
 
+def test_bookmark_list_looks_up_each_endpoint_once(run_line):
+    load_response_set("cli.bookmark_list")
+
+    run_line("globus bookmark list")
+    endpoint_calls = [
+        urllib.parse.urlparse(call.request.url).path
+        for call in responses.calls
+        if "/endpoint/" in call.request.url
+    ]
+    # three bookmarks, each on a different endpoint, including one deleted endpoint
+    assert len(endpoint_calls) == 3
+    assert len(set(endpoint_calls)) == 3
+
+
+def test_bookmark_list_json_does_not_look_up_endpoints(run_line):
+    load_response_set("cli.bookmark_list")
+
+    run_line("globus bookmark list -F json")
+    assert not [call for call in responses.calls if "/endpoint/" in call.request.url]
+
+
 def test_bookmark_list_failure(run_line):
     load_response_set("cli.bookmark_list_failure")
     result = run_line("globus bookmark list", assert_exit_code=1)
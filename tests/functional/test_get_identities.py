@@ -1,5 +1,8 @@
 import json
+import urllib.parse
+import uuid
 
+import responses
 from globus_sdk._testing import RegisteredResponse, load_response, load_response_set
 
 
@@ -92,3 +95,84 @@ def test_json(run_line):
     assert meta["user_id"] == output["identities"][0]["id"]
     for key in ["username", "name", "organization", "email"]:
         assert meta[key] == output["identities"][0][key]
+
+
+def _add_identities_callback():
+    def callback(request):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)
+        if "ids" in query:
+            ids = query["ids"][0].split(",")
+        else:
+            ids = [
+                str(uuid.UUID(int=int(x[len("user") : -len("@example.org")])))
+                for x in query["usernames"][0].split(",")
+            ]
+        # one identity in every ten does not exist
+        identities = [
+            {"id": x, "username": f"user{uuid.UUID(x).int}@example.org"}
+            for x in ids
+            if uuid.UUID(x).int % 10
+        ]
+        return (200, {}, json.dumps({"identities": identities}))
+
+    responses.add(
+        responses.CallbackResponse(
+            method="GET",
+            url="https://auth.globus.org/v2/api/identities",
+            callback=callback,
+            content_type="application/json",
+        )
+    )
+
+
+def test_batch_is_looked_up_in_chunks(run_line):
+    _add_identities_callback()
+    ids = [str(uuid.UUID(int=i)) for i in range(1, 251)]
+    # include comments, blank lines, a duplicate, and usernames
+    lines = ["# ids", *ids, "", ids[0], "user2@example.org", "user10@example.org"]
+
+    result = run_line(
+        "globus get-identities user3@example.org --batch -",
+        stdin="\n".join(lines) + "\n",
+    )
+
+    expected = [
+        str(uuid.UUID(int=3)),
+        *(
+            f"user{i}@example.org" if i % 10 else "NO_SUCH_IDENTITY"
+            for i in range(1, 251)
+        ),
+        "user1@example.org",
+        str(uuid.UUID(int=2)),
+        "NO_SUCH_IDENTITY",
+    ]
+    assert result.output == "\n".join(expected) + "\n"
+
+    # 250 unique IDs and 3 usernames are looked up in chunks of at most 100
+    requested = [
+        urllib.parse.parse_qs(urllib.parse.urlparse(call.request.url).query)
+        for call in responses.calls
+        if call.request.url.startswith("https://auth.globus.org/v2/api/identities")
+    ]
+    chunk_sizes = sorted(
+        len(query.get("ids", query.get("usernames"))[0].split(","))
+        for query in requested
+    )
+    assert chunk_sizes == [3, 50, 100, 100]
+
+
+def test_batch_invalid_line(run_line):
+    result = run_line(
+        "globus get-identities --batch -",
+        stdin="user1@example.org\n\ninvalid\n",
+        assert_exit_code=2,
+    )
+    assert (
+        "Invalid batch input on line 3: "
+        "'invalid' does not appear to be a valid identity"
+    ) in result.stderr
+
+
+def test_requires_identities(run_line):
+    result = run_line("globus get-identities", assert_exit_code=2)
+    assert "Provide at least one identity, or use --batch." in result.stderr
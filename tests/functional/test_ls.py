@@ -1,3 +1,6 @@
+import json
+
+import pytest
 from globus_sdk._testing import load_response_set
 
 
@@ -56,3 +59,79 @@ def test_recursive_json(run_line, go_ep1_id):
     result = run_line(f"globus ls -r -F json {go_ep1_id}:/share")
     assert '"DATA":' in result.output
     assert '"name": "godata/file1.txt"' in result.output
+
+
+def test_recursive_concurrency_preserves_order(run_line, go_ep1_id):
+    """
+    Confirms that a concurrent recursive ls produces the same output, in the same
+    order, as a serial one
+    """
+    load_response_set("cli.transfer_activate_success")
+    load_response_set("cli.ls_results")
+    serial = run_line(f"globus ls -r --recursive-depth-limit 1 {go_ep1_id}:/")
+    concurrent = run_line(
+        f"globus ls -r --recursive-depth-limit 1 --recursive-concurrency 4 "
+        f"{go_ep1_id}:/"
+    )
+    assert "share/godata/" in concurrent.output
+    assert concurrent.output == serial.output
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        ("--checkpoint-file ckpt.json", "can only be used with --recursive"),
+        ("-r --resume", "--resume requires --checkpoint-file"),
+        ("-r --resume --checkpoint-file nosuchfile.json", "Could not read"),
+    ],
+)
+def test_checkpoint_usage_errors(run_line, go_ep1_id, args, message):
+    load_response_set("cli.transfer_activate_success")
+    result = run_line(f"globus ls {args} {go_ep1_id}:/", assert_exit_code=2)
+    assert message in result.stderr
+
+
+def test_recursive_checkpoint_and_resume(run_line, go_ep1_id, tmp_path):
+    load_response_set("cli.transfer_activate_success")
+    load_response_set("cli.ls_results")
+    checkpoint_file = tmp_path / "ckpt.json"
+    result = run_line(
+        f"globus ls -r --checkpoint-file {checkpoint_file} {go_ep1_id}:/share"
+    )
+    assert "godata/file1.txt" in result.output
+    assert checkpoint_file.exists()
+
+    # the listing completed, so there is nothing left to resume
+    result = run_line(
+        f"globus ls -r --resume --checkpoint-file {checkpoint_file} {go_ep1_id}:/share"
+    )
+    assert result.output.strip() == ""
+
+
+def test_recursive_ndjson(run_line, go_ep1_id):
+    """
+    Confirms -F ndjson prints one compact JSON document per listing entry
+    """
+    load_response_set("cli.transfer_activate_success")
+    load_response_set("cli.ls_results")
+    result = run_line(f"globus ls -r -F ndjson {go_ep1_id}:/share")
+    docs = [json.loads(line) for line in result.output.splitlines()]
+    assert [d["name"] for d in docs] == [
+        "godata",
+        "godata/file1.txt",
+        "godata/file2.txt",
+        "godata/file3.txt",
+    ]
+    assert all(d["DATA_TYPE"] == "file" for d in docs)
+
+
+def test_ndjson_applies_jmespath_per_item(run_line, go_ep1_id):
+    load_response_set("cli.transfer_activate_success")
+    load_response_set("cli.ls_results")
+    result = run_line(f"globus ls -F ndjson --jmespath name {go_ep1_id}:/")
+    assert result.output.splitlines() == [
+        '"home"',
+        '"mnt"',
+        '"not shareable"',
+        '"share"',
+    ]
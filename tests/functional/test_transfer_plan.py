@@ -0,0 +1,163 @@
+import json
+
+import pytest
+import responses
+from globus_sdk._testing import load_response_set
+from responses import matchers
+
+SRC_EP = "ddb59aef-6d04-11e5-ba46-22000b92c6ec"
+DST_EP = "ddb59af0-6d04-11e5-ba46-22000b92c6ec"
+
+OLD = "2022-01-01 00:00:00+00:00"
+NEW = "2022-06-01 00:00:00+00:00"
+
+
+def _file(name, size, last_modified):
+    return {
+        "DATA_TYPE": "file",
+        "name": name,
+        "type": "file",
+        "size": size,
+        "last_modified": last_modified,
+    }
+
+
+def _dir(name):
+    return {
+        "DATA_TYPE": "file",
+        "name": name,
+        "type": "dir",
+        "size": 0,
+        "last_modified": OLD,
+    }
+
+
+def _add_ls(endpoint_id, path, *items, status=200):
+    body = {
+        "DATA": list(items),
+        "DATA_TYPE": "file_list",
+        "path": path,
+        "endpoint": endpoint_id,
+        "length": len(items),
+        "total": len(items),
+    }
+    if status != 200:
+        body = {"code": "ClientError.NotFound", "message": "not found"}
+    responses.add(
+        responses.GET,
+        f"https://transfer.api.globus.org/v0.10/operation/endpoint/{endpoint_id}/ls",
+        json=body,
+        status=status,
+        match=[matchers.query_param_matcher({"path": path})],
+    )
+
+
+@pytest.fixture
+def trees():
+    load_response_set("cli.get_submission_id")
+    load_response_set("cli.transfer_activate_success")
+    _add_ls(
+        SRC_EP,
+        "/src/",
+        _file("same.txt", 1, OLD),
+        _file("resized.txt", 2, OLD),
+        _file("newer.txt", 3, NEW),
+        _file("skip.tmp", 4, OLD),
+        _dir("sub"),
+    )
+    _add_ls(SRC_EP, "/src/sub", _file("missing.txt", 5, OLD))
+    _add_ls(
+        DST_EP,
+        "/dst/",
+        _file("same.txt", 1, OLD),
+        _file("resized.txt", 20, OLD),
+        _file("newer.txt", 3, OLD),
+        _file("extra.txt", 6, OLD),
+        _dir("sub"),
+    )
+    _add_ls(DST_EP, "/dst/sub")
+
+
+def test_plan_dry_run(run_line, trees):
+    result = run_line(
+        "globus transfer -F json --dry-run --plan --exclude *.tmp "
+        f"{SRC_EP}:/src {DST_EP}:/dst"
+    )
+    data = json.loads(result.stdout)
+    assert "filter_rules" not in data or data["filter_rules"] is None
+    assert sorted((x["source_path"], x["destination_path"]) for x in data["DATA"]) == [
+        ("/src/newer.txt", "/dst/newer.txt"),
+        ("/src/resized.txt", "/dst/resized.txt"),
+        ("/src/sub/missing.txt", "/dst/sub/missing.txt"),
+    ]
+    assert not any(x["recursive"] for x in data["DATA"])
+    assert "Compared 4 files, 3 need to be transferred" in result.stderr
+
+
+@pytest.mark.parametrize(
+    "sync_level, expect",
+    [
+        ("exists", ["/src/sub/missing.txt"]),
+        ("size", ["/src/resized.txt", "/src/sub/missing.txt"]),
+    ],
+)
+def test_plan_sync_level(run_line, trees, sync_level, expect):
+    result = run_line(
+        f"globus transfer --plan --plan-output - --sync-level {sync_level} "
+        f"--exclude *.tmp {SRC_EP}:/src {DST_EP}:/dst"
+    )
+    assert sorted(line.split()[0] for line in result.stdout.splitlines()) == expect
+
+
+def test_plan_output_is_batch_input(run_line, trees):
+    result = run_line(
+        f"globus transfer --plan --plan-output - {SRC_EP}:/src {DST_EP}:/dst"
+    )
+    assert sorted(result.stdout.splitlines()) == [
+        "/src/newer.txt /dst/newer.txt",
+        "/src/resized.txt /dst/resized.txt",
+        "/src/skip.tmp /dst/skip.tmp",
+        "/src/sub/missing.txt /dst/sub/missing.txt",
+    ]
+    # nothing was submitted
+    assert not [c for c in responses.calls if c.request.url.endswith("/transfer")]
+
+
+def test_plan_missing_destination(run_line):
+    load_response_set("cli.get_submission_id")
+    load_response_set("cli.transfer_activate_success")
+    _add_ls(SRC_EP, "/src/", _file("a b.txt", 1, OLD))
+    _add_ls(DST_EP, "/dst/", status=404)
+
+    result = run_line(
+        f"globus transfer --plan --plan-output - {SRC_EP}:/src {DST_EP}:/dst"
+    )
+    assert result.stdout == "'/src/a b.txt' '/dst/a b.txt'\n"
+
+
+def test_plan_nothing_to_transfer(run_line):
+    load_response_set("cli.get_submission_id")
+    load_response_set("cli.transfer_activate_success")
+    _add_ls(SRC_EP, "/src/", _file("a.txt", 1, OLD))
+    _add_ls(DST_EP, "/dst/", _file("a.txt", 1, OLD))
+
+    result = run_line(f"globus transfer --plan {SRC_EP}:/src {DST_EP}:/dst")
+    assert result.stdout == ""
+    assert "Compared 1 files, 0 need to be transferred" in result.stderr
+    assert not [c for c in responses.calls if c.request.url.endswith("/transfer")]
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        ("--plan-output -", "--plan-output can only be used with --plan"),
+        ("--plan --recursive", "You cannot use --recursive in addition to --plan"),
+        ("--plan --delete", "You cannot use --delete in addition to --plan"),
+        ("--plan --sync-level checksum", "--plan cannot compare checksums"),
+    ],
+)
+def test_plan_usage_errors(run_line, args, message):
+    result = run_line(
+        f"globus transfer {args} {SRC_EP}:/src {DST_EP}:/dst", assert_exit_code=2
+    )
+    assert message in result.stderr
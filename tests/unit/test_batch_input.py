@@ -0,0 +1,104 @@
+import io
+import shlex
+
+import click
+import pytest
+
+from globus_cli.parsing import BatchInputParser
+from globus_cli.parsing.batch_input import split_batch_line
+
+
+def _transfer_parser():
+    return BatchInputParser(
+        ("source_path", "dest_path"),
+        flags={"--recursive": "recursive", "-r": "recursive"},
+        options={"--external-checksum": "external_checksum"},
+        mutually_exclusive=[("recursive", "external_checksum")],
+    )
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "abc /def\n",
+        "  abc\t/def  \r\n",
+        "'a b' \"c d\"\n",
+        "abc def # comment\n",
+        "abc#def ghi\n",
+        "a\\ b c\n",
+        "# only a comment\n",
+        "\n",
+        "abc\x0bdef\n",
+        "ab c def\n",
+    ],
+)
+def test_split_batch_line_matches_shlex(line):
+    assert split_batch_line(line) == shlex.split(line, comments=True)
+
+
+@pytest.mark.parametrize(
+    "line, expect",
+    [
+        (
+            "abc /def",
+            {
+                "source_path": "abc",
+                "dest_path": "/def",
+                "recursive": False,
+                "external_checksum": None,
+            },
+        ),
+        ("-r abc def", {"recursive": True}),
+        ("abc def --recursive", {"recursive": True}),
+        ("--external-checksum xyz abc def", {"external_checksum": "xyz"}),
+        ("abc --external-checksum=xyz def", {"external_checksum": "xyz"}),
+        ("-- -abc def", {"source_path": "-abc", "dest_path": "def"}),
+        ("- def", {"source_path": "-", "dest_path": "def"}),
+    ],
+)
+def test_parse_line(line, expect):
+    parsed = _transfer_parser().parse_line(line)
+    assert parsed is not None
+    for k, v in expect.items():
+        assert parsed[k] == v
+
+
+@pytest.mark.parametrize(
+    "line, message",
+    [
+        ("abc", "Missing argument 'DEST_PATH'."),
+        ("abc def ghi", "Got unexpected extra argument (ghi)"),
+        ("abc def ghi jkl", "Got unexpected extra arguments (ghi jkl)"),
+        ("--foo abc def", "No such option: --foo"),
+        ("--recursive=1 abc def", "Option '--recursive' does not take a value."),
+        ("abc def --external-checksum", "Option '--external-checksum' requires"),
+        (
+            "-r --external-checksum xyz abc def",
+            "--recursive and --external-checksum are mutually exclusive",
+        ),
+        ("'abc def", "No closing quotation"),
+    ],
+)
+def test_parse_line_errors(line, message):
+    with pytest.raises(click.UsageError) as excinfo:
+        _transfer_parser().parse_line(line)
+    assert message in excinfo.value.message
+
+
+def test_iter_parsed_is_lazy_and_reports_line_numbers():
+    stream = io.StringIO("# header\n\nabc def\nabc\nxyz uvw\n")
+    parsed = _transfer_parser().iter_parsed(stream)
+
+    first = next(parsed)
+    assert (first["source_path"], first["dest_path"]) == ("abc", "def")
+    # the stream has only been read up to the first item
+    assert stream.readline() == "abc\n"
+
+
+def test_iter_parsed_error_includes_line_number():
+    stream = io.StringIO("# header\n\nabc def\nabc\nxyz uvw\n")
+    with pytest.raises(click.UsageError) as excinfo:
+        list(_transfer_parser().iter_parsed(stream))
+    assert excinfo.value.message == (
+        "Invalid batch input on line 4: Missing argument 'DEST_PATH'."
+    )
@@ -0,0 +1,86 @@
+import json
+import subprocess
+import sys
+
+import pytest
+from click.shell_completion import ShellComplete
+
+from globus_cli import main
+from globus_cli.parsing import command_index
+
+
+@pytest.fixture
+def without_index(monkeypatch):
+    monkeypatch.setattr(
+        command_index.load_command_index, "_instance", None, raising=False
+    )
+
+
+def test_index_is_up_to_date():
+    with open(command_index.INDEX_FILENAME, encoding="utf-8") as f:
+        stored = json.load(f)
+    assert stored == command_index.build_command_index(main), (
+        "the command index is out of date, "
+        "run 'python ./scripts/generate_command_index.py' to update it"
+    )
+
+
+def test_index_is_loaded():
+    assert command_index.load_command_index() is not None
+
+
+@pytest.mark.parametrize("line", ["globus --help", "globus endpoint --help"])
+def test_helptext_matches_without_index(run_line, request, line):
+    with_index = run_line(line).output
+    request.getfixturevalue("without_index")
+    assert run_line(line).output == with_index
+
+
+def test_list_commands_matches_without_index(run_line, request):
+    with_index = run_line("globus list-commands").output
+    assert "\n=== globus endpoint ===\n" in with_index
+    assert "\n    show            Display a detailed endpoint definition\n" in (
+        with_index
+    )
+    # hidden commands are not listed
+    assert "Delete a timer job" not in with_index
+
+    request.getfixturevalue("without_index")
+    assert run_line("globus list-commands").output == with_index
+
+
+def _complete(args, incomplete):
+    completions = ShellComplete(main, {}, "globus", "_GLOBUS_COMPLETE")
+    return [(x.value, x.help) for x in completions.get_completions(args, incomplete)]
+
+
+@pytest.mark.parametrize(
+    "args, incomplete", [([], "e"), (["endpoint"], ""), (["endpoint"], "--")]
+)
+def test_completion_matches_without_index(request, args, incomplete):
+    with_index = _complete(args, incomplete)
+    assert with_index
+    request.getfixturevalue("without_index")
+    assert _complete(args, incomplete) == with_index
+
+
+def test_completion_does_not_import_subcommands():
+    to_run = "\n".join(
+        [
+            "import os, sys",
+            "os.environ.update(COMP_WORDS='globus endpoint ', COMP_CWORD='2')",
+            "os.environ['_GLOBUS_COMPLETE'] = 'bash_complete'",
+            "from globus_cli import main",
+            "try:",
+            "    main.main(args=[], prog_name='globus')",
+            "except SystemExit:",
+            "    pass",
+            "assert 'globus_cli.commands.endpoint' in sys.modules",
+            "assert 'globus_cli.commands.endpoint.show' not in sys.modules",
+        ]
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", to_run], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    assert proc.returncode == 0, proc.stderr.decode()
+    assert b"plain,show\n" in proc.stdout
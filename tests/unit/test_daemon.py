@@ -0,0 +1,155 @@
+import os
+import socket
+import sys
+import uuid
+from unittest import mock
+
+import click
+import pytest
+
+from globus_cli.daemon import forward_to_daemon
+from globus_cli.daemon.protocol import recv_message, send_message
+from globus_cli.daemon.server import DaemonServer
+from globus_cli.login_manager import identity_cache
+from globus_cli.principal_resolver import PrincipalResolver
+from globus_cli.version import __version__
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="the daemon requires Unix sockets"
+)
+
+
+@click.command()
+@click.argument("exit_code", type=int)
+def _example_command(exit_code):
+    click.echo(f"profile={os.getenv('GLOBUS_PROFILE')}")
+    click.echo(f"cwd={os.getcwd()}")
+    click.echo(f"stdin={sys.stdin.read()}")
+    click.echo("to stderr", err=True)
+    identity_cache()
+    sys.exit(exit_code)
+
+
+_resolver = PrincipalResolver("identity_id", use_urns=False)
+
+
+@click.command()
+@click.argument("identity_id")
+def _resolve_command(identity_id):
+    _resolver.page_callback([{"identity_id": identity_id}])
+    click.echo(_resolver.field({"identity_id": identity_id}))
+
+
+def _run_in_daemon(server, argv, *, env=None, cwd=None, stdin="", version=None):
+    """
+    Send a request to a daemon over a socketpair, and return the response along
+    with the output of the command.
+    """
+    stdin_r, stdin_w = os.pipe()
+    stdout_r, stdout_w = os.pipe()
+    stderr_r, stderr_w = os.pipe()
+    os.write(stdin_w, stdin.encode())
+    os.close(stdin_w)
+
+    client, conn = socket.socketpair()
+    with client, conn:
+        send_message(
+            client,
+            {
+                "version": version or __version__,
+                "argv": argv,
+                "env": env or {},
+                "cwd": cwd or os.getcwd(),
+                "encoding": "utf-8",
+            },
+            fds=[stdin_r, stdout_w, stderr_w],
+        )
+        for fd in (stdin_r, stdout_w, stderr_w):
+            os.close(fd)
+        server.handle_connection(conn)
+        response, _ = recv_message(client)
+
+    with open(stdout_r) as stdout, open(stderr_r) as stderr:
+        return response, stdout.read(), stderr.read()
+
+
+def test_daemon_runs_command_with_client_context(tmp_path):
+    server = DaemonServer("unused.sock", _example_command)
+    response, stdout, stderr = _run_in_daemon(
+        server,
+        ["3"],
+        env={"GLOBUS_PROFILE": "myprofile"},
+        cwd=str(tmp_path),
+        stdin="hello",
+    )
+    assert response == {"status": "ok", "exit_code": 3}
+    assert stdout == f"profile=myprofile\ncwd={tmp_path}\nstdin=hello\n"
+    assert stderr == "to stderr\n"
+
+    # the daemon's own environment and working directory are restored
+    assert os.getcwd() != str(tmp_path)
+    assert sys.stdout is not None and not sys.stdout.closed
+
+
+def test_daemon_declines_other_versions():
+    server = DaemonServer("unused.sock", _example_command)
+    response, stdout, _ = _run_in_daemon(server, ["0"], version="0.0.0")
+    assert response["status"] == "declined"
+    assert "0.0.0" in response["reason"]
+    assert stdout == ""
+
+
+def test_daemon_keeps_memoized_state_per_profile():
+    server = DaemonServer("unused.sock", _example_command)
+
+    def _cache_for(profile):
+        _run_in_daemon(server, ["0"], env={"GLOBUS_PROFILE": profile})
+        (memos,) = [v for k, v in server._namespaces.items() if k[2] == profile]
+        return memos[identity_cache]
+
+    first = _cache_for("a")
+    assert _cache_for("b") is not first
+    assert _cache_for("a") is first
+
+
+def test_daemon_resolves_principals_per_command(monkeypatch):
+    auth_clients = {}
+
+    def _get_auth_client():
+        profile = os.environ["GLOBUS_PROFILE"]
+
+        def _get_identities(ids):
+            return {"identities": [{"id": x, "username": f"{profile}"} for x in ids]}
+
+        client = auth_clients.setdefault(profile, mock.Mock())
+        client.get_identities.side_effect = _get_identities
+        return client
+
+    monkeypatch.setattr(
+        "globus_cli.principal_resolver.LoginManager",
+        lambda: mock.Mock(get_auth_client=_get_auth_client),
+    )
+    server = DaemonServer("unused.sock", _resolve_command)
+    ids = [str(uuid.UUID(int=x)) for x in range(3)]
+    for profile, identity_id in (("a", ids[0]), ("b", ids[1]), ("a", ids[2])):
+        _, stdout, _ = _run_in_daemon(
+            server,
+            [identity_id],
+            env={"GLOBUS_PROFILE": profile, "GLOBUS_CLI_IDENTITY_CACHE_TTL": "0"},
+        )
+        assert stdout == f"{profile}\n"
+
+    # each command looked up only its own identities, as its own profile
+    assert [
+        call.kwargs["ids"] for call in auth_clients["a"].get_identities.call_args_list
+    ] == [{ids[0]}, {ids[2]}]
+    auth_clients["b"].get_identities.assert_called_once_with(ids={ids[1]})
+
+
+def test_forward_to_daemon_requires_opt_in(monkeypatch, tmp_path):
+    monkeypatch.delenv("GLOBUS_CLI_DAEMON_SOCKET", raising=False)
+    assert forward_to_daemon(["whoami"]) is None
+
+    # a socket with no daemon listening falls back to running the command locally
+    monkeypatch.setenv("GLOBUS_CLI_DAEMON_SOCKET", str(tmp_path / "missing.sock"))
+    assert forward_to_daemon(["whoami"]) is None
@@ -0,0 +1,103 @@
+import logging
+import uuid
+from unittest import mock
+
+import globus_sdk
+import pytest
+
+from globus_cli.endpointish import EndpointCache, endpoint_cache
+from globus_cli.login_manager.diskcache import DiskCache, get_cache_ttl
+
+EP1 = str(uuid.UUID(int=1))
+EP2 = str(uuid.UUID(int=2))
+DELETED_EP = str(uuid.UUID(int=3))
+
+
+@pytest.fixture
+def transfer_client():
+    err_res = mock.MagicMock()
+    err_res.status_code = 409
+    err_res.json.return_value = {
+        "code": "EndpointDeleted",
+        "message": "foo",
+        "request_id": "bar",
+    }
+    err_res.headers = {"Content-Type": "application/json"}
+
+    def get_endpoint(endpoint_id):
+        if endpoint_id == DELETED_EP:
+            raise globus_sdk.TransferAPIError(err_res)
+        return mock.Mock(data={"id": endpoint_id})
+
+    client = mock.Mock()
+    client.get_endpoint.side_effect = get_endpoint
+    return client
+
+
+def test_prefetch_looks_up_each_endpoint_once(transfer_client):
+    cache = EndpointCache()
+    cache.prefetch(transfer_client, [EP1, EP2, EP1, uuid.UUID(EP2), DELETED_EP])
+    assert sorted(x.args[0] for x in transfer_client.get_endpoint.call_args_list) == [
+        EP1,
+        EP2,
+        DELETED_EP,
+    ]
+
+    assert cache.get(transfer_client, EP1) == {"id": EP1}
+    assert cache.get(transfer_client, uuid.UUID(EP2)) == {"id": EP2}
+    # errors are remembered too
+    with pytest.raises(globus_sdk.TransferAPIError):
+        cache.get(transfer_client, DELETED_EP)
+    assert transfer_client.get_endpoint.call_count == 3
+
+
+def test_invalidate(transfer_client):
+    cache = EndpointCache()
+    cache.get(transfer_client, EP1)
+    cache.invalidate(EP1)
+    cache.get(transfer_client, EP1)
+    assert transfer_client.get_endpoint.call_count == 2
+
+
+def test_disk_cache(transfer_client):
+    disk_cache = DiskCache(":memory:", max_size=10)
+    EndpointCache(disk_cache, ttl=60).prefetch(transfer_client, [EP1, DELETED_EP])
+    assert transfer_client.get_endpoint.call_count == 2
+
+    # a new cache (e.g. in a new process) uses the documents saved on disk, but
+    # looks up endpoints which had errors again
+    cache = EndpointCache(disk_cache, ttl=60)
+    assert cache.get(transfer_client, EP1) == {"id": EP1}
+    with pytest.raises(globus_sdk.TransferAPIError):
+        cache.get(transfer_client, DELETED_EP)
+    assert transfer_client.get_endpoint.call_count == 3
+
+
+def test_clear(transfer_client):
+    disk_cache = DiskCache(":memory:", max_size=10)
+    cache = EndpointCache(disk_cache, ttl=60)
+    cache.get(transfer_client, EP1)
+    cache.clear()
+    assert disk_cache.get_many([EP1]) == {}
+    cache.get(transfer_client, EP1)
+    assert transfer_client.get_endpoint.call_count == 2
+
+
+def test_disk_cache_is_per_profile(monkeypatch):
+    monkeypatch.delattr(endpoint_cache, "_instance")
+    monkeypatch.setattr(
+        "globus_cli.login_manager.diskcache.get_cache_filename", lambda _: ":memory:"
+    )
+    monkeypatch.setenv("GLOBUS_CLI_ENDPOINT_CACHE_TTL", "60")
+    monkeypatch.setenv("GLOBUS_PROFILE", "other")
+    assert endpoint_cache().disk_cache.namespace == "userprofile/production/other"
+
+
+@pytest.mark.parametrize("value, expect", [(None, 60), ("10", 10), ("ten", 60)])
+def test_get_cache_ttl(monkeypatch, caplog, value, expect):
+    caplog.set_level(logging.WARNING, logger="globus_cli")
+    if value is not None:
+        monkeypatch.setenv("GLOBUS_CLI_ENDPOINT_CACHE_TTL", value)
+    assert get_cache_ttl("GLOBUS_CLI_ENDPOINT_CACHE_TTL", 60) == expect
+    # a bad value is ignored, with a warning
+    assert ("invalid GLOBUS_CLI_ENDPOINT_CACHE_TTL" in caplog.text) == (value == "ten")
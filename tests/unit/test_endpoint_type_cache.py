@@ -0,0 +1,88 @@
+import uuid
+from unittest import mock
+
+from globus_cli.endpointish import (
+    EndpointCache,
+    Endpointish,
+    EndpointType,
+    EndpointTypeCache,
+    EndpointTypeInfo,
+)
+from globus_cli.login_manager.diskcache import DiskCache
+
+COLLECTION_ID = str(uuid.UUID(int=1))
+GCS_ENDPOINT_ID = str(uuid.UUID(int=2))
+
+
+def _collection_doc():
+    return {
+        "id": COLLECTION_ID,
+        "owner_id": GCS_ENDPOINT_ID,
+        "gcs_version": "5.4.10",
+        "host_endpoint_id": None,
+        "high_assurance": False,
+        "DATA": [{"hostname": "abc.xyz.data.globus.org"}],
+    }
+
+
+def _transfer_client():
+    client = mock.Mock()
+    client.get_endpoint.return_value.data = _collection_doc()
+    return client
+
+
+def test_info_from_document():
+    info = EndpointTypeInfo.from_document(_collection_doc())
+    assert info == EndpointTypeInfo(
+        EndpointType.MAPPED_COLLECTION,
+        GCS_ENDPOINT_ID,
+        "abc.xyz.data.globus.org",
+        False,
+    )
+
+    # only GCSv5 endpoints and collections have a GCS hostname
+    info = EndpointTypeInfo.from_document({"is_globus_connect": True})
+    assert info.ep_type is EndpointType.GCP
+    assert info.gcs_hostname is None
+
+
+def test_cache_round_trip():
+    cache = EndpointTypeCache(DiskCache(":memory:", max_size=10), ttl=60)
+    info = EndpointTypeInfo.from_document(_collection_doc())
+    assert cache.get(COLLECTION_ID) is None
+
+    cache.store(COLLECTION_ID, info)
+    assert cache.get(uuid.UUID(COLLECTION_ID)) == info
+
+    cache.invalidate(COLLECTION_ID)
+    assert cache.get(COLLECTION_ID) is None
+
+
+def test_cache_disabled():
+    cache = EndpointTypeCache(DiskCache(":memory:", max_size=10), ttl=0)
+    cache.store(COLLECTION_ID, EndpointTypeInfo.from_document(_collection_doc()))
+    assert cache.get(COLLECTION_ID) is None
+
+
+def test_endpointish_uses_cached_type(monkeypatch, test_endpoint_type_cache):
+    client = _transfer_client()
+    epish = Endpointish(COLLECTION_ID, transfer_client=client)
+    assert epish.ep_type is EndpointType.MAPPED_COLLECTION
+    assert client.get_endpoint.call_count == 1
+
+    # a later command (with a fresh endpoint document cache) does not need to
+    # look up the endpoint to build a GCS client
+    monkeypatch.setattr(
+        "globus_cli.endpointish.endpoint_cache._instance", EndpointCache()
+    )
+    client = _transfer_client()
+    epish = Endpointish(COLLECTION_ID, transfer_client=client)
+    assert epish.ep_type is EndpointType.MAPPED_COLLECTION
+    assert epish.get_collection_endpoint_id() == GCS_ENDPOINT_ID
+    assert epish.get_gcs_address() == "abc.xyz.data.globus.org"
+    assert epish.requires_data_access_scope is True
+    client.get_endpoint.assert_not_called()
+
+    # but the document is still available, when needed
+    assert epish.data["id"] == COLLECTION_ID
+    client.get_endpoint.assert_called_once_with(COLLECTION_ID)
@@ -0,0 +1,130 @@
+import uuid
+from unittest import mock
+
+import pytest
+
+from globus_cli.login_manager.identitycache import IdentityCache
+from globus_cli.services.auth import CachedIdentityMap
+
+ID1 = str(uuid.UUID(int=1))
+ID2 = str(uuid.UUID(int=2))
+ID3 = str(uuid.UUID(int=3))
+
+
+def _identity(identity_id, username):
+    return {"id": identity_id, "username": username, "name": None}
+
+
+@pytest.fixture
+def auth_client():
+    known = {
+        ID1: _identity(ID1, "one@example.org"),
+        ID2: _identity(ID2, "two@example.org"),
+    }
+    by_username = {x["username"]: x for x in known.values()}
+
+    def get_identities(*, ids=None, usernames=None):
+        if ids is not None:
+            return {"identities": [known[x] for x in ids if x in known]}
+        return {"identities": [by_username[x] for x in usernames if x in by_username]}
+
+    client = mock.Mock()
+    client.get_identities.side_effect = get_identities
+    return client
+
+
+def test_cache_stores_by_id_and_username():
+    cache = IdentityCache(":memory:")
+    cache.store([_identity(ID1, "one@example.org")], missing=[ID3])
+
+    found = cache.get_many([ID1, "one@example.org", ID2, ID3])
+    assert found == {
+        ID1: _identity(ID1, "one@example.org"),
+        "one@example.org": _identity(ID1, "one@example.org"),
+        ID3: None,
+    }
+
+
+def test_cache_expires_entries(monkeypatch):
+    cache = IdentityCache(":memory:", ttl=60)
+    now = cache_time = 1_000_000.0
+    monkeypatch.setattr("time.time", lambda: now)
+    cache.store([_identity(ID1, "one@example.org")], missing=[ID3])
+
+    # missing identities are cached for no longer than the identities themselves
+    now = cache_time + 59
+    assert set(cache.get_many([ID1, ID3])) == {ID1, ID3}
+    now = cache_time + 61
+    assert cache.get_many([ID1, ID3]) == {}
+
+
+def test_cache_disabled():
+    cache = IdentityCache(":memory:", ttl=0)
+    cache.store([_identity(ID1, "one@example.org")])
+    assert cache.get_many([ID1]) == {}
+
+
+def test_cache_is_bounded():
+    cache = IdentityCache(":memory:", max_size=2)
+    cache.store([_identity(ID1, "one@example.org")])
+    cache.store([_identity(ID2, "two@example.org")])
+
+    # the entries closest to expiring are evicted first
+    found = cache.get_many([ID1, ID2, "one@example.org", "two@example.org"])
+    assert set(found) == {ID2, "two@example.org"}
+
+    # which includes missing identities, since they are cached for less time
+    cache.store([], missing=[ID3])
+    assert set(cache.get_many([ID2, ID3, "two@example.org"])) == {
+        ID2,
+        "two@example.org",
+    }
+
+
+def test_cache_is_per_profile(monkeypatch):
+    production = IdentityCache(":memory:")
+    sandbox = IdentityCache(":memory:", namespace="userprofile/sandbox")
+    monkeypatch.setenv("GLOBUS_PROFILE", "other")
+    other_profile = IdentityCache(":memory:")
+    assert other_profile.namespace == "userprofile/production/other"
+    # share one database between the caches
+    sandbox._connection = other_profile._connection = production.connection
+
+    production.store([_identity(ID1, "one@example.org")])
+    assert sandbox.get_many([ID1]) == {}
+    assert other_profile.get_many([ID1]) == {}
+    assert ID1 in production.get_many([ID1])
+
+
+def test_identity_map_fills_cache(auth_client, test_identity_cache):
+    idmap = CachedIdentityMap(auth_client, [ID1, ID2, ID3])
+    assert idmap[ID1]["username"] == "one@example.org"
+    assert idmap.get(ID3) is None
+    assert auth_client.get_identities.call_count == 1
+
+    # a new map is resolved entirely from the cache, including the missing identity
+    idmap = CachedIdentityMap(auth_client, [ID1, ID2, ID3])
+    assert idmap[ID2]["username"] == "two@example.org"
+    assert idmap["one@example.org"]["id"] == ID1
+    assert idmap.get(ID3) is None
+    assert auth_client.get_identities.call_count == 1
+
+
+def test_identity_map_only_fetches_uncached(auth_client, test_identity_cache):
+    test_identity_cache.store([_identity(ID1, "one@example.org")])
+
+    idmap = CachedIdentityMap(auth_client, [ID1, ID2])
+    assert idmap[ID2]["username"] == "two@example.org"
+    auth_client.get_identities.assert_called_once_with(ids={ID2})
+
+
+def test_identity_map_caches_missing_identities_in_batch(
+    auth_client, test_identity_cache
+):
+    idmap = CachedIdentityMap(auth_client, [ID1])
+    idmap.add(ID3)
+    assert idmap[ID1]["username"] == "one@example.org"
+    # ID3 was looked up in the same batch as ID1, and found to have no identity
+    assert idmap.get(ID3) is None
+    assert auth_client.get_identities.call_count == 1
+    assert test_identity_cache.get_many([ID3]) == {ID3: None}
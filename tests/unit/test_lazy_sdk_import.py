@@ -71,3 +71,23 @@ def test_importing_cli_doesnt_import_forbidden_modules(forbidden_module):
     assert status == 0, str(proc.communicate())
     proc.stdout.close()
     proc.stderr.close()
+
+
+@pytest.mark.parametrize("command", ["--help", "ls --help", "endpoint show --help"])
+def test_command_helptext_doesnt_import_requests(command):
+    to_run = "\n".join(
+        [
+            "import sys",
+            "from globus_cli import main",
+            f"sys.argv = ['globus'] + {command.split()!r}",
+            "try:",
+            "    main()",
+            "except SystemExit:",
+            "    pass",
+            "assert 'requests' not in sys.modules, 'requests was imported'",
+        ]
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", to_run], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    assert proc.returncode == 0, proc.stderr.decode()
@@ -1,11 +1,17 @@
 import re
+import threading
 import uuid
+from unittest import mock
 from unittest.mock import patch
 
 import globus_sdk
 import pytest
 
-from globus_cli.login_manager import LoginManager, MissingLoginError
+from globus_cli.login_manager import (
+    LoginManager,
+    MissingLoginError,
+    invalidate_token_validation_cache,
+)
 
 
 def mock_get_tokens(resource_server):
@@ -167,3 +173,143 @@ def test_client_login_gcs(mock_get_gcs_info, client_login, add_gcs_login):
         return True
 
     assert dummy_command(collection_id=gcs_id)
+
+
+@pytest.fixture
+def validating_auth_client():
+    # turn off test mode, to allow token validation
+    LoginManager._TEST_MODE = False
+    with patch("globus_cli.login_manager.manager.internal_auth_client") as m:
+        ac = mock.MagicMock(spec=globus_sdk.ConfidentialAppAuthClient)
+        ac.oauth2_validate_token.return_value = {"active": True}
+        m.return_value = ac
+        yield ac
+
+
+def test_token_validation_is_cached(validating_auth_client):
+    assert LoginManager().has_login(LoginManager.TRANSFER_RS)
+    assert validating_auth_client.oauth2_validate_token.call_count == 1
+
+    # a second check (e.g. from another command) does not validate again
+    assert LoginManager().has_login(LoginManager.TRANSFER_RS)
+    assert validating_auth_client.oauth2_validate_token.call_count == 1
+
+    # but each resource server is validated separately
+    assert LoginManager().has_login(LoginManager.AUTH_RS)
+    assert validating_auth_client.oauth2_validate_token.call_count == 2
+
+
+def test_token_validation_cache_expires(validating_auth_client, monkeypatch):
+    monkeypatch.setenv("GLOBUS_CLI_TOKEN_VALIDATION_TTL", "10")
+    with patch("time.time", return_value=1000.0):
+        assert LoginManager().has_login(LoginManager.TRANSFER_RS)
+    with patch("time.time", return_value=1009.0):
+        assert LoginManager().has_login(LoginManager.TRANSFER_RS)
+    assert validating_auth_client.oauth2_validate_token.call_count == 1
+    with patch("time.time", return_value=1010.0):
+        assert LoginManager().has_login(LoginManager.TRANSFER_RS)
+    assert validating_auth_client.oauth2_validate_token.call_count == 2
+
+
+def test_token_validation_cache_disabled(validating_auth_client, monkeypatch):
+    monkeypatch.setenv("GLOBUS_CLI_TOKEN_VALIDATION_TTL", "0")
+    assert LoginManager().has_login(LoginManager.TRANSFER_RS)
+    assert LoginManager().has_login(LoginManager.TRANSFER_RS)
+    assert validating_auth_client.oauth2_validate_token.call_count == 2
+
+
+def test_inactive_tokens_are_not_cached(validating_auth_client):
+    validating_auth_client.oauth2_validate_token.return_value = {"active": False}
+    assert not LoginManager().has_login(LoginManager.TRANSFER_RS)
+    assert not LoginManager().has_login(LoginManager.TRANSFER_RS)
+    assert validating_auth_client.oauth2_validate_token.call_count == 2
+
+
+def test_token_validation_cache_invalidation(
+    validating_auth_client, test_token_storage
+):
+    manager = LoginManager()
+    assert manager.has_login(LoginManager.TRANSFER_RS)
+    assert manager.has_login(LoginManager.AUTH_RS)
+
+    # refreshing tokens invalidates the cache for those resource servers only
+    refresh_response = mock.Mock()
+    refresh_response.by_resource_server = {
+        LoginManager.TRANSFER_RS: test_token_storage.get_token_data(
+            LoginManager.TRANSFER_RS
+        )
+    }
+    manager._on_refresh(refresh_response)
+    assert manager.has_login(LoginManager.TRANSFER_RS)
+    assert manager.has_login(LoginManager.AUTH_RS)
+    assert validating_auth_client.oauth2_validate_token.call_count == 3
+
+    # logout invalidates everything
+    invalidate_token_validation_cache()
+    assert manager.has_login(LoginManager.TRANSFER_RS)
+    assert manager.has_login(LoginManager.AUTH_RS)
+    assert validating_auth_client.oauth2_validate_token.call_count == 5
+
+
+def test_token_validation_cache_checks_token(
+    validating_auth_client, test_token_storage
+):
+    assert LoginManager().has_login(LoginManager.TRANSFER_RS)
+
+    # a new login for the same resource server is validated
+    tokens = test_token_storage.get_token_data(LoginManager.TRANSFER_RS)
+    new_response = mock.Mock()
+    new_response.by_resource_server = {
+        LoginManager.TRANSFER_RS: {**tokens, "refresh_token": "newRT"}
+    }
+    test_token_storage.store(new_response)
+    assert LoginManager().has_login(LoginManager.TRANSFER_RS)
+    validating_auth_client.oauth2_validate_token.assert_called_with("newRT")
+    assert validating_auth_client.oauth2_validate_token.call_count == 2
+
+
+def test_assert_logins_validates_concurrently(validating_auth_client):
+    # each validation waits for the other, so they must run at the same time
+    barrier = threading.Barrier(2, timeout=2)
+
+    def validate(token):
+        barrier.wait()
+        return {"active": True}
+
+    validating_auth_client.oauth2_validate_token.side_effect = validate
+    LoginManager().assert_logins(LoginManager.TRANSFER_RS, LoginManager.AUTH_RS)
+    assert validating_auth_client.oauth2_validate_token.call_count == 2
+
+
+def test_assert_logins_concurrent_missing_login(validating_auth_client):
+    transfer_rt = LoginManager()._get_refresh_token(LoginManager.TRANSFER_RS)
+    validating_auth_client.oauth2_validate_token.side_effect = lambda token: {
+        "active": token != transfer_rt
+    }
+
+    with pytest.raises(MissingLoginError) as excinfo:
+        LoginManager().assert_logins(
+            LoginManager.TRANSFER_RS, LoginManager.AUTH_RS, "c.globus.org"
+        )
+    assert excinfo.value.missing_servers == {LoginManager.TRANSFER_RS, "c.globus.org"}
+
+    # only the valid login was cached
+    validating_auth_client.oauth2_validate_token.reset_mock()
+    assert LoginManager().has_login(LoginManager.AUTH_RS)
+    validating_auth_client.oauth2_validate_token.assert_not_called()
+
+
+def test_clients_share_connection_pool():
+    from globus_cli.login_manager.connection_pool import POOL_MAXSIZE, shared_session
+
+    manager = LoginManager()
+    clients = [
+        manager.get_transfer_client(),
+        manager.get_groups_client(),
+        manager.get_search_client(),
+    ]
+    session = shared_session()
+    assert all(c.transport.session is session for c in clients)
+    assert session.get_adapter("https://transfer.api.globus.org")._pool_maxsize == (
+        POOL_MAXSIZE
+    )
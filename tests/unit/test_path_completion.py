@@ -0,0 +1,127 @@
+import os
+import subprocess
+import sys
+import uuid
+
+import pytest
+import responses
+from globus_sdk._testing import load_response_set
+
+from globus_cli import main
+from globus_cli.parsing.path_completion import (
+    complete_endpoint_plus_path,
+    path_completion_cache,
+)
+from globus_cli.parsing.shell_completion import GlobusBashComplete
+
+EP_ID = str(uuid.UUID(int=1))
+
+
+def _add_listing(path, *entries):
+    # the endpoint's default directory is listed without a path
+    params = {"path": path, "show_hidden": "1"} if path else {"show_hidden": "1"}
+    responses.add(
+        responses.GET,
+        f"https://transfer.api.globus.org/v0.10/operation/endpoint/{EP_ID}/ls",
+        match=[responses.matchers.query_param_matcher(params)],
+        json={
+            "DATA": [
+                {"DATA_TYPE": "file", "name": name, "type": type_}
+                for name, type_ in entries
+            ],
+            "DATA_TYPE": "file_list",
+            "path": path,
+        },
+    )
+
+
+def _values(incomplete):
+    return [x.value for x in complete_endpoint_plus_path(incomplete)]
+
+
+def test_complete_path_lists_directory_once():
+    _add_listing("/home/", ("docs", "dir"), ("data.txt", "file"), (".rc", "file"))
+
+    assert _values(f"{EP_ID}:/home/d") == [
+        f"{EP_ID}:/home/docs/",
+        f"{EP_ID}:/home/data.txt",
+    ]
+    # later completions in the same directory are served from the cache
+    assert _values(f"{EP_ID}:/home/do") == [f"{EP_ID}:/home/docs/"]
+    assert _values(f"{EP_ID}:/home/.") == [f"{EP_ID}:/home/.rc"]
+    assert len(responses.calls) == 1
+
+
+def test_complete_path_fails_quietly():
+    assert _values("not-an-endpoint:/") == []
+    # listing fails, since no response is registered
+    assert _values(f"{EP_ID}:/") == []
+
+
+def test_complete_endpoint_id_from_bookmarks_and_recent_use(run_line):
+    load_response_set("cli.transfer_activate_success")
+    meta = load_response_set("cli.ls_results").metadata
+    load_response_set("cli.bookmark_list")
+    run_line(f"globus ls {meta['endpoint_id']}:/")
+
+    values = _values("")
+    assert f"{meta['endpoint_id']}:" in values
+    assert "1405823f-0597-4a16-b296-46d4f0ae4b15:/home/" in values
+    assert _values("1405") == ["1405823f-0597-4a16-b296-46d4f0ae4b15:/home/"]
+
+
+def test_failed_command_does_not_record_endpoint(run_line):
+    # no responses are registered, so listing fails
+    run_line(f"globus ls {EP_ID}:/", assert_exit_code=1)
+    assert _values("") == []
+
+
+def test_recording_endpoint_use_does_not_fail_command(run_line, monkeypatch):
+    load_response_set("cli.transfer_activate_success")
+    meta = load_response_set("cli.ls_results").metadata
+
+    def _fail(endpoint_id):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(path_completion_cache(), "add_recent_endpoint", _fail)
+    run_line(f"globus ls {meta['endpoint_id']}:/")
+
+
+@pytest.mark.parametrize(
+    "words, cword, expect",
+    [
+        # "EP:/home/d" is split by bash into "EP", ":", "/home/d"
+        ([EP_ID, ":", "/home/d"], 4, ["/home/docs/", "/home/data.txt"]),
+        ([EP_ID, ":"], 3, [":home/"]),
+    ],
+)
+def test_bash_completion_rejoins_colon_words(monkeypatch, words, cword, expect):
+    _add_listing("/home/", ("docs", "dir"), ("data.txt", "file"))
+    _add_listing("", ("home", "dir"))
+    monkeypatch.setenv("COMP_WORDS", " ".join(["globus", "ls", *words]))
+    monkeypatch.setenv("COMP_CWORD", str(cword))
+
+    completion = GlobusBashComplete(main, {}, "globus", "_GLOBUS_COMPLETE")
+    assert completion.complete() == "\n".join(f"plain,{x}" for x in expect)
+
+
+def test_cached_completion_does_not_import_requests(tmp_path):
+    to_run = "\n".join(
+        [
+            "import sys",
+            "from globus_cli.parsing.path_completion import (",
+            "    complete_endpoint_plus_path, path_completion_cache)",
+            f"path_completion_cache().store_listing('{EP_ID}', '/', "
+            "[{'name': 'home', 'type': 'dir'}])",
+            f"items = complete_endpoint_plus_path('{EP_ID}:/h')",
+            f"assert [x.value for x in items] == ['{EP_ID}:/home/'], items",
+            "assert 'requests' not in sys.modules",
+        ]
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", to_run],
+        env={**os.environ, "HOME": str(tmp_path)},
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert proc.returncode == 0, proc.stderr.decode()
@@ -0,0 +1,204 @@
+import pytest
+import responses
+
+from globus_cli.services.transfer import CustomTransferClient, RecursiveLsCheckpoint
+from globus_cli.services.transfer.recursive_ls import (
+    INITIAL_RATE,
+    MAX_RATE,
+    MIN_RATE,
+    _AdaptiveRateLimiter,
+)
+
+EP_ID = "ddb59aef-6d04-11e5-ba46-22000b92c6ec"
+LS_URL = f"https://transfer.api.globus.org/v0.10/operation/endpoint/{EP_ID}/ls"
+
+
+def _add_listing(path, items, status=200, code=None):
+    if status != 200:
+        body = {"code": code or "Error", "message": "oops", "request_id": "x"}
+    else:
+        body = {
+            "DATA": [
+                {"DATA_TYPE": "file", "name": name, "type": type_}
+                for name, type_ in items
+            ],
+            "DATA_TYPE": "file_list",
+            "path": path + "/",
+        }
+    responses.add(
+        responses.GET,
+        LS_URL,
+        json=body,
+        status=status,
+        match=[
+            responses.matchers.query_param_matcher({"path": path, "show_hidden": "0"})
+        ],
+    )
+
+
+def test_limiter_increases_on_healthy_latency():
+    limiter = _AdaptiveRateLimiter()
+    assert limiter.rate == INITIAL_RATE
+    limiter.record_success(0.1)
+    assert limiter.rate > INITIAL_RATE
+
+    # slow calls do not speed things up
+    rate = limiter.rate
+    limiter.record_success(10.0)
+    assert limiter.rate == rate
+
+    for _ in range(1000):
+        limiter.record_success(0.1)
+    assert limiter.rate == MAX_RATE
+
+
+def test_limiter_backs_off_when_throttled():
+    limiter = _AdaptiveRateLimiter()
+    limiter.record_throttled()
+    assert limiter.rate == INITIAL_RATE / 2
+
+    for _ in range(100):
+        limiter.record_throttled()
+    assert limiter.rate == MIN_RATE
+
+
+def test_limiter_sleeps_once_burst_is_spent(mocksleep):
+    limiter = _AdaptiveRateLimiter()
+    limiter.record_throttled()
+    # the burst is dropped on throttling, so the next acquire must wait
+    limiter.acquire()
+    assert mocksleep.call_count == 1
+    assert mocksleep.call_args[0][0] > 0
+
+
+@pytest.mark.parametrize(
+    "status, code", [(429, None), (502, None), (409, "ExternalError")]
+)
+def test_recursive_ls_retries_throttled_listing(status, code):
+    _add_listing("/root", [("a", "dir"), ("f", "file")])
+    # the first listing of /root/a is throttled, the second is not
+    _add_listing("/root/a", [], status=status, code=code)
+    _add_listing("/root/a", [("g", "file")])
+
+    client = CustomTransferClient()
+    res = client.recursive_operation_ls(EP_ID, {"path": "/root", "show_hidden": 0})
+    assert [x["name"] for x in res] == ["a", "f", "a/g"]
+    assert res._limiter.rate < INITIAL_RATE
+
+
+def test_recursive_ls_does_not_retry_other_errors():
+    _add_listing("/root", [("a", "dir")])
+    _add_listing("/root/a", [], status=403, code="PermissionDenied")
+
+    client = CustomTransferClient()
+    res = client.recursive_operation_ls(EP_ID, {"path": "/root", "show_hidden": 0})
+    with pytest.raises(client.error_class) as excinfo:
+        list(res)
+    assert excinfo.value.http_status == 403
+
+
+def test_concurrent_recursive_ls_matches_serial_order():
+    _add_listing("/root", [("a", "dir"), ("b", "dir"), ("f", "file")])
+    _add_listing("/root/a", [("c", "dir"), ("x", "file")])
+    _add_listing("/root/b", [("y", "file")])
+    _add_listing("/root/a/c", [("z", "file")])
+
+    client = CustomTransferClient()
+    serial = client.recursive_operation_ls(EP_ID, {"path": "/root", "show_hidden": 0})
+    concurrent = client.recursive_operation_ls(
+        EP_ID, {"path": "/root", "show_hidden": 0}, max_workers=3
+    )
+    expect = ["a", "b", "f", "a/c", "a/x", "a/c/z", "b/y"]
+    assert [x["name"] for x in serial] == expect
+    assert [x["name"] for x in concurrent] == expect
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_recursive_ls_resumes_from_checkpoint(tmp_path, monkeypatch, max_workers):
+    monkeypatch.setattr(
+        "globus_cli.services.transfer.recursive_ls.CHECKPOINT_INTERVAL", 1
+    )
+    _add_listing("/root", [("a", "dir"), ("b", "dir"), ("f", "file")])
+    _add_listing("/root/a", [("c", "dir"), ("x", "file")])
+    _add_listing("/root/b", [("y", "file")])
+    _add_listing("/root/a/c", [("z", "file")])
+
+    filename = str(tmp_path / "checkpoint.json")
+    params = {"path": "/root", "show_hidden": 0}
+    client = CustomTransferClient()
+
+    # stop the listing partway through /root/a/c
+    res = client.recursive_operation_ls(
+        EP_ID,
+        params,
+        max_workers=max_workers,
+        checkpoint=RecursiveLsCheckpoint(filename, EP_ID, params, 3),
+    )
+    iterator = iter(res)
+    first_run = [next(iterator)["name"] for _ in range(6)]
+    assert first_run == ["a", "b", "f", "a/c", "a/x", "a/c/z"]
+    iterator.close()
+
+    # the listing stopped while /root/a/c was being yielded, so it is listed again
+    # on resume
+    checkpoint = RecursiveLsCheckpoint(filename, EP_ID, params, 3)
+    checkpoint.load()
+    assert checkpoint.listed == 2
+    res = client.recursive_operation_ls(
+        EP_ID, params, max_workers=max_workers, checkpoint=checkpoint
+    )
+    assert [x["name"] for x in res] == ["a/c/z", "b/y"]
+
+    # once complete, resuming lists nothing
+    checkpoint = RecursiveLsCheckpoint(filename, EP_ID, params, 3)
+    checkpoint.load()
+    assert checkpoint.queue == []
+    res = client.recursive_operation_ls(EP_ID, params, checkpoint=checkpoint)
+    assert list(res) == []
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_recursive_ls_saves_checkpoint_on_error(tmp_path, max_workers):
+    _add_listing("/root", [("a", "dir"), ("b", "dir"), ("f", "file")])
+    _add_listing("/root/a", [("c", "dir"), ("x", "file")])
+    _add_listing("/root/a/c", [], status=403, code="PermissionDenied")
+
+    filename = str(tmp_path / "checkpoint.json")
+    params = {"path": "/root", "show_hidden": 0}
+    client = CustomTransferClient()
+
+    # no periodic save is due, but progress is saved when the listing fails
+    res = client.recursive_operation_ls(
+        EP_ID,
+        params,
+        max_workers=max_workers,
+        checkpoint=RecursiveLsCheckpoint(filename, EP_ID, params, 3),
+    )
+    with pytest.raises(client.error_class):
+        list(res)
+
+    checkpoint = RecursiveLsCheckpoint(filename, EP_ID, params, 3)
+    checkpoint.load()
+    assert checkpoint.listed == 2
+    assert [rel_path for _, rel_path, _ in checkpoint.queue] == ["b", "a/c"]
+
+    # the next listing of /root/a/c succeeds
+    _add_listing("/root/a/c", [("z", "file")])
+    _add_listing("/root/b", [("y", "file")])
+    res = client.recursive_operation_ls(
+        EP_ID, params, max_workers=max_workers, checkpoint=checkpoint
+    )
+    assert [x["name"] for x in res] == ["a/c/z", "b/y"]
+
+
+def test_checkpoint_load_rejects_other_listings(tmp_path):
+    filename = str(tmp_path / "checkpoint.json")
+    params = {"path": "/root", "show_hidden": 0}
+    RecursiveLsCheckpoint(filename, EP_ID, params, 3).save([], 0)
+
+    with pytest.raises(ValueError, match="different listing"):
+        RecursiveLsCheckpoint(filename, EP_ID, params, 2).load()
+    with pytest.raises(ValueError, match="different listing"):
+        RecursiveLsCheckpoint(filename, EP_ID, {"path": "/other"}, 3).load()
+    with pytest.raises(ValueError, match="Could not read"):
+        RecursiveLsCheckpoint(str(tmp_path / "nope"), EP_ID, params, 3).load()
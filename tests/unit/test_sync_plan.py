@@ -0,0 +1,56 @@
+import threading
+
+from globus_cli.services.transfer import SyncPlan
+
+
+def _file(name):
+    return {
+        "name": name,
+        "type": "file",
+        "size": 1,
+        "last_modified": "2022-01-01 00:00:00+00:00",
+    }
+
+
+class _FakeClient:
+    def __init__(self, listings):
+        self.listings = listings
+
+    def recursive_operation_ls(self, endpoint_id, params, **kwargs):
+        return self.listings[endpoint_id]()
+
+
+def test_sync_plan_produces_missing_files_before_source_listing_finishes():
+    released = threading.Event()
+
+    def source_listing():
+        yield _file("a")
+        # the plan must produce "a" before the rest of the source is listed
+        assert released.wait(timeout=5)
+        yield _file("b")
+
+    client = _FakeClient({"src": source_listing, "dst": lambda: iter(())})
+    plan = SyncPlan(client, "src", "/src", "dst", "/dst")
+
+    pairs = []
+    for pair in plan:
+        pairs.append(pair)
+        released.set()
+    assert pairs == [("/src/a", "/dst/a"), ("/src/b", "/dst/b")]
+    assert (plan.compared, plan.changed) == (2, 2)
+
+
+def test_sync_plan_matches_files_listed_in_either_order():
+    def source_listing():
+        yield _file("a")
+        yield _file("b")
+
+    def dest_listing():
+        yield _file("b")
+        yield dict(_file("a"), size=2)
+
+    client = _FakeClient({"src": source_listing, "dst": dest_listing})
+    plan = SyncPlan(client, "src", "/src", "dst", "/dst")
+
+    assert list(plan) == [("/src/a", "/dst/a")]
+    assert (plan.compared, plan.changed) == (2, 1)
@@ -1,14 +1,27 @@
+import collections
 import os
 import re
 
 import click
 import pytest
 
+from globus_cli import main
+from globus_cli.parsing.command_index import build_command_index
+from globus_cli.termio import FORMAT_TEXT_RECORD_LIST, FormatField
+from globus_cli.termio import context as termio_context
 from globus_cli.termio import (
-    FORMAT_TEXT_RECORD_LIST,
     formatted_print,
+    help_content_width,
     term_is_interactive,
+    terminal_size_queries,
 )
+from globus_cli.termio.output_formatter import print_table
+
+
+@pytest.fixture
+def unsized_terminal(monkeypatch):
+    monkeypatch.delattr(help_content_width, "_instance", raising=False)
+    monkeypatch.setattr(termio_context, "_TERMINAL_SIZE_QUERIES", 0)
 
 
 @pytest.mark.parametrize(
@@ -38,6 +51,31 @@ def test_term_interactive(ps1, force_flag, expect, monkeypatch):
     assert term_is_interactive() == expect
 
 
+def test_env_interactive_rejects_bad_values(monkeypatch):
+    monkeypatch.setitem(os.environ, "GLOBUS_CLI_INTERACTIVE", "Whoops")
+    with pytest.raises(ValueError, match="invalid truth value"):
+        termio_context.env_interactive()
+
+
+def test_commands_do_not_query_terminal_size(unsized_terminal, run_line):
+    # load every command in the tree, and run some which don't show helptext
+    build_command_index(main)
+    run_line("globus list-commands")
+    run_line("globus whoami", assert_exit_code=1)
+    assert terminal_size_queries() == 0
+
+
+def test_helptext_queries_terminal_size_once(unsized_terminal, run_line, monkeypatch):
+    monkeypatch.setenv("COLUMNS", "200")
+    run_line("globus ls --help")
+    assert terminal_size_queries() == 1
+    # a wide terminal uses 80% of its width for helptext
+    assert help_content_width() == 160
+
+    run_line("globus endpoint show --help")
+    assert terminal_size_queries() == 1
+
+
 def test_format_record_list(capsys):
     data = [
         {"bird": "Killdeer", "wingspan": 46},
@@ -53,3 +91,41 @@ def test_format_record_list(capsys):
     # and one empty line between the records
     assert "" in output.splitlines()
     assert re.match(r"Bird:\s+Killdeer", output)
+
+
+def test_print_table_window_matches_full_read(capsys):
+    data = [{"bird": "Killdeer"}, {"bird": "Franklin's Gull"}, {"bird": "Ruff"}]
+    fields = [FormatField("Bird", "bird")]
+    print_table(data, fields)
+    full = capsys.readouterr().out
+    print_table(iter(data), fields, lookahead=3)
+    assert capsys.readouterr().out == full
+    assert full.splitlines()[2] == "Killdeer       "
+
+
+def test_print_table_streams_rows_after_lookahead(capsys):
+    printed_before_read = []
+
+    def gen():
+        printed = ""
+        for bird in ("Killdeer", "Franklin's Gull", "Ruff"):
+            printed += capsys.readouterr().out
+            printed_before_read.append(printed.splitlines())
+            yield {"bird": bird}
+
+    print_table(gen(), [FormatField("Bird", "bird")], print_headers=False, lookahead=1)
+    # each row is printed before the next one is read
+    assert printed_before_read == [[], ["Killdeer"], ["Killdeer", "Franklin's Gull"]]
+
+
+@pytest.mark.parametrize("lookahead", [1, 1000])
+def test_print_table_computes_each_cell_once(capsys, lookahead):
+    calls = collections.Counter()
+
+    def keyfunc(item):
+        calls[item["bird"]] += 1
+        return item["bird"]
+
+    data = [{"bird": "Killdeer"}, {"bird": "Ruff"}, {"bird": None}]
+    print_table(data, [FormatField("Bird", keyfunc)], lookahead=lookahead)
+    assert calls == {"Killdeer": 1, "Ruff": 1, None: 1}
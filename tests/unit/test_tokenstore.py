@@ -11,3 +11,26 @@ def test_profile_namespace(user_profile):
 
 def test_client_namespace(client_login):
     assert _resolve_namespace() == "clientprofile/production/fake_client_id"
+
+
+def test_internal_auth_client_is_memoized(test_token_storage):
+    from globus_cli.login_manager.connection_pool import shared_session
+    from globus_cli.login_manager.tokenstore import (
+        _CLIENT_DATA_CONFIG_KEY,
+        internal_auth_client,
+    )
+
+    test_token_storage.store_config(
+        _CLIENT_DATA_CONFIG_KEY, {"client_id": "id1", "client_secret": "secret1"}
+    )
+    client = internal_auth_client()
+    assert internal_auth_client() is client
+    assert client.transport.session is shared_session()
+
+    # changing the stored credentials builds a new client
+    test_token_storage.store_config(
+        _CLIENT_DATA_CONFIG_KEY, {"client_id": "id2", "client_secret": "secret2"}
+    )
+    new_client = internal_auth_client()
+    assert new_client is not client
+    assert new_client.client_id == "id2"
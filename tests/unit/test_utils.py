@@ -1,4 +1,30 @@
-from globus_cli.utils import format_list_of_words, format_plural_str
+import uuid
+from unittest import mock
+
+import pytest
+from globus_sdk.paging import Paginator
+
+from globus_cli.principal_resolver import PrincipalResolver
+from globus_cli.utils import (
+    PagingWrapper,
+    command_name,
+    format_list_of_words,
+    format_plural_str,
+)
+
+
+class _ListPaginator(Paginator):
+    def __init__(self, pages):
+        super().__init__(
+            mock.Mock(), items_key="data", client_args=[], client_kwargs={}
+        )
+        self._pages = pages
+        self.pages_fetched = 0
+
+    def pages(self):
+        for page in self._pages:
+            self.pages_fetched += 1
+            yield {"data": page}
 
 
 def test_format_word_list():
@@ -16,3 +42,78 @@ def test_format_plural_str():
     wordforms = {"this": "these", "command": "commands"}
     assert format_plural_str(fmt, wordforms, True) == "you need to run these commands"
     assert format_plural_str(fmt, wordforms, False) == "you need to run this command"
+
+
+def test_paging_wrapper_page_callbacks():
+    paginator = _ListPaginator([[1, 2], [3], [4, 5]])
+    seen_pages = []
+
+    def callback(page):
+        # each page is seen before any of its items are yielded
+        assert len(seen_pages) == paginator.pages_fetched - 1
+        seen_pages.append(list(page))
+
+    wrapper = PagingWrapper(paginator, limit=2, page_callbacks=[callback])
+    assert list(wrapper) == [1, 2]
+    # the wrapper looks ahead by one item, but no further
+    assert seen_pages == [[1, 2], [3]]
+
+
+def test_paging_wrapper_page_callbacks_require_paginator():
+    with pytest.raises(ValueError):
+        PagingWrapper(iter([1, 2]), page_callbacks=[print])
+
+
+def test_principal_resolver_resolves_each_page_in_bulk():
+    urn = "urn:globus:auth:identity:{}".format
+    pages = [
+        [{"owner": urn("id1")}, {"owner": urn("id2")}, {"owner": "bad"}],
+        [{"owner": urn("id3")}],
+    ]
+    resolver = PrincipalResolver("owner")
+    idmap = resolver._state().idmap = mock.Mock()
+    idmap.get.side_effect = lambda value, default: {"username": f"{value}@example.org"}
+
+    paginator = _ListPaginator(pages)
+    wrapper = PagingWrapper(paginator, page_callbacks=[resolver.page_callback])
+    assert [resolver.field(x) for x in wrapper] == [
+        "id1@example.org",
+        "id2@example.org",
+        "bad",
+        "id3@example.org",
+    ]
+    assert idmap.add.call_args_list == [
+        mock.call("id1"),
+        mock.call("id2"),
+        mock.call("id3"),
+    ]
+
+
+def test_principal_resolver_page_callback_is_lazy():
+    id1, id2 = str(uuid.UUID(int=1)), str(uuid.UUID(int=2))
+    resolver = PrincipalResolver("identity_id", use_urns=False)
+    resolver.page_callback([{"identity_id": id1}, {"identity_id": id2}])
+    # no idmap (or auth client) is needed until a field is rendered
+    assert resolver._state().idmap is None
+
+    with mock.patch("globus_cli.principal_resolver.LoginManager"):
+        assert resolver.idmap.unresolved_ids == {id1, id2}
+
+
+@pytest.mark.parametrize(
+    "argv, expect",
+    [
+        (["daemon", "start"], "daemon"),
+        (["-v", "daemon"], "daemon"),
+        (["-vv", "--debug", "daemon"], "daemon"),
+        (["-F", "json", "daemon"], "daemon"),
+        (["-vF", "json", "daemon"], "daemon"),
+        (["--format=json", "daemon"], "daemon"),
+        (["--jmespath", "daemon", "ls"], "ls"),
+        (["--", "daemon"], "daemon"),
+        (["-v"], None),
+    ],
+)
+def test_command_name_skips_leading_options(argv, expect):
+    options_with_values = ("-F", "--format", "--jmespath")
+    assert command_name(argv, options_with_values) == expect